@@ -10,7 +10,7 @@ module.exports = {
     },
     networks: {
         hh: {
-            url: "http://127.0.0.1:8544",
+            url: process.env.HH_RPC_URL || "http://127.0.0.1:8544",
             chainId: 31337
         },
         sepolia: {
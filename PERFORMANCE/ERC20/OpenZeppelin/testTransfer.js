@@ -1,6 +1,8 @@
 require('dotenv').config();
 const hre = require("hardhat");
 const fs = require("fs");
+const { newRunId, appendResults, formatRow } = require("../../resultsWriter");
+const { sendWithPhases } = require("../../txPhases");
 const ethers = hre.ethers;
 
 async function main() {
@@ -42,25 +44,20 @@ async function main() {
     const token = await Token.attach(tokenAddress);
 
     let csvData = "";
-
-    if (!fs.existsSync(resultsFile)) {
-        csvData = "Operation, Gas, Fee (weis), Latency (ms), Blockchain\n"
-    }
+    const runId = newRunId();
 
     
 
     for (let i = 0; i < testingInterations; i++) {
-        const start = process.hrtime();
-        const tx = await token.connect(sender).transfer(
-            receiver.address,
-            amount
+        const timestamp = new Date().toISOString();
+        const { receipt, latency, phases } = await sendWithPhases(
+            sender,
+            () => token.connect(sender).transfer.populateTransaction(
+                receiver.address,
+                amount
+            )
         );
 
-        const receipt = await tx.wait();
-        const end = process.hrtime(start);
-
-        const latency = end[0] * 1000 + end[1] / 1e6;
-
 
 
         console.log("Iteration:", i);
@@ -70,12 +67,12 @@ async function main() {
         console.log("");
 
 
-        csvData += `Transfer, ${receipt.gasUsed.toString()}, ${receipt.fee.toString()}, ${latency}, ${network.name}\n`;
+        csvData += formatRow({ operation: "Transfer", receipt, latency, network: network.name, runId, timestamp, iteration: i, phases });
         //console.log(csvData);
     }
 
     // Save addresses, gas, and latency to file
-    fs.appendFileSync(resultsFile, csvData);
+    appendResults(resultsFile, csvData);
     console.log("✅ Transactions executed and results saved.");
 }
 
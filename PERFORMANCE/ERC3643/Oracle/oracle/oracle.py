@@ -1,71 +1,192 @@
 import os
+import sys
 import time
 import json
-from web3 import Web3
-from eth_account import Account
-from eth_account.messages import encode_defunct
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+script_dir = os.path.dirname(os.path.abspath(__file__))
+# Loaded before any setting below is read, so values in .env apply to them too (web3 is the slow import, not dotenv)
+load_dotenv(os.path.join(script_dir, "..", ".env"))
+network = os.getenv("ORACLE_NETWORK", "sepolia") # Change this depending on the specific network
+# RPC endpoint of each network, ORACLE_RPC_URL overrides it (e.g. a local node on another port)
+rpc_urls = {
+    "hardhat": "http://127.0.0.1:8544",
+    "sepolia": "https://ethereum-sepolia-rpc.publicnode.com",
+    "holesky": "https://ethereum-holesky.publicnode.com"
+}
+rpc_url = os.getenv("ORACLE_RPC_URL") or rpc_urls[network]
+
+deployment_addresses_json_path = os.path.join(script_dir, "..", "deployment-addresses.json")
+suspects_json_path = os.path.join(script_dir, "suspects.json")
+module_abi_path = os.path.join(script_dir, "ModuleABI.json")
+# Module address, the ABI entries the oracle uses, the call selector and the suspects of one network,
+# rebuilt only when one of the files above changes
+bundle_path = os.path.join(script_dir, f"oracle_bundle.{network}.json")
+# Every block sent is logged here by transfer hash, so the benchmark can time enforcement end to end
+actions_path = os.getenv("ORACLE_ACTIONS_FILE", os.path.join(script_dir, "oracle_actions.jsonl"))
+poll_interval = float(os.getenv("ORACLE_POLL_INTERVAL", "5"))
+# Touched once the event filter exists, so a benchmark knows when its transfers will be seen
+ready_path = os.getenv("ORACLE_READY_FILE")
+
+# Set by start_oracle()
+Web3 = w3 = oracle_account = compliance_contract = event_filter = None
+suspects = set()
+block_selector = block_template = signer_pool = None
+# Sends of one batch, each with a freshly read nonce, before its remaining blocks are given up
+send_attempts = 3
+
 # Helper to get NonSanctionedModule address from nested JSON
 def get_non_module_address(json_data):
-    network = "sepolia" # Change this depending on the specific network
-
     try:
         return json_data[network]["deployment"]["contracts"]["moduleNonSanctioned"]["address"]
     except (KeyError, TypeError):
         raise ValueError("NonSanctionedModule address not found in deployment JSON")
 
-
-
-
-# Load environment
-load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".env"))
-private_key = os.getenv("ORACLE_PRIVATE_KEY")
-#rpc_url = "http://127.0.0.1:8544"
-rpc_url= "https://ethereum-sepolia-rpc.publicnode.com"
-#rpc_url = "https://ethereum-holesky.publicnode.com"
-
-# Print oracle address and wait for user confirmation
-#oracle_account = Account.from_key(private_key)
-#print(f"Oracle address: {oracle_account.address}")
-#print()
-#input("Save the address into the contract and press Enter to continue...")
-
-# Read deployment addresses from JSON file
-script_dir = os.path.dirname(os.path.abspath(__file__))
-deployment_addresses_json_path = os.path.join(script_dir, "..", "deployment-addresses.json")
-suspects_json_path = os.path.join(script_dir, "suspects.json")
-
-
-with open(deployment_addresses_json_path) as f:
-    deployment_data = json.load(f)
-
-deployment_address = get_non_module_address(deployment_data)
-
-with open(suspects_json_path) as f:
-    suspects = set(json.load(f))
-
-module_address = Web3.to_checksum_address(deployment_address)
-print(f"Loaded ComplianceModule address: {module_address}")
-
-# Connect to Ethereum
-w3 = Web3(Web3.HTTPProvider(rpc_url))
-oracle_account = Account.from_key(private_key)
-
-# Load ABI for compliance module
-with open("ModuleABI.json") as f:
-    module_abi = json.load(f)
-
-compliance_contract = w3.eth.contract(address=module_address, abi=module_abi)
-
-# Set up event listener
-event_filter = compliance_contract.events.OracleCheck.create_filter(from_block="latest")
+def source_stamps():
+    # Modification time and size of every file the bundle is built from
+    return {path: [os.stat(path).st_mtime_ns, os.stat(path).st_size]
+            for path in (deployment_addresses_json_path, suspects_json_path, module_abi_path)}
+
+def build_bundle():
+    from web3 import Web3
+
+    with open(deployment_addresses_json_path) as f:
+        deployment_data = json.load(f)
+    with open(suspects_json_path) as f:
+        suspect_list = json.load(f)
+    with open(module_abi_path) as f:
+        module_abi = json.load(f)
+
+    bundle = {
+        "network": network,
+        "sources": source_stamps(),
+        "moduleAddress": Web3.to_checksum_address(get_non_module_address(deployment_data)),
+        "abi": [entry for entry in module_abi if entry.get("name") in ("OracleCheck", "blockTransferPair")],
+        "blockSelector": Web3.to_hex(Web3.keccak(text="blockTransferPair(address,address)")[:4]),
+        "suspects": sorted(Web3.to_checksum_address(address) for address in suspect_list)
+    }
+    with open(bundle_path, "w") as f:
+        json.dump(bundle, f)
+    return bundle
+
+def load_bundle():
+    # The whole deployment file and ABI are only parsed when the bundle is missing or stale
+    if os.path.exists(bundle_path):
+        with open(bundle_path) as f:
+            bundle = json.load(f)
+        if bundle.get("network") == network and bundle.get("sources") == source_stamps():
+            return bundle, True
+    return build_bundle(), False
+
+def start_oracle():
+    global Web3, w3, oracle_account, compliance_contract, event_filter, suspects
+    global block_selector, block_template, signer_pool
+
+    timings = []
+    step_start = time.perf_counter()
+
+    def step(name):
+        nonlocal step_start
+        now = time.perf_counter()
+        timings.append((name, now - step_start))
+        step_start = now
+
+    from web3 import Web3
+    from eth_account import Account
+    step("imports")
+
+    # Same oracle account as deploy.js and the test scripts, which use a separate key on hardhat
+    private_key = os.getenv("ORACLE_HH_PRIVATE_KEY" if network == "hardhat" else "ORACLE_PRIVATE_KEY")
+    bundle, cached = load_bundle()
+    suspects = set(bundle["suspects"])
+    block_selector = bytes.fromhex(bundle["blockSelector"][2:])
+    module_address = bundle["moduleAddress"]
+    print(f"Loaded ComplianceModule address: {module_address}")
+    step("config (bundle)" if cached else "config (bundle rebuilt)")
+
+    # Connect to Ethereum
+    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    oracle_account = Account.from_key(private_key)
+    compliance_contract = w3.eth.contract(address=module_address, abi=bundle["abi"])
+
+    # Set up event listener
+    event_filter = compliance_contract.events.OracleCheck.create_filter(from_block="latest")
+    step("event filter")
+
+    # Everything but the nonce is the same for every block, so it is fetched and encoded once here
+    block_template = {
+        'to': module_address,
+        'value': 0,
+        'gas': 200000,
+        'gasPrice': w3.to_wei('10', 'gwei'),
+        'chainId': w3.eth.chain_id
+    }
+    signer_pool = ThreadPoolExecutor(max_workers=int(os.getenv("ORACLE_SIGNERS", "2")))
+    step("send template")
+
+    print("Startup: " + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings) +
+          f", total {sum(seconds for _, seconds in timings) * 1000:.1f} ms")
+    if ready_path:
+        with open(ready_path, "w") as f:
+            f.write(str(os.getpid()))
+
+def encode_block_call(from_addr, to_addr):
+    # ABI encoding of two addresses: each left-padded to a 32-byte word
+    return block_selector + bytes(12) + Web3.to_bytes(hexstr=from_addr) + bytes(12) + Web3.to_bytes(hexstr=to_addr)
+
+def sign_block(from_addr, to_addr, nonce):
+    tx = dict(block_template, nonce=nonce, data=encode_block_call(from_addr, to_addr))
+    return oracle_account.sign_transaction(tx)
+
+def pending_nonce():
+    # The test scripts unblock pairs from the oracle account too, so the nonce cannot be tracked locally
+    return w3.eth.get_transaction_count(oracle_account.address, "pending")
+
+def send_blocks(events, observed_at, nonce):
+    # Blocks are sent in nonce order while the later ones are still being signed
+    for _ in range(send_attempts):
+        signing = [signer_pool.submit(sign_block, event.args["from"], event.args["to"], nonce + index)
+                   for index, event in enumerate(events)]
+        sent = 0
+        for event, signed in zip(events, signing):
+            try:
+                tx_hash = w3.eth.send_raw_transaction(signed.result().raw_transaction)
+            except Exception as e:
+                print("[ERROR]", e)
+                break
+            print(f"[✓] Blocked on-chain: tx {tx_hash.hex()}")
+            log_action(event, observed_at, tx_hash)
+            sent += 1
+        events = events[sent:]
+        if not events:
+            return
+        # Another transaction took the nonce, the failed block and the rest are signed again
+        nonce = pending_nonce()
+    print(f"[ERROR] Giving up on {len(events)} blocks after {send_attempts} attempts")
+
+def log_action(event, observed_at, tx_hash):
+    record = {
+        "transferTx": w3.to_hex(event.transactionHash),
+        "from": event.args["from"],
+        "to": event.args["to"],
+        "observedAt": observed_at,
+        "blockTx": w3.to_hex(tx_hash),
+        "sentAt": int(time.time() * 1000)
+    }
+    with open(actions_path, "a") as f:
+        f.write(json.dumps(record) + "\n")
 
 def listen_for_approvals():
     print(f"Listening as oracle: {oracle_account.address}")
     while True:
         try:
+            # Read before the events, so no RPC call is made between observing a transfer and sending its block
+            nonce = pending_nonce()
             events = event_filter.get_new_entries()
+            observed_at = int(time.time() * 1000)
+            blocks = []
             for event in events:
                 from_addr = event.args["from"]
                 to_addr = event.args["to"]
@@ -75,19 +196,25 @@ def listen_for_approvals():
                 # If either address is in the blacklist, block this pair
                 if from_addr in suspects and to_addr in suspects:
                     print("[🚫] Blocking pair due to blacklist match")
-                    key = compliance_contract.functions.blockTransferPair(from_addr, to_addr).build_transaction({
-                        'from': oracle_account.address,
-                        'nonce': w3.eth.get_transaction_count(oracle_account.address),
-                        'gas': 200000,
-                        'gasPrice': w3.to_wei('10', 'gwei')
-                    })
-                    signed = oracle_account.sign_transaction(key)
-                    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-                    print(f"[✓] Blocked on-chain: tx {tx_hash.hex()}")
+                    blocks.append(event)
+
+            if blocks:
+                send_blocks(blocks, observed_at, nonce)
         except Exception as e:
             print("[ERROR]", e)
 
-        time.sleep(5)
+        time.sleep(poll_interval)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Block transfers between suspects of the NonSanctionModule.")
+    parser.add_argument("--build-bundle", action="store_true",
+                        help=f"only (re)build the config bundle of {network} and exit")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
+    if parse_args().build_bundle:
+        build_bundle()
+        print(f"Config bundle saved to: {bundle_path}")
+        sys.exit(0)
+    start_oracle()
     listen_for_approvals()
@@ -0,0 +1,163 @@
+require('dotenv').config();
+const hre = require("hardhat");
+const fs = require("fs");
+const { newRunId, appendResults, formatRow } = require("../../resultsWriter");
+const { sendWithPhases } = require("../../txPhases");
+const ethers = hre.ethers;
+
+// oracle.py logs every block it sends here, keyed by the hash of the transfer that triggered it
+const actionsFile = process.env.ORACLE_ACTIONS_FILE || "oracle/oracle_actions.jsonl";
+const oracleTimeout = parseInt(process.env.ORACLE_TIMEOUT_MS || "120000", 10);
+
+function sleep(ms) {
+    return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+async function waitForOracleAction(transferHash, pollInterval = 50) {
+    const deadline = Date.now() + oracleTimeout;
+    while (Date.now() < deadline) {
+        if (fs.existsSync(actionsFile)) {
+            for (const line of fs.readFileSync(actionsFile, "utf8").split("\n")) {
+                if (line.trim() === "") {
+                    continue;
+                }
+                const action = JSON.parse(line);
+                if (action.transferTx.toLowerCase() === transferHash.toLowerCase()) {
+                    return action;
+                }
+            }
+        }
+        await sleep(pollInterval);
+    }
+    return null;
+}
+
+async function waitForReceipt(provider, hash, pollInterval = 50) {
+    // Polled directly, the provider's default polling interval would round the latency up to seconds
+    let receipt = await provider.getTransactionReceipt(hash);
+    while (!receipt) {
+        await sleep(pollInterval);
+        receipt = await provider.getTransactionReceipt(hash);
+    }
+    return receipt;
+}
+
+async function main() {
+
+    const path = process.env.CONTRACT_PATH;
+
+    const signers = await ethers.getSigners();
+
+    const amount = 1n;
+
+    const resultsFile = "results.csv";
+
+    const testingInterations = 20;
+
+    // Blockchain data
+    const network = await ethers.provider.getNetwork();
+
+    let oracle;
+
+    if (network.name === "hh") {
+        network.name = "hardhat";
+
+        oracle=  new ethers.Wallet(
+            process.env.ORACLE_HH_PRIVATE_KEY,
+            ethers.provider
+        );
+    } else {
+        oracle = new ethers.Wallet(
+            process.env.ORACLE_PRIVATE_KEY,
+            ethers.provider
+        );
+    }
+
+    console.log("Network name:", network.name);
+    console.log("Chain ID:", network.chainId);
+
+    const rpcUrl = hre.config.networks[hre.network.name]?.url;
+    console.log("RPC URL:", rpcUrl);
+
+    // The oracle only acts on transfers between two suspects, so both sides must be accounts we control
+    const suspects = JSON.parse(fs.readFileSync("oracle/suspects.json", "utf8")).map((address) => address.toLowerCase());
+    const suspectSigners = signers.filter((signer) => suspects.includes(signer.address.toLowerCase()));
+    if (suspectSigners.length < 2) {
+        console.error("At least two accounts of oracle/suspects.json must be available as signers on this network.");
+        process.exit(1);
+    }
+    const [sender, receiver] = suspectSigners;
+
+
+    // Read the contract addresses from the JSON file
+    const contract_addresses = JSON.parse(fs.readFileSync("deployment-addresses.json", "utf8"));
+    const contracts = contract_addresses[network.name]["deployment"]["contracts"];
+
+    // Get the contract factories and attach to the deployed addresses
+    const Token = await ethers.getContractFactory(`${path}/token/Token.sol:Token`);
+    const token = await Token.attach(contracts["token"].address);
+    const IdentityRegistry = await ethers.getContractFactory(`${path}/registry/implementation/IdentityRegistry.sol:IdentityRegistry`);
+    const identityRegistry = await IdentityRegistry.attach(contracts["identityRegistry"].address);
+    const ModuleNonSanctioned = await ethers.getContractFactory(`${path}/compliance/modular/modules/NonSanctionModule.sol:NonSanctionModule`);
+    const moduleNonSanctioned = await ModuleNonSanctioned.attach(contracts["moduleNonSanctioned"].address);
+    const Identity = await ethers.getContractFactory(`${path}/Identity.sol:Identity`);
+
+    // Not measured: the suspects need verified identities and tokens to transfer
+    for (const suspect of [sender, receiver]) {
+        if (!(await identityRegistry.contains(suspect.address))) {
+            const identity = await Identity.deploy(suspect.address, false);
+            await identity.deploymentTransaction().wait();
+            await (await identityRegistry.connect(signers[0]).registerIdentity(suspect.address, identity.target, 0)).wait();
+        }
+    }
+    if ((await token.balanceOf(sender.address)) < amount * BigInt(testingInterations)) {
+        await (await token.connect(signers[0]).mint(sender.address, amount * BigInt(testingInterations))).wait();
+    }
+    // A pair left blocked by an interrupted run would make every transfer revert
+    await (await moduleNonSanctioned.connect(oracle).unblockTransferPair(sender.address, receiver.address)).wait();
+
+    let csvData = "";
+    const runId = newRunId();
+
+
+    for (let i = 0; i < testingInterations; i++) {
+        const timestamp = new Date().toISOString();
+        const wallStart = Date.now();
+        const { receipt, latency } = await sendWithPhases(
+            sender,
+            () => token.connect(sender).transfer.populateTransaction(
+                receiver.address,
+                amount
+            )
+        );
+
+        // End to end: from sending the transfer until the oracle's block is mined
+        const action = await waitForOracleAction(receipt.hash);
+        if (!action) {
+            console.error(`No block from the oracle within ${oracleTimeout} ms, is oracle/oracle.py running on this network?`);
+            break;
+        }
+        const blockReceipt = await waitForReceipt(ethers.provider, action.blockTx);
+        const enforcementLatency = Date.now() - wallStart;
+
+        console.log("Iteration:", i);
+        console.log("Transfer latency (ms):", latency);
+        console.log("Oracle observed after (ms):", action.observedAt - wallStart);
+        console.log("Oracle sent block after (ms):", action.sentAt - wallStart);
+        console.log("Gas used by the oracle:", blockReceipt.gasUsed.toString());
+        console.log("Oracle transaction fee (wei):", blockReceipt.fee.toString());
+        console.log("Enforcement latency (ms):", enforcementLatency);
+        console.log("");
+
+        csvData += formatRow({ operation: "OracleBlock", receipt: blockReceipt, latency: enforcementLatency, network: network.name, runId, timestamp, iteration: i });
+
+        // Let the next transfer through again
+        await (await moduleNonSanctioned.connect(oracle).unblockTransferPair(sender.address, receiver.address)).wait();
+    }
+
+    // Save addresses, gas, and latency to file
+    appendResults(resultsFile, csvData);
+    console.log("✅ Transactions executed and results saved.");
+}
+
+main();
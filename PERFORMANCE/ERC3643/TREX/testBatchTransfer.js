@@ -1,6 +1,8 @@
 require('dotenv').config();
 const hre = require("hardhat");
 const fs = require("fs");
+const { newRunId, appendResults, formatRow } = require("../../resultsWriter");
+const { sendWithPhases } = require("../../txPhases");
 const ethers = hre.ethers;
 
 async function main() {
@@ -40,47 +42,50 @@ async function main() {
     const token = await Token.attach(tokenAddress);
 
     let csvData = "";
+    const runId = newRunId();
 
-    if (!fs.existsSync(resultsFile)) {
-        csvData = "Operation, Gas, Fee (weis), Latency (ms), Blockchain\n"
-    }
-
-
-    const receiverList = [];
-    const amountList = [];
 
-    // 50 transfers per function call
-    for (let i = 0; i < 50; i++) {
-        receiverList[i] = receiver.address;
-        amountList[i] = amount;
+    // Recipients per batchTransfer call, BATCH_SIZES=1,5,10,25,50,100,200 sweeps several sizes
+    const batchSizes = (process.env.BATCH_SIZES || "50").split(",").map((size) => Number(size.trim()));
+    if (batchSizes.some((size) => !Number.isInteger(size) || size < 1)) {
+        throw new Error(`BATCH_SIZES must be a comma-separated list of positive integers, got "${process.env.BATCH_SIZES}"`);
     }
-
-
-    for (let i = 0; i < testingInterations; i++) {
-        const start = process.hrtime();
-        const tx = await token.connect(sender).batchTransfer(
-            receiverList,
-            amountList
-        );
-
-        const receipt = await tx.wait();
-        const end = process.hrtime(start);
-
-        const latency = end[0] * 1000 + end[1] / 1e6;
-
-        console.log("Iteration:", i);
-        console.log("Gas used:", receipt.gasUsed.toString());
-        console.log("Transaction fee (wei):", receipt.fee.toString());
-        console.log("Deployment latency (ms):", latency);
-        console.log("");
-
-
-        csvData += `batchTransfer, ${receipt.gasUsed.toString()}, ${receipt.fee.toString()}, ${latency}, ${network.name}\n`;
-        //console.log(csvData);
+    let iteration = 0;
+
+    for (const batchSize of batchSizes) {
+        const receiverList = [];
+        const amountList = [];
+
+        for (let i = 0; i < batchSize; i++) {
+            receiverList[i] = receiver.address;
+            amountList[i] = amount;
+        }
+
+        for (let i = 0; i < testingInterations; i++) {
+            const timestamp = new Date().toISOString();
+            const { receipt, latency, phases } = await sendWithPhases(
+                sender,
+                () => token.connect(sender).batchTransfer.populateTransaction(
+                    receiverList,
+                    amountList
+                )
+            );
+
+            console.log("Batch size:", batchSize, "Iteration:", i);
+            console.log("Gas used:", receipt.gasUsed.toString());
+            console.log("Transaction fee (wei):", receipt.fee.toString());
+            console.log("Deployment latency (ms):", latency);
+            console.log("");
+
+
+            csvData += formatRow({ operation: "batchTransfer", receipt, latency, network: network.name, runId, timestamp, iteration, batchSize, phases });
+            iteration++;
+            //console.log(csvData);
+        }
     }
 
     // Save addresses, gas, and latency to file
-    fs.appendFileSync(resultsFile, csvData);
+    appendResults(resultsFile, csvData);
     console.log("✅ Transactions executed and results saved.");
 }
 
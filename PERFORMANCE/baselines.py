@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+import json
+import math
+import os
+import subprocess
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from batch_costs import grouping_keys
+
+GROUP_COLUMNS = ['Operation', 'Blockchain', 'Category', 'Subcategory', 'DataType']
+METRICS = ['Gas', 'Fee (weis)', 'Latency (ms)']
+
+# Gas is deterministic, fees follow the gas price and latency is network noise
+DEFAULT_TOLERANCES = {
+    'Gas': 0.01,
+    'Fee (weis)': 0.10,
+    'Latency (ms)': 0.25
+}
+
+def current_commit():
+    """Short hash of the checked-out git commit, or None outside a repository."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        return result.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def save_baseline(stats_df, label=None, baselines_dir='baselines'):
+    """Snapshot the statistics of this run under a label (the git commit by default)."""
+    os.makedirs(baselines_dir, exist_ok=True)
+    commit = current_commit()
+    created = datetime.now(timezone.utc)
+    label = label or commit or created.strftime('%Y%m%dT%H%M%SZ')
+    stats_df.to_csv(os.path.join(baselines_dir, f'{label}.csv'), index=False)
+    metadata = {'label': label, 'commit': commit, 'created': created.isoformat(), 'groups': len(stats_df)}
+    with open(os.path.join(baselines_dir, f'{label}.json'), 'w') as f:
+        json.dump(metadata, f, indent=2)
+    return label
+
+def load_baseline(label, baselines_dir='baselines'):
+    """Load a stored baseline by label, 'latest' picks the most recently created one."""
+    if label == 'latest':
+        snapshots = []
+        for file_name in os.listdir(baselines_dir) if os.path.isdir(baselines_dir) else []:
+            if file_name.endswith('.json'):
+                with open(os.path.join(baselines_dir, file_name)) as f:
+                    snapshots.append(json.load(f))
+        if not snapshots:
+            raise FileNotFoundError(f"No baselines stored in {baselines_dir}")
+        label = max(snapshots, key=lambda s: s['created'])['label']
+    return label, pd.read_csv(os.path.join(baselines_dir, f'{label}.csv'))
+
+def welch_p_value(mean_a, std_a, count_a, mean_b, std_b, count_b):
+    """Two-sided p-value of Welch's test from summary statistics (normal approximation)."""
+    if count_a < 2 or count_b < 2 or pd.isna(std_a) or pd.isna(std_b):
+        return np.nan
+    standard_error = math.sqrt(std_a ** 2 / count_a + std_b ** 2 / count_b)
+    if standard_error == 0:
+        return 1.0 if mean_a == mean_b else 0.0
+    return math.erfc(abs(mean_a - mean_b) / standard_error / math.sqrt(2))
+
+def compare_to_baseline(stats_df, baseline_df, tolerances=None, p_threshold=0.05):
+    """Compare every operation, implementation and network of this run with a baseline."""
+    tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+    # Baselines stored before the batch size was a group column are matched on the other columns
+    keys = grouping_keys(GROUP_COLUMNS, baseline_df) if 'Batch Size' in stats_df.columns else GROUP_COLUMNS
+    merged = stats_df.merge(baseline_df, on=keys, how='outer', suffixes=('', '_baseline'), indicator=True)
+    rows = []
+    for _, row in merged.iterrows():
+        for metric in METRICS:
+            current, baseline = row.get(f'{metric}_avg'), row.get(f'{metric}_avg_baseline')
+            result = {column: row[column] for column in grouping_keys(GROUP_COLUMNS, merged)}
+            result.update({'Metric': metric, 'Baseline': baseline, 'Current': current})
+            if row['_merge'] == 'left_only':
+                result.update({'Change': np.nan, 'p-value': np.nan, 'Status': 'new'})
+            elif row['_merge'] == 'right_only':
+                result.update({'Change': np.nan, 'p-value': np.nan, 'Status': 'missing'})
+            else:
+                change = (current - baseline) / abs(baseline) if baseline else (0.0 if current == baseline else np.inf)
+                p_value = welch_p_value(current, row.get(f'{metric}_std'), row.get('Count'),
+                                        baseline, row.get(f'{metric}_std_baseline'), row.get('Count_baseline'))
+                # Single-sample groups (deployments) cannot be tested and are judged on tolerance alone
+                significant = pd.isna(p_value) or p_value < p_threshold
+                if change > tolerances[metric] and significant:
+                    status = 'regression'
+                elif change < -tolerances[metric] and significant:
+                    status = 'improvement'
+                else:
+                    status = 'unchanged'
+                result.update({'Change': change, 'p-value': p_value, 'Status': status})
+            result['Tolerance'] = tolerances[metric]
+            rows.append(result)
+    return pd.DataFrame(rows)
+
+def write_regression_report(comparison, label, output_dir='csv_output'):
+    """Write the machine-readable pass/fail report and return whether the run passed."""
+    os.makedirs(output_dir, exist_ok=True)
+    comparison.to_csv(os.path.join(output_dir, 'regression_report.csv'), index=False)
+    counts = comparison['Status'].value_counts().to_dict()
+    passed = counts.get('regression', 0) == 0
+    regressions = comparison[comparison['Status'] == 'regression']
+    report = {
+        'baseline': label,
+        'commit': current_commit(),
+        'passed': passed,
+        'counts': {status: int(count) for status, count in counts.items()},
+        'regressions': json.loads(regressions.to_json(orient='records'))
+    }
+    with open(os.path.join(output_dir, 'regression_report.json'), 'w') as f:
+        json.dump(report, f, indent=2)
+    return passed
+
+def plot_regression_diff(comparison, label, output_path):
+    """Horizontal bar chart of the relative change of every metric against the baseline."""
+    compared = comparison[comparison['Status'].isin(['regression', 'improvement', 'unchanged'])].copy()
+    if compared.empty:
+        return
+    compared['Group'] = (compared['Category'] + '/' + compared['Subcategory'] + ' | '
+                         + compared['Operation'] + ' | ' + compared['Blockchain'])
+    if 'Batch Size' in compared.columns:
+        batched = compared['Batch Size'].fillna(1) > 1
+        compared.loc[batched, 'Group'] += ' | batch ' + compared.loc[batched, 'Batch Size'].astype(np.int64).astype(str)
+    colors = {'regression': '#d62728', 'improvement': '#2ca02c', 'unchanged': '#7f7f7f'}
+    groups = sorted(compared['Group'].unique())
+    fig, axes = plt.subplots(1, len(METRICS), figsize=(18, max(4, 0.3 * len(groups))), sharey=True)
+    fig.suptitle(f'Relative Change Against Baseline {label}', fontsize=16, fontweight='bold')
+    for ax, metric in zip(axes, METRICS):
+        metric_data = compared[compared['Metric'] == metric].set_index('Group').reindex(groups)
+        changes = metric_data['Change'].replace([np.inf, -np.inf], np.nan).fillna(0) * 100
+        ax.barh(groups, changes, color=[colors.get(status, '#7f7f7f') for status in metric_data['Status']])
+        ax.axvline(0, color='black', linewidth=0.8)
+        tolerance = metric_data['Tolerance'].dropna()
+        if not tolerance.empty:
+            ax.axvline(tolerance.iloc[0] * 100, color='#d62728', linestyle='--', linewidth=0.8)
+            ax.axvline(-tolerance.iloc[0] * 100, color='#2ca02c', linestyle='--', linewidth=0.8)
+        ax.set_title(metric)
+        ax.set_xlabel('Change (%)')
+        ax.grid(True, alpha=0.3, axis='x')
+    plt.tight_layout()
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    plt.close(fig)
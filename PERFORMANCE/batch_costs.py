@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+METRICS = ['Gas', 'Fee (weis)', 'Latency (ms)']
+BATCH_OPERATIONS = ['batchTransfer']
+SINGLE_OPERATION = 'Transfer'
+
+# Results written before the batch size was recorded always used 50 recipients per call
+DEFAULT_BATCH_SIZE = 50
+
+def grouping_keys(columns, df):
+    """Group columns followed by Batch Size when the frame records it, so batch sizes are never averaged together."""
+    return columns + ['Batch Size'] if 'Batch Size' in df.columns else columns
+
+def invalid_batch_sizes(df):
+    """Rows whose recorded batch size is not a positive integer, False everywhere for frames without one."""
+    if 'Batch Size' not in df.columns:
+        return pd.Series(False, index=df.index)
+    sizes = pd.to_numeric(df['Batch Size'], errors='coerce')
+    return sizes.isna() | (sizes < 1) | (sizes % 1 != 0)
+
+def batch_size_column(df):
+    """Batch size of every row, rows without one are legacy batches of DEFAULT_BATCH_SIZE or single calls."""
+    default = pd.Series(np.where(df['Operation'].isin(BATCH_OPERATIONS), DEFAULT_BATCH_SIZE, 1), index=df.index)
+    if 'Batch Size' not in df.columns:
+        return default
+    return pd.to_numeric(df['Batch Size'], errors='coerce').astype('Float64').fillna(default).astype(np.int64)
+
+def steady_state(df):
+    """Drop cold first-touch samples when the dataset has been classified."""
+    if 'Phase' in df.columns:
+        return df[df['Phase'] != 'cold']
+    return df
+
+def per_transfer_costs(df):
+    """Average cost per call and per transfer of every batch operation, implementation, network and batch size."""
+    batches = steady_state(df[df['Operation'].isin(BATCH_OPERATIONS) & (df['DataType'] == 'Transaction')])
+    if batches.empty:
+        return pd.DataFrame()
+    batches = batches.copy()
+    batches['Batch Size'] = batch_size_column(batches)
+    for metric in METRICS:
+        batches[metric] = pd.to_numeric(batches[metric], errors='coerce').astype(np.float64)
+
+    grouped = batches.groupby(['Operation', 'Source', 'Blockchain', 'Batch Size'], observed=True)
+    costs = grouped[METRICS].mean().add_suffix('_avg')
+    costs['Count'] = grouped.size()
+    costs = costs.reset_index()
+    for metric in METRICS:
+        costs[f'{metric}_per_transfer'] = costs[f'{metric}_avg'] / costs['Batch Size']
+    return costs
+
+def single_transfer_costs(df):
+    """Steady-state average cost of one plain transfer per implementation and network."""
+    singles = steady_state(df[(df['Operation'] == SINGLE_OPERATION) & (df['DataType'] == 'Transaction')])
+    if singles.empty:
+        return pd.DataFrame(columns=['Source', 'Blockchain'])
+    values = singles[['Source', 'Blockchain']].copy()
+    for metric in METRICS:
+        values[metric] = pd.to_numeric(singles[metric], errors='coerce').astype(np.float64)
+    return values.groupby(['Source', 'Blockchain'], observed=True)[METRICS].mean().add_suffix('_single').reset_index()
+
+def break_even_size(fixed, marginal, single):
+    """Smallest batch size whose cost per transfer is not above a single transfer, inf if never."""
+    if pd.isna(fixed) or pd.isna(marginal) or pd.isna(single):
+        return np.nan
+    if fixed <= 0:
+        return 1 if marginal <= single else np.inf
+    if marginal >= single:
+        return np.inf
+    return max(1, int(np.ceil(fixed / (single - marginal))))
+
+def fit_batch_costs(costs, singles):
+    """Least-squares fit of cost = fixed + marginal * batch_size and the break-even batch size."""
+    if costs.empty:
+        return pd.DataFrame()
+    singles = singles.set_index(['Source', 'Blockchain']) if not singles.empty else singles
+    rows = []
+    for (operation, source, blockchain), group in costs.groupby(['Operation', 'Source', 'Blockchain'], observed=True):
+        sizes = group['Batch Size'].to_numpy(dtype=np.float64)
+        weights = np.sqrt(group['Count'].to_numpy(dtype=np.float64))
+        for metric in METRICS:
+            result = {'Operation': operation, 'Source': source, 'Blockchain': blockchain, 'Metric': metric,
+                      'Batch sizes': len(sizes)}
+            averages = group[f'{metric}_avg'].to_numpy(dtype=np.float64)
+            if len(np.unique(sizes)) >= 2:
+                # Weighted by sample count so sparsely measured sizes do not dominate
+                design = np.column_stack([np.ones_like(sizes), sizes]) * weights[:, None]
+                (fixed, marginal), *_ = np.linalg.lstsq(design, averages * weights, rcond=None)
+                predicted = fixed + marginal * sizes
+                total = ((averages - averages.mean()) ** 2).sum()
+                r_squared = 1 - ((averages - predicted) ** 2).sum() / total if total > 0 else 1.0
+            else:
+                # A single batch size cannot separate the fixed part from the marginal one
+                fixed, marginal, r_squared = np.nan, np.nan, np.nan
+            key = (source, blockchain)
+            single = singles.loc[key, f'{metric}_single'] if not singles.empty and key in singles.index else np.nan
+            result.update({
+                'Fixed': fixed,
+                'Marginal': marginal,
+                'R2': r_squared,
+                'Single transfer': single,
+                'Break-even batch size': break_even_size(fixed, marginal, single)
+            })
+            rows.append(result)
+    return pd.DataFrame(rows)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import time
+import queue
+import signal
+import socket
+import argparse
+import threading
+import subprocess
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import pandas as pd
+
+LOCAL_NETWORK = 'hh'
+TESTNETS = ['sepolia', 'holesky']
+RUNS_FILE = 'csv_output/matrix_runs.csv'
+LOG_DIR = 'matrix_logs'
+NODE_START_TIMEOUT = 90
+# Importing web3 and creating the event filter take a few seconds, a transfer sent before that is never seen
+ORACLE_START_TIMEOUT = 120
+
+def find_implementations(base_path, selected=None):
+    """Implementation directories (ERC/implementation) that can be deployed and tested with Hardhat."""
+    implementations = []
+    for category in sorted(os.listdir(base_path)):
+        category_dir = os.path.join(base_path, category)
+        if not category.startswith('ERC') or not os.path.isdir(category_dir):
+            continue
+        for implementation in sorted(os.listdir(category_dir)):
+            directory = os.path.join(category_dir, implementation)
+            if os.path.exists(os.path.join(directory, 'hardhat.config.js')) and os.path.exists(os.path.join(directory, 'deploy.js')):
+                implementations.append(f'{category}/{implementation}')
+    if selected:
+        # ERC20 selects a whole category, ERC20/OpenZeppelin a single implementation
+        wanted = {s.strip('/').lower() for s in selected}
+        implementations = [i for i in implementations if i.lower() in wanted or i.split('/')[0].lower() in wanted]
+    return implementations
+
+def test_scripts(directory, operations=None):
+    """Operation test scripts of an implementation, testTransfer.js runs the Transfer operation."""
+    scripts = sorted(f for f in os.listdir(directory) if f.startswith('test') and f.endswith('.js'))
+    if operations:
+        wanted = {op.lower() for op in operations}
+        scripts = [s for s in scripts if s[len('test'):-len('.js')].lower() in wanted]
+    return scripts
+
+def plan_jobs(base_path, implementations, operations, networks, batch_sizes):
+    """One job per implementation and network: deploy, then run the selected operations in order."""
+    jobs = []
+    # Network by network, so the jobs of one implementation are spread out instead of queueing on its lock
+    for network in networks:
+        for implementation in implementations:
+            directory = os.path.join(base_path, implementation)
+            scripts = test_scripts(directory, operations)
+            if not scripts:
+                continue
+            oracle_dir = os.path.join(directory, 'oracle')
+            jobs.append({'implementation': implementation, 'network': network, 'directory': directory,
+                         'scripts': ['deploy.js'] + scripts,
+                         'oracle': oracle_dir if os.path.exists(os.path.join(oracle_dir, 'oracle.py')) else None,
+                         'batch_sizes': ','.join(str(size) for size in batch_sizes) if batch_sizes else None})
+    return jobs
+
+def free_ports(base_port, count):
+    """The first `count` ports from base_port on that nothing is listening on."""
+    ports = []
+    port = base_port
+    while len(ports) < count:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if s.connect_ex(('127.0.0.1', port)) != 0:
+                ports.append(port)
+        port += 1
+    return ports
+
+def rpc_ready(url):
+    """Whether a JSON-RPC endpoint answers eth_chainId."""
+    request = urllib.request.Request(url, data=json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'eth_chainId', 'params': []}).encode(),
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=2) as response:
+            return 'result' in json.load(response)
+    except (OSError, ValueError):
+        return False
+
+def start_process(command, cwd, log, env=None):
+    """Start a background process in its own process group, output appended to the job log."""
+    return subprocess.Popen(command, cwd=cwd, stdout=log, stderr=subprocess.STDOUT, env=env,
+                            start_new_session=(os.name == 'posix'))
+
+def stop_process(process):
+    """Stop a background process and everything it started."""
+    if process is None or process.poll() is not None:
+        return
+    try:
+        if os.name == 'posix':
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        process.wait(timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        process.kill()
+
+def start_node(directory, port, log):
+    """Start a Hardhat node with the implementation's configuration and wait until it answers."""
+    node = start_process(['npx', 'hardhat', 'node', '--hostname', '127.0.0.1', '--port', str(port)], directory, log)
+    url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + NODE_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if node.poll() is not None:
+            raise RuntimeError(f'Hardhat node on port {port} exited with code {node.returncode}')
+        if rpc_ready(url):
+            return node, url
+        time.sleep(0.5)
+    stop_process(node)
+    raise RuntimeError(f'Hardhat node on port {port} did not answer within {NODE_START_TIMEOUT} s')
+
+def start_oracle(directory, log, env, ready_file):
+    """Start the oracle and wait until it listens for transfers."""
+    if os.path.exists(ready_file):
+        os.remove(ready_file)
+    oracle = start_process([sys.executable, 'oracle.py'], directory, log, dict(env, ORACLE_READY_FILE=ready_file))
+    deadline = time.monotonic() + ORACLE_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if oracle.poll() is not None:
+            raise RuntimeError(f'Oracle exited with code {oracle.returncode}')
+        if os.path.exists(ready_file):
+            os.remove(ready_file)
+            return oracle
+        time.sleep(0.2)
+    stop_process(oracle)
+    raise RuntimeError(f'Oracle did not start listening within {ORACLE_START_TIMEOUT} s')
+
+def run_job(job, slots, implementation_locks, log_dir, step_timeout):
+    """Deploy an implementation and run its operations on one node or testnet lane."""
+    result = {'Implementation': job['implementation'], 'Network': job['network'], 'Port': None, 'Status': 'ok',
+              'Failed step': None, 'Seconds': 0.0, 'Log': None}
+    log_path = os.path.join(log_dir, f"{job['implementation'].replace('/', '_')}_{job['network']}.log")
+    result['Log'] = log_path
+    # deploy.js rewrites deployment-addresses.json, so runs of one implementation never overlap
+    with implementation_locks[job['implementation']]:
+        slot = slots[job['network']].get()
+        start = time.perf_counter()
+        node = oracle = None
+        try:
+            with open(log_path, 'w') as log:
+                env = dict(os.environ)
+                if job['batch_sizes']:
+                    env['BATCH_SIZES'] = job['batch_sizes']
+                if job['network'] == LOCAL_NETWORK:
+                    result['Port'] = slot
+                    node, env['HH_RPC_URL'] = start_node(job['directory'], slot, log)
+                for script in job['scripts']:
+                    log.write(f"\n=== npx hardhat run --network {job['network']} {script}\n")
+                    log.flush()
+                    completed = subprocess.run(['npx', 'hardhat', 'run', '--network', job['network'], script],
+                                               cwd=job['directory'], stdout=log, stderr=subprocess.STDOUT, env=env,
+                                               timeout=step_timeout)
+                    if completed.returncode != 0:
+                        result['Status'], result['Failed step'] = 'failed', script
+                        break
+                    if script == 'deploy.js' and job['oracle']:
+                        # The oracle needs the freshly deployed compliance module
+                        oracle_env = dict(env, ORACLE_NETWORK='hardhat' if job['network'] == LOCAL_NETWORK else job['network'])
+                        if job['network'] == LOCAL_NETWORK:
+                            oracle_env['ORACLE_RPC_URL'] = env['HH_RPC_URL']
+                        oracle = start_oracle(job['oracle'], log, oracle_env, os.path.abspath(log_path + '.oracle_ready'))
+        except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+            result['Status'], result['Failed step'] = 'error', str(e)
+        finally:
+            stop_process(oracle)
+            stop_process(node)
+            slots[job['network']].put(slot)
+            result['Seconds'] = time.perf_counter() - start
+    print(f"[{result['Status']:>6}] {job['implementation']} on {job['network']}"
+          f"{f' (port {slot})' if result['Port'] else ''}: {result['Seconds']:.1f} s"
+          f"{'' if result['Status'] == 'ok' else f', see {log_path}'}")
+    return result
+
+def run_matrix(jobs, networks, workers, base_port, log_dir, step_timeout):
+    """Run the jobs on a pool of local nodes and one serial lane per testnet."""
+    os.makedirs(log_dir, exist_ok=True)
+    slots = {}
+    lanes = 0
+    for network in networks:
+        slots[network] = queue.Queue()
+        if network == LOCAL_NETWORK:
+            # Every local slot is its own node on its own port
+            for port in free_ports(base_port, workers):
+                slots[network].put(port)
+            lanes += workers
+        else:
+            # Testnet runs share the funded accounts and their nonces, so they go one at a time
+            slots[network].put(None)
+            lanes += 1
+    implementation_locks = {job['implementation']: threading.Lock() for job in jobs}
+    with ThreadPoolExecutor(max_workers=max(1, min(lanes, len(jobs)))) as pool:
+        futures = [pool.submit(run_job, job, slots, implementation_locks, log_dir, step_timeout) for job in jobs]
+        return [future.result() for future in futures]
+
+def append_runs(results, matrix_id, output_file=RUNS_FILE):
+    """Append the outcome of every job to the matrix run history."""
+    df = pd.DataFrame(results)
+    df.insert(0, 'Matrix ID', matrix_id)
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    df.to_csv(output_file, mode='a', header=not os.path.exists(output_file), index=False)
+
+def parse_args(argv=None):
+    """Parse the benchmark matrix."""
+    parser = argparse.ArgumentParser(description='Run the performance tests of several implementations in parallel.')
+    parser.add_argument('--implementations', nargs='+', metavar='IMPL',
+                        help='ERC categories or ERC/implementation directories (default: all)')
+    parser.add_argument('--operations', nargs='+', metavar='OP',
+                        help='operations to test, from the test[Operation].js scripts (default: all)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', metavar='N',
+                        help='recipients per batch call, passed to the batch scripts as BATCH_SIZES (default: 50)')
+    parser.add_argument('--networks', nargs='+', choices=[LOCAL_NETWORK] + TESTNETS, default=[LOCAL_NETWORK],
+                        help=f'networks to run on (default: {LOCAL_NETWORK}, a fresh local node per job)')
+    parser.add_argument('--workers', type=int, default=max(1, min(4, (os.cpu_count() or 2) // 2)),
+                        help='local Hardhat nodes running at the same time (default: half the CPUs, at most 4)')
+    parser.add_argument('--base-port', type=int, default=8600, help='first port of the local nodes (default: 8600)')
+    parser.add_argument('--step-timeout', type=int, default=1800, help='seconds allowed for one script (default: 1800)')
+    parser.add_argument('--log-dir', default=LOG_DIR, help=f'directory of the per-job logs (default: {LOG_DIR})')
+    parser.add_argument('--dry-run', action='store_true', help='print the jobs without running them')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Plan the matrix, run it and record the outcome of every job."""
+    args = parse_args(argv)
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    implementations = find_implementations(base_path, args.implementations)
+    jobs = plan_jobs(base_path, implementations, args.operations, args.networks, args.batch_sizes)
+    if not jobs:
+        print("No implementation with matching test scripts found!")
+        return 1
+
+    print(f"Benchmark matrix: {len(jobs)} jobs, {args.workers} local nodes from port {args.base_port}")
+    for job in jobs:
+        print(f"  - {job['implementation']} on {job['network']}: {' '.join(job['scripts'])}"
+              f"{' + oracle' if job['oracle'] else ''}")
+    if args.dry_run:
+        return 0
+
+    matrix_id = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    start = time.perf_counter()
+    results = run_matrix(jobs, args.networks, args.workers, args.base_port, args.log_dir, args.step_timeout)
+    append_runs(results, matrix_id)
+
+    failed = [r for r in results if r['Status'] != 'ok']
+    print(f"\nMatrix {matrix_id} finished in {time.perf_counter() - start:.1f} s: "
+          f"{len(results) - len(failed)} of {len(results)} jobs succeeded")
+    print(f"- Results appended to each implementation's results.csv and deployment-addresses.json")
+    print(f"- Job outcomes saved to: {RUNS_FILE}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
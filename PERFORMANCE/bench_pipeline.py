@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+import warnings
+import multiprocessing
+from queue import Empty
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+
+BENCHMARK_FILE = 'csv_output/pipeline_benchmarks.csv'
+STAGES = ['discovery', 'load', 'statistics', 'summary', 'rendering', 'latex']
+CATEGORIES = ['ERC20', 'ERC1400', 'ERC3643']
+NETWORKS = ['hardhat', 'sepolia', 'holesky']
+OPERATIONS = ['Transfer', 'BatchTransfer', 'TransferByPartition', 'Mint', 'Burn']
+BATCH_SIZES = [1, 5, 10, 25, 50]
+# Rough shape of the real results: gas of a warm call, cold first-call surcharge and per-network gas price and latency
+BASE_GAS = 35050
+COLD_GAS = 17100
+BATCH_MARGINAL_GAS = 9000
+GAS_PRICES = {'hardhat': 1000000007, 'sepolia': 21653000, 'holesky': 1000252}
+LATENCY_MEDIANS = {'hardhat': 15.0, 'sepolia': 11500.0, 'holesky': 12500.0}
+PHASE_SHARES = [0.02, 0.08, 0.05, 0.8, 0.05]
+HEADER_COLUMNS = ['Operation', 'Gas', 'Fee (weis)', 'Latency (ms)', 'Blockchain', 'Run ID', 'Timestamp', 'Iteration',
+                  'Block', 'Batch Size', 'Build (ms)', 'Submit (ms)', 'Pending (ms)', 'Inclusion (ms)', 'Receipt (ms)']
+WRITE_CHUNK_ROWS = 1000000
+
+def operation_names(count):
+    """The first `count` operation names, numbered once the known ones run out."""
+    return [OPERATIONS[i] if i < len(OPERATIONS) else f'Operation{i + 1}' for i in range(count)]
+
+def synthetic_rows(operation, network, rows, rng, impl_index, run_id, first_iteration=0, first_block=1):
+    """Schema v3 samples of one operation on one network, with a cold first call and batch sweeps."""
+    iterations = first_iteration + np.arange(rows, dtype=np.int64)
+    batch_sizes = np.ones(rows, dtype=np.int64)
+    gas = np.full(rows, BASE_GAS + 1500 * impl_index, dtype=np.int64)
+    if operation.startswith('Batch'):
+        batch_sizes = np.array(BATCH_SIZES, dtype=np.int64)[iterations % len(BATCH_SIZES)]
+        gas = gas + BATCH_MARGINAL_GAS * (batch_sizes - 1)
+    gas[iterations == 0] += COLD_GAS
+    latency = rng.lognormal(np.log(LATENCY_MEDIANS.get(network, 1000.0)), 0.25, rows)
+    phases = np.outer(latency, PHASE_SHARES)
+    start = np.datetime64('2025-01-01T00:00:00', 'ms') + np.cumsum(latency.astype(np.int64) + 1).astype('timedelta64[ms]')
+    return pd.DataFrame({
+        'Operation': operation,
+        'Gas': gas,
+        'Fee (weis)': gas * GAS_PRICES.get(network, 1000000000),
+        'Latency (ms)': latency.round(6),
+        'Blockchain': network,
+        'Run ID': run_id,
+        'Timestamp': np.char.add(np.datetime_as_string(start, unit='ms'), 'Z'),
+        'Iteration': iterations,
+        'Block': first_block + np.arange(rows, dtype=np.int64),
+        'Batch Size': batch_sizes,
+        **{column: phases[:, i].round(3) for i, column in enumerate(HEADER_COLUMNS[10:])}
+    })
+
+def generate_tree(root, implementations=6, networks=3, operations=3, rows=1000, seed=0):
+    """Write a synthetic PERFORMANCE tree of results.csv and deployment-addresses.json files."""
+    rng = np.random.default_rng(seed)
+    base = os.path.join(root, 'PERFORMANCE')
+    network_list = (NETWORKS * (networks // len(NETWORKS) + 1))[:networks]
+    network_list = [name if i < len(NETWORKS) else f'{name}{i}' for i, name in enumerate(network_list)]
+    operation_list = operation_names(operations)
+    groups = len(network_list) * len(operation_list)
+    total = 0
+    for impl_index in range(implementations):
+        impl_dir = os.path.join(base, CATEGORIES[impl_index % len(CATEGORIES)], f'Impl{impl_index + 1:02d}')
+        os.makedirs(impl_dir, exist_ok=True)
+        csv_file = os.path.join(impl_dir, 'results.csv')
+        pd.DataFrame(columns=HEADER_COLUMNS).to_csv(csv_file, index=False)
+        block = 1
+        for group_index, (network, operation) in enumerate((n, o) for n in network_list for o in operation_list):
+            group_rows = rows // groups + (1 if group_index < rows % groups else 0)
+            for offset in range(0, group_rows, WRITE_CHUNK_ROWS):
+                chunk_rows = min(WRITE_CHUNK_ROWS, group_rows - offset)
+                chunk = synthetic_rows(operation, network, chunk_rows, rng, impl_index, f'bench-{group_index}',
+                                       offset, block)
+                chunk.to_csv(csv_file, mode='a', header=False, index=False)
+                block += chunk_rows
+            total += group_rows
+        deployments = {
+            network: {
+                'deployment': {'metrics': {'deploymentGas': str(3000000 + 10000 * impl_index),
+                                           'deploymentFee': str((3000000 + 10000 * impl_index) * GAS_PRICES.get(network, 1000000000)),
+                                           'deploymentLatency': float(LATENCY_MEDIANS.get(network, 1000.0))}},
+                'initialization': {'metrics': {'initializationGas': '1032457',
+                                               'initializationFee': str(1032457 * GAS_PRICES.get(network, 1000000000)),
+                                               'initializationLatency': float(LATENCY_MEDIANS.get(network, 1000.0))}}
+            }
+            for network in network_list
+        }
+        with open(os.path.join(impl_dir, 'deployment-addresses.json'), 'w') as f:
+            json.dump(deployments, f, indent=2)
+    return base, total
+
+def run_stages(base, families, quiet=True):
+    """Run the stages of pipeline.py on a tree, timing each stage."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import graphs
+    import pipeline
+
+    # The options of a plain pipeline.py run, with fresh PNG charts so every run renders the same work
+    args = pipeline.parse_args(['--no-show', '--no-cache', '--force-latex', '--formats', 'png', '--dpi', '100',
+                                '--charts'] + (families or ['none']))
+    run = graphs.new_run(args)
+    run['base_path'] = base
+    instrument = run['instrument']
+    timings = []
+    stage_functions = {'discovery': graphs.discover_stage, 'load': graphs.load_stage, 'statistics': graphs.stats_stage,
+                       'summary': graphs.compare_stage, 'rendering': graphs.charts_stage, 'latex': pipeline.latex_stage}
+
+    for stage in STAGES:
+        if stage == 'rendering' and not families:
+            continue
+        output = io.StringIO() if quiet else sys.stdout
+        with contextlib.redirect_stdout(output), warnings.catch_warnings():
+            if quiet:
+                warnings.simplefilter('ignore')
+            with instrument.stage(stage):
+                ok = stage_functions[stage](run)
+        if not ok:
+            raise RuntimeError(f"The {stage} stage found nothing to process in {base}")
+        # Nested stages, like those of the LaTeX generator, are recorded before their parent
+        record = instrument.records[-1]
+        timings.append({'Stage': stage, 'Seconds': record['Seconds'], 'Peak RSS (MB)': record['Peak RSS (MB)']})
+        print(f"  {stage:<11} {record['Seconds']:9.3f} s  peak RSS {record['Peak RSS (MB)']:8.1f} MB", file=sys.__stdout__)
+    return timings, len(run['df'])
+
+def benchmark_scale(config, queue):
+    """Generate one tree and time the pipeline on it, in a fresh process so peak RSS is its own."""
+    sys.path.insert(0, config['script_dir'])
+    work_dir = tempfile.mkdtemp(prefix='pipeline_bench_', dir=config['work_dir'])
+    try:
+        start = time.perf_counter()
+        base, total = generate_tree(work_dir, config['implementations'], config['networks'], config['operations'],
+                                    config['rows'], config['seed'])
+        print(f"  generated {total} rows in {time.perf_counter() - start:.1f} s", file=sys.__stdout__)
+        os.chdir(base)
+        os.makedirs('csv_output', exist_ok=True)
+        timings, rows = run_stages(base, config['families'], config['quiet'])
+        queue.put({'timings': timings, 'rows': rows})
+    finally:
+        os.chdir(config['script_dir'])
+        if config['keep']:
+            print(f"  tree kept in {work_dir}", file=sys.__stdout__)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+def wait_for_outcome(process, queue):
+    """Result sent by a benchmark process, or None if it died first."""
+    # Read before joining, a full queue would otherwise keep the child from exiting
+    while True:
+        try:
+            return queue.get(timeout=1)
+        except Empty:
+            if not process.is_alive():
+                return None
+
+def append_results(results, output_file=BENCHMARK_FILE):
+    """Append benchmark rows to the machine-readable history."""
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    df = pd.DataFrame(results)
+    df.to_csv(output_file, mode='a', header=not os.path.exists(output_file), index=False)
+
+def parse_args(argv=None):
+    """Parse the scales of the synthetic trees and the stages to run."""
+    parser = argparse.ArgumentParser(description='Benchmark graphs.py and latex_table_generator.py on synthetic results.')
+    parser.add_argument('--implementations', type=int, default=6, help='implementation directories (default: 6)')
+    parser.add_argument('--networks', type=int, default=3, help='networks per implementation (default: 3)')
+    parser.add_argument('--operations', type=int, default=3, help='operations per network (default: 3)')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 100000],
+                        help='rows per results.csv, one benchmark per value (default: 1000 100000)')
+    parser.add_argument('--charts', nargs='+', default=['transaction', 'operation'],
+                        help="chart families rendered, or 'none' (default: transaction operation)")
+    parser.add_argument('--repeat', type=int, default=1, help='runs of every scale (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed of the synthetic samples (default: 0)')
+    parser.add_argument('--work-dir', help='directory for the synthetic trees (default: the system temp directory)')
+    parser.add_argument('--keep', action='store_true', help='keep the synthetic trees')
+    parser.add_argument('--verbose', action='store_true', help='show the output of the pipeline stages')
+    parser.add_argument('--output', default=BENCHMARK_FILE, help=f'results file (default: {BENCHMARK_FILE})')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Benchmark every requested scale and append the stage timings to the results file."""
+    args = parse_args(argv)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    from baselines import current_commit
+    run_id = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    commit = current_commit()
+    families = [] if 'none' in args.charts else args.charts
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for rows in args.rows:
+        for repeat in range(args.repeat):
+            print(f"\n{args.implementations} implementations x {args.networks} networks x {args.operations} operations, "
+                  f"{rows} rows per file (run {repeat + 1}/{args.repeat})")
+            config = {'script_dir': script_dir, 'work_dir': args.work_dir, 'implementations': args.implementations,
+                      'networks': args.networks, 'operations': args.operations, 'rows': rows, 'seed': args.seed,
+                      'families': families, 'quiet': not args.verbose, 'keep': args.keep}
+            queue = context.Queue()
+            process = context.Process(target=benchmark_scale, args=(config, queue))
+            process.start()
+            outcome = wait_for_outcome(process, queue)
+            process.join()
+            if outcome is None or process.exitcode != 0:
+                print(f"Benchmark failed with exit code {process.exitcode}")
+                continue
+            for timing in outcome['timings']:
+                results.append({'Run ID': run_id, 'Commit': commit, 'Implementations': args.implementations,
+                                'Networks': args.networks, 'Operations': args.operations, 'Rows per file': rows,
+                                'Total rows': outcome['rows'], 'Repeat': repeat + 1, 'Charts': ' '.join(families) or 'none',
+                                **timing})
+    if not results:
+        return 1
+    output_file = os.path.join(script_dir, args.output) if not os.path.isabs(args.output) else args.output
+    append_results(results, output_file)
+    summary = pd.DataFrame(results).pivot_table(index='Rows per file', columns='Stage', values='Seconds', aggfunc='median')
+    print("\nMedian seconds per stage:")
+    print(summary[[stage for stage in STAGES if stage in summary.columns]].round(3).to_string())
+    print(f"\nBenchmark results appended to {output_file}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
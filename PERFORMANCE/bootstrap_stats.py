@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+import itertools
+import numpy as np
+import pandas as pd
+from batch_costs import grouping_keys
+
+METRICS = ['Gas', 'Fee (weis)', 'Latency (ms)']
+GROUP_COLUMNS = ['Operation', 'Blockchain', 'Category', 'Subcategory', 'DataType']
+
+# Upper bound on resampled elements held at once, resamples are drawn in batches below it
+MAX_BATCH_ELEMENTS = 4_000_000
+
+STATISTICS = {
+    'mean': np.mean,
+    'median': np.median
+}
+
+def batch_sizes(n_resamples, sample_size, max_elements=MAX_BATCH_ELEMENTS):
+    """Split resamples into batches whose (batch, sample_size) arrays stay below max_elements."""
+    batch = max(1, min(n_resamples, max_elements // max(sample_size, 1)))
+    for start in range(0, n_resamples, batch):
+        yield min(batch, n_resamples - start)
+
+def bootstrap_distribution(values, statistic, n_resamples, rng):
+    """Bootstrap distribution of a statistic, drawn as batched index matrices."""
+    values = np.asarray(values, dtype=np.float64)
+    func = STATISTICS[statistic]
+    distribution = []
+    for size in batch_sizes(n_resamples, len(values)):
+        indices = rng.integers(0, len(values), size=(size, len(values)))
+        distribution.append(func(values[indices], axis=1))
+    return np.concatenate(distribution)
+
+def percentile_interval(distribution, confidence):
+    """Percentile confidence interval of a bootstrap distribution."""
+    alpha = 1 - confidence
+    low, high = np.quantile(distribution, [alpha / 2, 1 - alpha / 2])
+    return low, high
+
+def bootstrap_ci(values, statistic='mean', n_resamples=2000, confidence=0.95, rng=None):
+    """Point estimate and percentile bootstrap confidence interval of a statistic."""
+    rng = rng if rng is not None else np.random.default_rng()
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.nan, np.nan, np.nan
+    estimate = STATISTICS[statistic](values)
+    if len(values) == 1:
+        return estimate, estimate, estimate
+    low, high = percentile_interval(bootstrap_distribution(values, statistic, n_resamples, rng), confidence)
+    return estimate, low, high
+
+def permutation_test(a, b, n_resamples=2000, rng=None):
+    """Two-sided permutation test of the difference in means, with batched permutations."""
+    rng = rng if rng is not None else np.random.default_rng()
+    pooled = np.concatenate([a, b])
+    observed = abs(a.mean() - b.mean())
+    tolerance = 1e-9 * max(1.0, observed)
+    extreme = 0
+    for size in batch_sizes(n_resamples, len(pooled)):
+        permuted = rng.permuted(np.tile(pooled, (size, 1)), axis=1)
+        differences = permuted[:, :len(a)].mean(axis=1) - permuted[:, len(a):].mean(axis=1)
+        extreme += np.count_nonzero(np.abs(differences) >= observed - tolerance)
+    return (extreme + 1) / (n_resamples + 1)
+
+def difference_ci(a, b, n_resamples=2000, confidence=0.95, rng=None):
+    """Bootstrap confidence interval of mean(a) - mean(b) resampling both groups independently."""
+    rng = rng if rng is not None else np.random.default_rng()
+    distribution = (bootstrap_distribution(a, 'mean', n_resamples, rng)
+                    - bootstrap_distribution(b, 'mean', n_resamples, rng))
+    return percentile_interval(distribution, confidence)
+
+def holm_adjust(p_values):
+    """Holm-Bonferroni adjusted p-values."""
+    p_values = np.asarray(p_values, dtype=np.float64)
+    if len(p_values) == 0:
+        return p_values
+    order = np.argsort(p_values)
+    scaled = p_values[order] * (len(p_values) - np.arange(len(p_values)))
+    adjusted = np.minimum(np.maximum.accumulate(scaled), 1.0)
+    result = np.empty_like(adjusted)
+    result[order] = adjusted
+    return result
+
+def compute_bootstrap_intervals(df, n_resamples=2000, confidence=0.95, seed=None):
+    """Bootstrap confidence intervals of the mean and median of every metric for each group."""
+    rng = np.random.default_rng(seed)
+    keys = grouping_keys(GROUP_COLUMNS, df)
+    results = []
+    for key, group in df.groupby(keys, observed=True):
+        result = dict(zip(keys, key))
+        result['Source'] = f"{result['Category']}/{result['Subcategory']}"
+        for metric in METRICS:
+            if metric not in group.columns:
+                continue
+            values = pd.to_numeric(group[metric], errors='coerce').to_numpy(dtype=np.float64)
+            for statistic in STATISTICS:
+                estimate, low, high = bootstrap_ci(values, statistic, n_resamples, confidence, rng)
+                result[f'{metric}_{statistic}'] = estimate
+                result[f'{metric}_{statistic}_ci_low'] = low
+                result[f'{metric}_{statistic}_ci_high'] = high
+        results.append(result)
+    return pd.DataFrame(results)
+
+def compute_pairwise_tests(df, n_resamples=2000, confidence=0.95, alpha=0.05, seed=None):
+    """Compare every pair of implementations on the same operation and network."""
+    rng = np.random.default_rng(seed)
+    transactions = df[df['DataType'] == 'Transaction']
+    keys = grouping_keys(['Operation', 'Blockchain'], transactions)
+    pairs = []
+    for key, group in transactions.groupby(keys, observed=True):
+        samples = {source: frame for source, frame in group.groupby('Source', observed=True) if len(frame) > 1}
+        for source_a, source_b in itertools.combinations(sorted(samples), 2):
+            for metric in METRICS:
+                a = pd.to_numeric(samples[source_a][metric], errors='coerce').dropna().to_numpy(dtype=np.float64)
+                b = pd.to_numeric(samples[source_b][metric], errors='coerce').dropna().to_numpy(dtype=np.float64)
+                if len(a) >= 2 and len(b) >= 2:
+                    pairs.append((key, metric, source_a, source_b, a, b))
+    if not pairs:
+        return pd.DataFrame()
+    
+    # The smallest permutation p-value is 1/(n+1), it must be able to pass the Holm threshold alpha/m
+    tests_per_metric = max(sum(1 for pair in pairs if pair[1] == metric) for metric in METRICS)
+    n_permutations = max(n_resamples, int(np.ceil(2 * tests_per_metric / alpha)))
+    
+    results = []
+    for key, metric, source_a, source_b, a, b in pairs:
+        low, high = difference_ci(a, b, n_resamples, confidence, rng)
+        results.append({
+            **dict(zip(keys, key)),
+            'Metric': metric,
+            'Source A': source_a,
+            'Source B': source_b,
+            'Count A': len(a),
+            'Count B': len(b),
+            'Mean A': a.mean(),
+            'Mean B': b.mean(),
+            'Difference': a.mean() - b.mean(),
+            'Difference CI low': low,
+            'Difference CI high': high,
+            'p-value': permutation_test(a, b, n_permutations, rng)
+        })
+    tests = pd.DataFrame(results)
+    # Correct for the number of comparisons made on each metric
+    tests['p-value (Holm)'] = tests.groupby('Metric')['p-value'].transform(lambda p: holm_adjust(p.to_numpy()))
+    tests['Significant'] = tests['p-value (Holm)'] < alpha
+    return tests
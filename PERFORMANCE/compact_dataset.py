@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+LABEL_COLUMNS = ['Category', 'Subcategory', 'Source', 'DataType', 'Operation', 'Blockchain', 'Run ID']
+INTEGER_COLUMNS = ['Gas', 'Fee (weis)', 'Iteration', 'Block', 'Batch Size']
+LATENCY_COLUMNS = ['Latency (ms)', 'Build (ms)', 'Submit (ms)', 'Pending (ms)', 'Inclusion (ms)', 'Receipt (ms)']
+
+# Latency is measured with microsecond resolution, float32 is used only if it keeps it
+LATENCY_TOLERANCE_MS = 1e-3
+
+INT64_MAX = np.iinfo(np.int64).max
+UINT64_MAX = np.iinfo(np.uint64).max
+
+def parse_exact_int(value):
+    """Parse a metric cell as an exact Python int, or None if missing or not an integer."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return int(value) if float(value).is_integer() else None
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+def exact_integer_values(series):
+    """Normalise an integer metric of one file so concatenation can never turn it into float."""
+    if series.dtype.kind == 'i':
+        return series
+    if series.dtype.kind == 'u' and (series.empty or series.max() <= INT64_MAX):
+        return series.astype(np.int64)
+    if series.dtype.kind == 'f' and series.notna().all() and (series % 1 == 0).all():
+        return series.astype(np.int64)
+    if series.dtype.kind == 'f':
+        return series
+    # Values beyond int64 (mainnet-scale fees) are kept as exact Python ints
+    values = series.map(parse_exact_int)
+    if values.notna().all() and values.map(lambda v: -INT64_MAX <= v <= INT64_MAX).all():
+        return values.astype(np.int64)
+    return values.astype(object)
+
+def compact_integer_column(series):
+    """Store an integer metric in the narrowest exact fixed-width dtype, or as Python ints on overflow."""
+    if series.dtype == object:
+        values = series.map(parse_exact_int)
+        present = values.dropna()
+        if present.empty or present.min() < 0 or present.max() > UINT64_MAX:
+            # Explicit decimal path: exact arbitrary-precision integers
+            return values.astype(object)
+        low, high = present.min(), present.max()
+        series = pd.Series(present.astype(np.uint64), index=present.index).reindex(series.index)
+        if values.isna().any():
+            return series.astype(nullable_dtype_for(low, high))
+        return series.astype(numpy_dtype_for(low, high))
+    if series.dtype.kind == 'f':
+        if not (series.dropna() % 1 == 0).all():
+            return series
+        if series.isna().any():
+            return series.astype('Int64').astype(nullable_dtype_for(series.min(), series.max()))
+        series = series.astype(np.int64)
+    if series.dtype.kind not in 'iu' or series.empty:
+        return series
+    return series.astype(numpy_dtype_for(series.min(), series.max()))
+
+def numpy_dtype_for(low, high):
+    """Narrowest NumPy integer dtype holding the range [low, high]."""
+    candidates = ([np.uint8, np.uint16, np.uint32, np.uint64] if low >= 0
+                  else [np.int8, np.int16, np.int32, np.int64])
+    for dtype in candidates:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return np.int64
+
+def nullable_dtype_for(low, high):
+    """Nullable pandas counterpart of numpy_dtype_for()."""
+    return {np.uint8: 'UInt8', np.uint16: 'UInt16', np.uint32: 'UInt32', np.uint64: 'UInt64',
+            np.int8: 'Int8', np.int16: 'Int16', np.int32: 'Int32', np.int64: 'Int64'}[numpy_dtype_for(low, high)]
+
+def compact_latency_column(series):
+    """Store latency as float32 when the round trip stays within the measurement resolution."""
+    if series.dtype != np.float64 or series.empty:
+        return series
+    values = series.to_numpy()
+    narrowed = values.astype(np.float32)
+    error = np.abs(narrowed.astype(np.float64) - values)
+    if np.nanmax(error, initial=0.0) <= LATENCY_TOLERANCE_MS:
+        return pd.Series(narrowed, index=series.index, name=series.name)
+    return series
+
+def compact_dataframe(df):
+    """Dictionary-encode labels and narrow numeric metrics of the combined dataset."""
+    df = df.copy()
+    for column in LABEL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    for column in INTEGER_COLUMNS:
+        if column in df.columns:
+            df[column] = compact_integer_column(df[column])
+    for column in LATENCY_COLUMNS:
+        if column in df.columns:
+            df[column] = compact_latency_column(df[column])
+    return df
+
+def memory_footprint(df):
+    """Report the in-memory size of every column in bytes and bytes per row."""
+    usage = df.memory_usage(deep=True, index=False)
+    rows = max(len(df), 1)
+    footprint = pd.DataFrame({
+        'Column': usage.index,
+        'Dtype': [str(df[column].dtype) for column in usage.index],
+        'Bytes': usage.values,
+        'Bytes/row': usage.values / rows
+    })
+    total = pd.DataFrame([{'Column': 'TOTAL', 'Dtype': '', 'Bytes': usage.sum(), 'Bytes/row': usage.sum() / rows}])
+    return pd.concat([footprint, total], ignore_index=True)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import json
+import numpy as np
+import pandas as pd
+from compact_dataset import exact_integer_values
+
+METRICS = ['Gas', 'Fee (weis)']
+CONTRACT_COLUMNS = ['Blockchain', 'Stage', 'Contract', 'Address', 'Gas', 'Fee (weis)', 'Latency (ms)']
+# Keys of a contract entry, older deployment scripts misspelled the fee
+FIELDS = {'Gas': ['deploymentGas'], 'Fee (weis)': ['deploymentFee', 'deplyomentFee'], 'Latency (ms)': ['deploymentLatency']}
+# Setup cost outside the per-contract entries
+INITIALIZATION = 'initialization'
+UNATTRIBUTED = 'unattributed'
+
+def entry_field(entry, names):
+    """First of the alternative keys present in a JSON entry, None if none is."""
+    return next((entry[name] for name in names if name in entry), None)
+
+def parse_deployment_file(json_file, blockchains=None):
+    """Every contract and setup total of every network of a deployment-addresses.json as flat rows."""
+    with open(json_file, 'r') as f:
+        data = json.load(f)
+    selected = {b.lower() for b in blockchains} if blockchains else None
+    rows = []
+    for network_name, network_data in data.items():
+        if not isinstance(network_data, dict) or (selected and network_name.lower() not in selected):
+            continue
+        network = network_name.capitalize()
+        deployment = network_data.get('deployment', {})
+        for contract, entry in deployment.get('contracts', {}).items():
+            if isinstance(entry, dict):
+                rows.append([network, 'Deployment', contract, entry.get('address')] +
+                            [entry_field(entry, FIELDS[metric]) for metric in ['Gas', 'Fee (weis)', 'Latency (ms)']])
+        # Suite totals, the part not covered by the contract entries is attributed in setup_components()
+        metrics = deployment.get('metrics', {})
+        if metrics:
+            rows.append([network, 'Total', None, None, metrics.get('deploymentGas'), metrics.get('deploymentFee'),
+                         metrics.get('deploymentLatency')])
+        init_metrics = network_data.get('initialization', {}).get('metrics', {})
+        if init_metrics:
+            rows.append([network, 'Initialization', INITIALIZATION, None, init_metrics.get('initializationGas'),
+                         init_metrics.get('initializationFee'), init_metrics.get('initializationLatency')])
+    return typed_contract_rows(pd.DataFrame(rows, columns=CONTRACT_COLUMNS))
+
+def typed_contract_rows(df):
+    """Convert the JSON strings of a flattened deployment file column by column."""
+    df['Gas'] = pd.to_numeric(df['Gas'], errors='coerce').astype('Int64')
+    # Fees stay exact integers, mainnet-scale values may exceed int64
+    df['Fee (weis)'] = exact_integer_values(df['Fee (weis)'].astype(object))
+    df['Latency (ms)'] = pd.to_numeric(df['Latency (ms)'], errors='coerce').astype(np.float64)
+    return df
+
+def setup_components(contract_costs):
+    """Gas and fee of every contract, initialization and unattributed part of each suite's setup cost."""
+    if contract_costs.empty:
+        return pd.DataFrame()
+    keys = ['Source', 'Blockchain']
+    costs = contract_costs[['Category', 'Subcategory'] + keys + ['Stage', 'Contract']].copy()
+    for metric in METRICS:
+        costs[metric] = pd.to_numeric(contract_costs[metric], errors='coerce').astype(np.float64)
+    is_total = costs['Stage'] == 'Total'
+    parts = costs[~is_total]
+    # Deployment cost the contract entries do not explain, e.g. library links or factory calls
+    totals = costs[is_total].groupby(keys, observed=True)[METRICS].sum()
+    deployed = parts[parts['Stage'] == 'Deployment'].groupby(keys, observed=True)[METRICS].sum()
+    remainder = totals.sub(deployed.reindex(totals.index).fillna(0)).clip(lower=0)
+    remainder = remainder[(remainder > 0).any(axis=1)].reset_index()
+    if not remainder.empty:
+        labels = parts.drop_duplicates(keys).set_index(keys)[['Category', 'Subcategory']]
+        remainder = remainder.join(labels, on=keys)
+        remainder['Stage'], remainder['Contract'] = 'Deployment', UNATTRIBUTED
+    components = pd.concat([parts, remainder], ignore_index=True)
+    setup_totals = components.groupby(keys)[METRICS].transform('sum')
+    for metric in METRICS:
+        components[f'{metric} share'] = components[metric] / setup_totals[metric].where(setup_totals[metric] > 0)
+    return components.sort_values(keys + ['Gas'], ascending=[True, True, False]).reset_index(drop=True)
+
+def largest_components(components, top=3):
+    """Most expensive parts of every suite's setup, the candidates for sharing or proxying across deployments."""
+    if components.empty:
+        return components
+    contracts = components[components['Stage'] == 'Deployment']
+    # Gas does not depend on the network, so the average over networks ranks the contracts
+    ranked = contracts.groupby(['Source', 'Contract'], observed=True)[['Gas', 'Gas share']].mean().reset_index()
+    ranked = ranked.sort_values(['Source', 'Gas'], ascending=[True, False])
+    return ranked.groupby('Source', observed=True).head(top).reset_index(drop=True)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+from streaming_stats import RunningStats
+
+# Metric whose sample distributions are charted
+DISTRIBUTION_METRIC = 'Latency (ms)'
+KEY_COLUMNS = ['Operation', 'Blockchain', 'Category', 'Subcategory']
+# Percentiles 0 to 100, enough for box stats and a smooth ECDF whatever the sample count
+QUANTILES = np.linspace(0, 1, 101)
+QUANTILE_COLUMNS = [f'p{i}' for i in range(101)]
+HISTOGRAM_BINS = 40
+# Groups drawn on one axis before the chart is split into facets
+FACET_SIZE = 12
+
+def group_sketches(df, metric=DISTRIBUTION_METRIC, keys=KEY_COLUMNS):
+    """Running statistics with a quantile sketch of the metric for every group of raw samples."""
+    sketches = {}
+    if df.empty or metric not in df.columns:
+        return sketches
+    for key, values in df.groupby(keys, observed=True)[metric]:
+        running = RunningStats()
+        running.update(values.to_numpy(dtype=np.float64))
+        if running.count > 0:
+            sketches[key] = running
+    return sketches
+
+def pool_sketches(sketches, key_function):
+    """Merge the sketches of groups mapped to the same key, e.g. every implementation of an operation."""
+    pooled = {}
+    for key, running in sketches.items():
+        pooled.setdefault(key_function(key), RunningStats()).merge(running)
+    return pooled
+
+def quantile_table(sketches, key_columns=KEY_COLUMNS):
+    """One row per group: count, mean, exact range and the percentile grid."""
+    rows = []
+    for key in sorted(sketches):
+        running = sketches[key]
+        key = key if isinstance(key, tuple) else (key,)
+        rows.append(list(key) + [running.count, running.mean, running.min, running.max] + list(running.quantiles(QUANTILES)))
+    return pd.DataFrame(rows, columns=key_columns + ['Count', 'Mean', 'Min', 'Max'] + QUANTILE_COLUMNS)
+
+def shared_edges(low, high, bins=HISTOGRAM_BINS):
+    """Bin edges covering a range, logarithmic for positive ranges spanning more than a factor of ten."""
+    if high <= low:
+        high = low + 1
+    if low > 0 and high / low > 10:
+        return np.geomspace(low, high, bins + 1)
+    return np.linspace(low, high, bins + 1)
+
+def histogram_table(sketches, key_columns=KEY_COLUMNS, bins=HISTOGRAM_BINS):
+    """Sample counts per bin of every group, the groups of one operation and network share their bin edges."""
+    rows = []
+    # Networks are orders of magnitude apart, shared edges across them would leave most bins empty
+    panels = {}
+    for key, running in sketches.items():
+        panels.setdefault(key[:2], []).append(running)
+    edges_by_panel = {panel: shared_edges(min(r.min for r in runs), max(r.max for r in runs), bins)
+                      for panel, runs in panels.items()}
+    for key in sorted(sketches):
+        edges = edges_by_panel[key[:2]]
+        counts = sketches[key].sketch.histogram(edges)
+        for index, count in enumerate(counts):
+            rows.append(list(key) + [index, edges[index], edges[index + 1], count])
+    return pd.DataFrame(rows, columns=key_columns + ['Bin', 'Low', 'High', 'Count'])
+
+def distribution_tables(sketches):
+    """Percentiles per group and pooled per operation and network, and the histograms per group."""
+    pooled = pool_sketches(sketches, lambda key: key[:2])
+    return {'groups': quantile_table(sketches), 'pooled': quantile_table(pooled, ['Operation', 'Blockchain']),
+            'histograms': histogram_table(sketches)}
+
+def box_stats(row, label):
+    """Box plot statistics for matplotlib's bxp() from a row of the quantile table."""
+    q1, median, q3 = row['p25'], row['p50'], row['p75']
+    iqr = q3 - q1
+    grid = row[QUANTILE_COLUMNS].to_numpy(dtype=np.float64)
+    # Whiskers end at the most extreme percentiles within 1.5 IQR of the box, as in a raw box plot
+    inside = grid[(grid >= q1 - 1.5 * iqr) & (grid <= q3 + 1.5 * iqr)]
+    return {'label': label, 'med': median, 'q1': q1, 'q3': q3, 'mean': row['Mean'],
+            'whislo': inside.min() if len(inside) else q1, 'whishi': inside.max() if len(inside) else q3, 'fliers': []}
+
+def facets(items, size=FACET_SIZE):
+    """Split a list of groups into facets of at most `size` groups of about equal length."""
+    if len(items) <= size:
+        return [items]
+    count = -(-len(items) // size)
+    step = -(-len(items) // count)
+    return [items[start:start + step] for start in range(0, len(items), step)]
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import argparse
+import numpy as np
+import pandas as pd
+from run_history import parse_run_columns
+from results_log import RESULTS_LOG, read_log
+from loadgen.config import DEFAULT_RPC_URLS, network_name
+
+PROFILE_DIR = 'gas_profile'
+BREAKDOWN_FILE = 'csv_output/gas_breakdown.csv'
+CALL_OPCODES = {'CALL', 'CALLCODE', 'DELEGATECALL', 'STATICCALL'}
+CREATE_OPCODES = {'CREATE', 'CREATE2'}
+# Gas charged outside the opcodes: the 21000 base cost, calldata and the storage refund
+INTRINSIC_FRAME = '[transaction]'
+INTRINSIC_CLASS = 'intrinsic'
+TRACE_OPTIONS = {'disableMemory': True, 'disableStorage': True, 'enableReturnData': False}
+
+OPCODE_CLASSES = {
+    'storage': {'SLOAD', 'SSTORE', 'TLOAD', 'TSTORE'},
+    'call': CALL_OPCODES,
+    'create': CREATE_OPCODES | {'SELFDESTRUCT'},
+    'log': {'LOG0', 'LOG1', 'LOG2', 'LOG3', 'LOG4'},
+    'hash': {'SHA3', 'KECCAK256'},
+    'memory': {'MLOAD', 'MSTORE', 'MSTORE8', 'MCOPY', 'MSIZE', 'CALLDATACOPY', 'CODECOPY', 'RETURNDATACOPY',
+               'EXTCODECOPY'},
+    'environment': {'ADDRESS', 'BALANCE', 'ORIGIN', 'CALLER', 'CALLVALUE', 'CALLDATALOAD', 'CALLDATASIZE',
+                    'CODESIZE', 'GASPRICE', 'EXTCODESIZE', 'EXTCODEHASH', 'RETURNDATASIZE', 'BLOCKHASH', 'COINBASE',
+                    'TIMESTAMP', 'NUMBER', 'DIFFICULTY', 'PREVRANDAO', 'GASLIMIT', 'CHAINID', 'SELFBALANCE', 'BASEFEE',
+                    'BLOBHASH', 'BLOBBASEFEE', 'GAS'},
+    'control': {'STOP', 'JUMP', 'JUMPI', 'JUMPDEST', 'PC', 'RETURN', 'REVERT', 'INVALID'},
+}
+OPCODE_CLASS = {opcode: name for name, opcodes in OPCODE_CLASSES.items() for opcode in opcodes}
+
+def opcode_class(opcode):
+    """Class of an opcode, stack manipulation and arithmetic fall into stack and compute."""
+    opcode = opcode.upper()
+    if opcode in OPCODE_CLASS:
+        return OPCODE_CLASS[opcode]
+    if opcode.startswith(('PUSH', 'DUP', 'SWAP')) or opcode == 'POP':
+        return 'stack'
+    return 'compute'
+
+def contract_names(implementation_dir, network):
+    """Lower-case address to contract name of every contract deployed by an implementation."""
+    with open(os.path.join(implementation_dir, 'deployment-addresses.json')) as f:
+        deployments = json.load(f)
+    contracts = deployments.get(network, {}).get('deployment', {}).get('contracts', {})
+    return {contract['address'].lower(): name for name, contract in contracts.items()
+            if isinstance(contract, dict) and 'address' in contract}
+
+def stack_address(stack, position):
+    """Address held at a position from the top of a traced EVM stack."""
+    value = stack[-position]
+    value = int(value, 16) if isinstance(value, str) else int(value)
+    return f"0x{value & ((1 << 160) - 1):040x}"
+
+def profile_trace(struct_logs, root, names):
+    """Gas of one traced transaction by call frame path and opcode class."""
+    # A step costs the gas difference to the next step of its own frame, a call step what the call
+    # took minus what its callee used, so every unit of gas is counted in exactly one frame
+    profile = {}
+    if not struct_logs:
+        return profile
+
+    def add(path, opclass, gas):
+        profile[(path, opclass)] = profile.get((path, opclass), 0) + gas
+
+    # Frame entries: (path, index of the call step in the caller, gas at entry)
+    frames = [((root,), None, struct_logs[0]['gas'])]
+    for i, step in enumerate(struct_logs):
+        path = frames[-1][0]
+        op = step['op']
+        following = struct_logs[i + 1] if i + 1 < len(struct_logs) else None
+        if following is None:
+            add(path, opcode_class(op), step['gasCost'])
+        elif following['depth'] > step['depth']:
+            if op in CALL_OPCODES:
+                callee = names.get(stack_address(step['stack'], 2), stack_address(step['stack'], 2))
+            else:
+                callee = 'new contract'
+            frames.append((path + (callee,), i, following['gas']))
+        elif following['depth'] < step['depth']:
+            # The callee returns: its last step, then the call overhead left in the caller
+            add(path, opcode_class(op), step['gasCost'])
+            _, call_index, entry_gas = frames.pop()
+            callee_used = entry_gas - (step['gas'] - step['gasCost'])
+            call_step = struct_logs[call_index]
+            add(frames[-1][0], opcode_class(call_step['op']), call_step['gas'] - following['gas'] - callee_used)
+        else:
+            add(path, opcode_class(op), step['gas'] - following['gas'])
+    return profile
+
+def trace_transaction(w3, tx_hash):
+    """Struct logs of a transaction replayed by the node."""
+    response = w3.manager.request_blocking('debug_traceTransaction', [tx_hash, TRACE_OPTIONS])
+    return response['structLogs']
+
+def sample_blocks(implementation_dir, network, operations=None, samples=5):
+    """Blocks of up to `samples` results of every operation from the most recent run on a network."""
+    frames = []
+    csv_file = os.path.join(implementation_dir, 'results.csv')
+    if os.path.exists(csv_file):
+        df = pd.read_csv(csv_file)
+        df.columns = df.columns.str.strip()
+        df = parse_run_columns(df.dropna(how='all'))
+        if 'Block' in df.columns:
+            df['Operation'] = df['Operation'].str.strip()
+            df['Blockchain'] = df['Blockchain'].str.strip()
+            frames.append(df)
+    log_file = os.path.join(implementation_dir, RESULTS_LOG)
+    if os.path.exists(log_file):
+        frames.append(read_log(log_file).astype({'Operation': str, 'Blockchain': str}))
+    if not frames:
+        return []
+
+    df = pd.concat(frames, ignore_index=True)
+    df = df[(df['Blockchain'].str.lower() == network) & df['Block'].notna()]
+    if operations:
+        df = df[df['Operation'].str.lower().isin([op.lower() for op in operations])]
+    picked = []
+    for operation, rows in df.groupby('Operation', sort=True):
+        # A node restart discards older blocks, the latest run is the one most likely still on chain
+        if rows['Timestamp'].notna().any():
+            rows = rows[rows['Run ID'] == rows.loc[rows['Timestamp'].idxmax(), 'Run ID']]
+        positions = np.unique(np.linspace(0, len(rows) - 1, min(samples, len(rows))).round().astype(int))
+        for _, row in rows.iloc[positions].iterrows():
+            batch_size = int(row['Batch Size']) if pd.notna(row.get('Batch Size')) else 1
+            picked.append((operation, int(row['Block']), batch_size))
+    return picked
+
+def find_deployments(w3, names, last_block):
+    """Creation transactions of the known contracts within the first blocks of the chain."""
+    found = []
+    for number in range(0, last_block + 1):
+        block = w3.eth.get_block(number, full_transactions=True)
+        for tx in block['transactions']:
+            if tx['to'] is not None:
+                continue
+            receipt = w3.eth.get_transaction_receipt(tx['hash'])
+            address = (receipt['contractAddress'] or '').lower()
+            if address in names:
+                found.append((names[address], tx['hash'], receipt['gasUsed']))
+        if len(found) == len(names):
+            break
+    return found
+
+def profile_implementation(w3, implementation_dir, network, operations=None, samples=5, deployments=False,
+                           scan_blocks=500):
+    """Average gas per transaction of every sampled operation by operation, frame path and opcode class."""
+    names = contract_names(implementation_dir, network)
+    totals = {}
+    counts = {}
+
+    def accumulate(operation, struct_logs, root, gas_used):
+        profile = profile_trace(struct_logs, root, names)
+        traced = sum(profile.values())
+        profile[((root, INTRINSIC_FRAME), INTRINSIC_CLASS)] = gas_used - traced
+        counts[operation] = counts.get(operation, 0) + 1
+        for key, gas in profile.items():
+            totals[(operation,) + key] = totals.get((operation,) + key, 0) + gas
+
+    for operation, number, batch_size in sample_blocks(implementation_dir, network, operations, samples):
+        try:
+            block = w3.eth.get_block(number, full_transactions=True)
+        except Exception as e:
+            print(f"Skipping {operation} in block {number}: {e}")
+            continue
+        transactions = [tx for tx in block['transactions'] if tx['to'] is not None and tx['to'].lower() in names]
+        if not transactions:
+            print(f"Skipping {operation} in block {number}: no transaction to a contract of {implementation_dir}, "
+                  f"the node was probably restarted since the run")
+            continue
+        for tx in transactions:
+            receipt = w3.eth.get_transaction_receipt(tx['hash'])
+            label = operation if batch_size == 1 or operation.endswith(f' x{batch_size}') else f'{operation} x{batch_size}'
+            accumulate(label, trace_transaction(w3, w3.to_hex(tx['hash'])), names[tx['to'].lower()], receipt['gasUsed'])
+
+    if deployments and (not operations or any(op.lower() == 'deployment' for op in operations)):
+        last_block = min(w3.eth.block_number, scan_blocks)
+        for name, tx_hash, gas_used in find_deployments(w3, names, last_block):
+            accumulate('Deployment', trace_transaction(w3, w3.to_hex(tx_hash)), name, gas_used)
+
+    return pd.DataFrame([
+        {'Operation': operation, 'Frame': ';'.join(path), 'Contract': path[-1], 'Opcode class': opclass,
+         'Transactions': counts[operation], 'Gas': gas / counts[operation]}
+        for (operation, path, opclass), gas in totals.items()
+    ])
+
+def write_folded(profile_df, source, output_dir=PROFILE_DIR):
+    """Flamegraph folded stacks (frame;frame;class gas) of every operation of an implementation."""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for operation, rows in profile_df.groupby('Operation', sort=True):
+        file_name = f"{source.replace('/', '_')}_{operation.replace(' ', '_')}.folded"
+        path = os.path.join(output_dir, file_name)
+        with open(path, 'w') as f:
+            for _, row in rows.sort_values('Frame').iterrows():
+                gas = int(round(row['Gas']))
+                # Flamegraph tools only take positive counts, a net storage refund stays in the CSV
+                if gas > 0:
+                    f.write(f"{operation};{row['Frame']};{row['Opcode class']} {gas}\n")
+        written.append(path)
+    return written
+
+def breakdown_table(profile_df):
+    """Gas per contract and opcode class with its share of the operation's average gas."""
+    table = profile_df.groupby(['Source', 'Blockchain', 'Operation', 'Contract', 'Opcode class'],
+                               as_index=False, observed=True).agg(Transactions=('Transactions', 'max'), Gas=('Gas', 'sum'))
+    operation_gas = table.groupby(['Source', 'Blockchain', 'Operation'])['Gas'].transform('sum')
+    table['Share (%)'] = 100 * table['Gas'] / operation_gas
+    return table.sort_values(['Source', 'Operation', 'Gas'], ascending=[True, True, False], ignore_index=True)
+
+def print_breakdown(table):
+    """Contract by opcode class pivot of every profiled implementation and operation."""
+    for (source, operation), rows in table.groupby(['Source', 'Operation'], sort=True):
+        pivot = rows.pivot_table(index='Contract', columns='Opcode class', values='Gas', aggfunc='sum', fill_value=0)
+        pivot['total'] = pivot.sum(axis=1)
+        pivot = pivot.sort_values('total', ascending=False)
+        print(f"\n{source} - {operation} ({int(rows['Transactions'].max())} transactions, "
+              f"{rows['Gas'].sum():.0f} gas on average)")
+        print(pivot.round(0).astype(int).to_string())
+
+def parse_args(argv=None):
+    """Parse the implementations to profile and the node to replay them on."""
+    parser = argparse.ArgumentParser(
+        description='Replay sampled benchmark transactions with debug_traceTransaction and break down their gas.')
+    parser.add_argument('implementations', nargs='+', help='implementation directories (e.g. ERC3643/TREX)')
+    parser.add_argument('--network', default='hardhat', help='network of the results and deployments (default: hardhat)')
+    parser.add_argument('--rpc-url', help='RPC endpoint with the debug namespace (default: the local Hardhat node)')
+    parser.add_argument('--operation', nargs='+', help='only profile these operations')
+    parser.add_argument('--samples', type=int, default=5, help='transactions traced per operation (default: 5)')
+    parser.add_argument('--deployments', action='store_true', help='also trace the contract deployments')
+    parser.add_argument('--scan-blocks', type=int, default=500,
+                        help='blocks searched for deployment transactions (default: 500)')
+    parser.add_argument('--output-dir', default=PROFILE_DIR, help=f'folded stacks directory (default: {PROFILE_DIR})')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Profile every implementation and write folded stacks and the breakdown table."""
+    args = parse_args(argv)
+    network = network_name(args.network)
+    rpc_url = args.rpc_url or DEFAULT_RPC_URLS.get(network)
+    if rpc_url is None:
+        print(f"No RPC URL known for network {network}, pass --rpc-url")
+        return 2
+
+    # Imported here so the module can be read without web3 installed
+    from web3 import Web3
+    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    profiles = []
+    for implementation_dir in args.implementations:
+        source = '/'.join(os.path.normpath(implementation_dir).split(os.sep)[-2:])
+        try:
+            profile_df = profile_implementation(w3, implementation_dir, network, args.operation, args.samples,
+                                                args.deployments, args.scan_blocks)
+        except Exception as e:
+            print(f"Error profiling {implementation_dir}: {e}")
+            continue
+        if profile_df.empty:
+            print(f"No transactions of {source} could be traced on {network}")
+            continue
+        for path in write_folded(profile_df, source, args.output_dir):
+            print(f"Folded stacks written to {path}")
+        profiles.append(profile_df.assign(Source=source, Blockchain=network))
+
+    if not profiles:
+        return 1
+    table = breakdown_table(pd.concat(profiles, ignore_index=True))
+    os.makedirs(os.path.dirname(BREAKDOWN_FILE), exist_ok=True)
+    table.to_csv(BREAKDOWN_FILE, index=False)
+    print_breakdown(table)
+    print(f"\nGas breakdown saved to {BREAKDOWN_FILE}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
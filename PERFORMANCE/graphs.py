@@ -1,21 +1,63 @@
 #! /usr/bin/python3
 
 import os
+import sys
+import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import matplotlib.pyplot as plt
-import seaborn as sns
 import json
+from render_cache import RenderCache, script_version
+from streaming_stats import RunningStats
+from compact_dataset import compact_dataframe, exact_integer_values, memory_footprint
+from bootstrap_stats import compute_bootstrap_intervals, compute_pairwise_tests
+from baselines import (save_baseline, load_baseline, compare_to_baseline, write_regression_report,
+                       plot_regression_diff, DEFAULT_TOLERANCES)
+from run_history import PHASE_COLUMNS, schema_version, parse_run_columns, downsample_trend
+from warmup import WARMUP_METHODS, classify_warmup, compute_phase_statistics, phase_columns
+from batch_costs import (per_transfer_costs, single_transfer_costs, fit_batch_costs, grouping_keys, invalid_batch_sizes,
+                         batch_size_column)
+from contract_costs import parse_deployment_file, setup_components, largest_components
+from results_log import RESULTS_LOG, open_log, records_frame
+from instrumentation import Instrumentation, activate, TIMINGS_FILE, PROFILE_DIR
+from distributions import (DISTRIBUTION_METRIC, QUANTILES, QUANTILE_COLUMNS, FACET_SIZE, group_sketches,
+                           pool_sketches, distribution_tables, box_stats, facets)
+from outliers import METRICS as OUTLIER_METRICS, OUTLIER_MODES, THRESHOLD, OutlierAnalysis, annotate_outliers, drop_outliers
 
-def find_data_files(base_path):
-    """Find all results.csv and deployment-addresses.json files in the directory structure."""
-    data_files = {'csv': [], 'json': []}
+CHART_FAMILIES = ['transaction', 'deployment', 'operation', 'erc', 'trend', 'warmup', 'batch', 'throughput', 'phases',
+                  'contracts', 'compliance', 'distributions']
+SETUP_OPERATIONS = ['Deployment', 'Initialization']
+METRICS = ['Gas', 'Fee (weis)', 'Latency (ms)']
+GROUP_COLUMNS = ['Operation', 'Blockchain', 'Category', 'Subcategory', 'DataType']
+# Streamed chunks always get a batch size, whatever the schema of their file
+STREAMING_COLUMNS = GROUP_COLUMNS + ['Batch Size']
+DATA_COLUMNS = ['Operation', 'Gas', 'Fee (weis)', 'Latency (ms)', 'Blockchain', 'Category', 'Subcategory', 'Source', 'DataType']
+
+def matches_filter(value, selected):
+    """Check a value against an optional case-insensitive selection."""
+    if not selected:
+        return True
+    return str(value).strip().lower() in {str(s).strip().lower() for s in selected}
+
+def find_data_files(base_path, categories=None, subcategories=None):
+    """Find all results.csv, results.log and deployment-addresses.json files in the directory structure."""
+    data_files = {'csv': [], 'log': [], 'json': [], 'openloop': []}
     for root, dirs, files in os.walk(base_path):
+        # Prune category (ERC) and subcategory (implementation) directories outside the selection
+        depth = len(Path(os.path.relpath(root, base_path)).parts) if root != base_path else 0
+        if depth == 0:
+            dirs[:] = [d for d in dirs if matches_filter(d, categories)]
+        elif depth == 1:
+            dirs[:] = [d for d in dirs if matches_filter(d, subcategories)]
         if 'results.csv' in files:
             data_files['csv'].append(os.path.join(root, 'results.csv'))
+        if RESULTS_LOG in files:
+            data_files['log'].append(os.path.join(root, RESULTS_LOG))
         if 'deployment-addresses.json' in files:
             data_files['json'].append(os.path.join(root, 'deployment-addresses.json'))
+        if 'loadgen_openloop.csv' in files:
+            data_files['openloop'].append(os.path.join(root, 'loadgen_openloop.csv'))
     return data_files
 
 def extract_directory_info(file_path):
@@ -29,10 +71,13 @@ def extract_directory_info(file_path):
         return category, subcategory
     return None, None
 
-def load_and_process_data(data_files):
+def load_and_process_data(data_files, blockchains=None, operations=None):
     """Load all CSV and JSON files and add directory information."""
     all_data = []
     
+    # Deployment files only hold Deployment and Initialization rows
+    load_setup = not operations or any(matches_filter(op, operations) for op in SETUP_OPERATIONS)
+    
     # Process CSV files
     for csv_file in data_files['csv']:
         try:
@@ -42,10 +87,31 @@ def load_and_process_data(data_files):
             # Clean column names (remove extra spaces)
             df.columns = df.columns.str.strip()
             
+            # Drop blank lines and keep gas and fees exact even beyond int64
+            df = df.dropna(how='all')
+            for metric in ['Gas', 'Fee (weis)']:
+                if metric in df.columns:
+                    df[metric] = exact_integer_values(df[metric])
+            
             # Clean blockchain column values (remove extra spaces)
             if 'Blockchain' in df.columns:
                 df['Blockchain'] = df['Blockchain'].str.strip()
             
+            # Schema v2 files also carry the run, time, iteration, block and batch size of every sample
+            df = parse_run_columns(df)
+            
+            # A batch size that did not parse was sent as an empty batch, its costs are not a batch of any size
+            invalid = invalid_batch_sizes(df)
+            if invalid.any():
+                print(f"Skipped {invalid.sum()} rows of {csv_file} without a valid batch size")
+                df = df[~invalid]
+            
+            # Keep only the selected networks and operations
+            if blockchains and 'Blockchain' in df.columns:
+                df = df[df['Blockchain'].str.lower().isin([b.lower() for b in blockchains])]
+            if operations and 'Operation' in df.columns:
+                df = df[df['Operation'].str.strip().str.lower().isin([op.lower() for op in operations])]
+            
             # Extract directory information
             category, subcategory = extract_directory_info(csv_file)
             
@@ -56,13 +122,29 @@ def load_and_process_data(data_files):
             df['DataType'] = 'Transaction'
             
             all_data.append(df)
-            print(f"Loaded {len(df)} transaction records from {csv_file}")
+            print(f"Loaded {len(df)} transaction records from {csv_file} (schema v{schema_version(df)})")
             
         except Exception as e:
             print(f"Error loading {csv_file}: {e}")
     
+    # Process binary results logs, filtered on the memory map before any row is copied
+    for log_file in data_files.get('log', []):
+        try:
+            df = records_frame(open_log(log_file), blockchains, operations)
+            category, subcategory = extract_directory_info(log_file)
+            df['Gas'] = exact_integer_values(df['Gas'])
+            df['Fee (weis)'] = exact_integer_values(df['Fee (weis)'])
+            df['Category'] = category
+            df['Subcategory'] = subcategory
+            df['Source'] = f"{category}/{subcategory}"
+            df['DataType'] = 'Transaction'
+            all_data.append(df)
+            print(f"Loaded {len(df)} transaction records from {log_file}")
+        except Exception as e:
+            print(f"Error loading {log_file}: {e}")
+    
     # Process JSON files
-    for json_file in data_files['json']:
+    for json_file in data_files['json'] if load_setup else []:
         try:
             with open(json_file, 'r') as f:
                 data = json.load(f)
@@ -73,11 +155,11 @@ def load_and_process_data(data_files):
             # Process each network in the JSON file
             for network_name, network_data in data.items():
                 # Skip if network_data is not a dictionary
-                if not isinstance(network_data, dict):
+                if not isinstance(network_data, dict) or not matches_filter(network_name, blockchains):
                     continue
                 
                 # Extract deployment metrics from JSON
-                if 'deployment' in network_data and 'metrics' in network_data['deployment']:
+                if matches_filter('Deployment', operations) and 'deployment' in network_data and 'metrics' in network_data['deployment']:
                     metrics = network_data['deployment']['metrics']
                     
                     # Create a dataframe row from deployment metrics
@@ -97,11 +179,12 @@ def load_and_process_data(data_files):
                     
                     # Create DataFrame with single row
                     df = pd.DataFrame([row_data])
+                    df['Fee (weis)'] = exact_integer_values(df['Fee (weis)'])
                     all_data.append(df)
                     print(f"Loaded 1 deployment record from {json_file} (network: {network_name})")
                 
                 # Extract initialization metrics from JSON if available
-                if 'initialization' in network_data and 'metrics' in network_data['initialization']:
+                if matches_filter('Initialization', operations) and 'initialization' in network_data and 'metrics' in network_data['initialization']:
                     init_metrics = network_data['initialization']['metrics']
                     
                     # Create a dataframe row from initialization metrics
@@ -121,62 +204,203 @@ def load_and_process_data(data_files):
                     
                     # Create DataFrame with single row
                     init_df = pd.DataFrame([init_row_data])
+                    init_df['Fee (weis)'] = exact_integer_values(init_df['Fee (weis)'])
                     all_data.append(init_df)
                     print(f"Loaded 1 initialization record from {json_file} (network: {network_name})")
                 
         except Exception as e:
             print(f"Error loading {json_file}: {e}")
     
-    # Combine all data
+    # Combine all data into the compact representation
     if all_data:
         combined_df = pd.concat(all_data, ignore_index=True)
-        return combined_df
+        # v1 and setup rows get the batch size they were measured with, so every row has one to group on
+        combined_df['Batch Size'] = batch_size_column(combined_df)
+        return compact_dataframe(combined_df)
     else:
         return pd.DataFrame()
 
+def load_open_loop_results(openloop_files, blockchains=None):
+    """Load the latency-throughput steps written by the open-loop load generator."""
+    curves = []
+    for openloop_file in openloop_files:
+        try:
+            df = pd.read_csv(openloop_file, skipinitialspace=True)
+            df.columns = df.columns.str.strip()
+            if blockchains:
+                df = df[df['Blockchain'].str.lower().isin([b.lower() for b in blockchains])]
+            category, subcategory = extract_directory_info(openloop_file)
+            df['Source'] = f"{category}/{subcategory}"
+            curves.append(df)
+            print(f"Loaded {len(df)} open-loop steps from {openloop_file}")
+        except Exception as e:
+            print(f"Error loading {openloop_file}: {e}")
+    return pd.concat(curves, ignore_index=True) if curves else pd.DataFrame()
+
+def load_contract_costs(json_files, blockchains=None):
+    """Load the gas and fee of every contract deployed by each implementation's setup."""
+    contracts = []
+    for json_file in json_files:
+        try:
+            df = parse_deployment_file(json_file, blockchains)
+            category, subcategory = extract_directory_info(json_file)
+            df['Category'] = category
+            df['Subcategory'] = subcategory
+            df['Source'] = f"{category}/{subcategory}"
+            contracts.append(df)
+            print(f"Loaded {(df['Stage'] == 'Deployment').sum()} contract deployments from {json_file}")
+        except Exception as e:
+            print(f"Error loading {json_file}: {e}")
+    return pd.concat(contracts, ignore_index=True) if contracts else pd.DataFrame()
+
 def compute_statistics(df):
-    """Compute average, max, and min for each metric by operation, blockchain, and source."""
+    """Compute average, max, and min for each metric by operation, blockchain, source and batch size."""
     
-    # Group by Operation, Blockchain, Category, Subcategory, and DataType
-    grouped = df.groupby(['Operation', 'Blockchain', 'Category', 'Subcategory', 'DataType'])
+    # Group by Operation, Blockchain, Category, Subcategory, DataType and the Batch Size when recorded
+    keys = grouping_keys(GROUP_COLUMNS, df)
+    grouped = df.groupby(keys, observed=True)
     
     # Define the metrics to analyze
     metrics = ['Gas', 'Fee (weis)', 'Latency (ms)']
     
     results = []
     
-    for (operation, blockchain, category, subcategory, data_type), group in grouped:
-        result = {
-            'Operation': operation,
-            'Blockchain': blockchain,
-            'Category': category,
-            'Subcategory': subcategory,
-            'DataType': data_type,
-            'Source': f"{category}/{subcategory}",
-            'Count': len(group)
-        }
+    for key, group in grouped:
+        result = dict(zip(keys, key))
+        result['Source'] = f"{result['Category']}/{result['Subcategory']}"
+        result['Count'] = len(group)
         
         for metric in metrics:
             if metric in group.columns:
                 values = group[metric].dropna()
+                if values.dtype == np.float32:
+                    values = values.astype(np.float64)
                 if len(values) > 0:
                     result[f'{metric}_avg'] = values.mean()
                     result[f'{metric}_max'] = values.max()
                     result[f'{metric}_min'] = values.min()
                     result[f'{metric}_std'] = values.std()
+                    result[f'{metric}_p50'] = values.median()
+                    result[f'{metric}_p95'] = values.quantile(0.95)
                 else:
                     result[f'{metric}_avg'] = np.nan
                     result[f'{metric}_max'] = np.nan
                     result[f'{metric}_min'] = np.nan
                     result[f'{metric}_std'] = np.nan
+                    result[f'{metric}_p50'] = np.nan
+                    result[f'{metric}_p95'] = np.nan
         
+        # Average latency phases of schema v3 samples
+        for phase in PHASE_COLUMNS:
+            if phase in group.columns and group[phase].notna().any():
+                result[f'{phase}_avg'] = group[phase].astype(np.float64).mean()
+        
+        results.append(result)
+    
+    return pd.DataFrame(results)
+
+def compute_streaming_statistics(data_files, blockchains=None, operations=None, chunksize=100000, aggregates=None):
+    """Compute the statistics of compute_statistics() reading results.csv files in bounded chunks."""
+    # Running statistics per group and metric, filled into the caller's dict when one is given
+    aggregates = {} if aggregates is None else aggregates
+    counts = {}
+    
+    def feed(frame):
+        # Every streamed row gets a batch size, like the rows of load_and_process_data()
+        frame = frame.assign(**{'Batch Size': batch_size_column(frame)})
+        for key, group in frame.groupby(STREAMING_COLUMNS, observed=True):
+            counts[key] = counts.get(key, 0) + len(group)
+            group_stats = aggregates.setdefault(key, {metric: RunningStats() for metric in METRICS})
+            for metric in METRICS:
+                if metric in group.columns:
+                    group_stats[metric].update(pd.to_numeric(group[metric], errors='coerce').to_numpy(dtype=np.float64))
+    
+    # Stream transaction files chunk by chunk, only the running aggregates are kept
+    for csv_file in data_files['csv']:
+        category, subcategory = extract_directory_info(csv_file)
+        rows = 0
+        try:
+            for chunk in pd.read_csv(csv_file, chunksize=chunksize):
+                chunk.columns = chunk.columns.str.strip()
+                # Blank lines would otherwise turn a whole chunk into float columns
+                chunk = chunk.dropna(how='all')
+                chunk = chunk[~invalid_batch_sizes(chunk)]
+                if chunk.empty:
+                    continue
+                if 'Blockchain' in chunk.columns:
+                    chunk['Blockchain'] = chunk['Blockchain'].str.strip()
+                if blockchains and 'Blockchain' in chunk.columns:
+                    chunk = chunk[chunk['Blockchain'].str.lower().isin([b.lower() for b in blockchains])]
+                if operations and 'Operation' in chunk.columns:
+                    chunk = chunk[chunk['Operation'].str.strip().str.lower().isin([op.lower() for op in operations])]
+                chunk = chunk.assign(Category=category, Subcategory=subcategory, DataType='Transaction')
+                feed(chunk)
+                rows += len(chunk)
+            print(f"Streamed {rows} transaction records from {csv_file}")
+        except Exception as e:
+            print(f"Error streaming {csv_file}: {e}")
+    
+    # Results logs are mapped, so a chunk is just a slice of the records
+    for log_file in data_files.get('log', []):
+        category, subcategory = extract_directory_info(log_file)
+        rows = 0
+        try:
+            records = open_log(log_file)
+            for start in range(0, len(records), chunksize):
+                chunk = records_frame(records[start:start + chunksize], blockchains, operations)
+                if chunk.empty:
+                    continue
+                feed(chunk.assign(Category=category, Subcategory=subcategory, DataType='Transaction'))
+                rows += len(chunk)
+            print(f"Streamed {rows} transaction records from {log_file}")
+        except Exception as e:
+            print(f"Error streaming {log_file}: {e}")
+    
+    # Deployment files hold one row per network, they are loaded as usual
+    setup_df = load_and_process_data({'csv': [], 'json': data_files['json']}, blockchains, operations)
+    if not setup_df.empty:
+        feed(setup_df)
+    
+    results = []
+    for key in sorted(aggregates):
+        group_stats = aggregates[key]
+        result = dict(zip(STREAMING_COLUMNS, key))
+        result['Source'] = f"{result['Category']}/{result['Subcategory']}"
+        result['Count'] = counts[key]
+        for metric in METRICS:
+            running = group_stats[metric]
+            has_values = running.count > 0
+            result[f'{metric}_avg'] = running.mean if has_values else np.nan
+            result[f'{metric}_max'] = running.max if has_values else np.nan
+            result[f'{metric}_min'] = running.min if has_values else np.nan
+            result[f'{metric}_std'] = running.std()
+            result[f'{metric}_p50'] = running.quantile(0.5)
+            result[f'{metric}_p95'] = running.quantile(0.95)
         results.append(result)
     
     return pd.DataFrame(results)
 
-def create_visualizations(df, stats_df):
+def ci_error_bars(data, pivot, metric, index='Source', columns='Blockchain'):
+    """Asymmetric error bars for a pivot of averages from the bootstrap CI columns, or None."""
+    low_column, high_column = f'{metric}_mean_ci_low', f'{metric}_mean_ci_high'
+    if low_column not in data.columns or pivot.empty:
+        return None
+    low = data.pivot_table(index=index, columns=columns, values=low_column, observed=True)
+    high = data.pivot_table(index=index, columns=columns, values=high_column, observed=True)
+    low = low.reindex(index=pivot.index, columns=pivot.columns)
+    high = high.reindex(index=pivot.index, columns=pivot.columns)
+    lower = (pivot - low).clip(lower=0).fillna(0)
+    upper = (high - pivot).clip(lower=0).fillna(0)
+    # pandas expects (columns, 2, rows) for asymmetric errors on a DataFrame
+    return np.stack([lower.T.values, upper.T.values], axis=1)
+
+def create_visualizations(df, stats_df, use_cache=True, families=None, formats=('pdf', 'png'), dpi=300, show=True,
+                          max_points=2000, batch_costs=None, batch_fit=None, curves=None, setup_costs=None,
+                          outlier_threshold=THRESHOLD, distributions=None):
     """Create various visualizations for the data in separate windows."""
     
+    families = families or CHART_FAMILIES
+    
     # Set style
     plt.style.use('seaborn-v0_8')
     
@@ -187,6 +411,15 @@ def create_visualizations(df, stats_df):
     os.makedirs(graphs_dir, exist_ok=True)
     os.makedirs(individual_charts_dir, exist_ok=True)
     
+    # Charts whose fingerprint (data slice, parameters, script version) is unchanged are not redrawn
+    version = script_version(os.path.abspath(__file__))
+    window_formats = ('png',) if 'png' in formats else formats
+    graphs_cache = RenderCache(graphs_dir, version, formats=window_formats, dpi=dpi, enabled=use_cache)
+    individual_cache = RenderCache(individual_charts_dir, version, formats=formats, dpi=dpi, enabled=use_cache)
+    
+    # Log or linear axes, decided once per data slice from its median and MAD
+    scales = OutlierAnalysis(outlier_threshold)
+    
     # Separate data by type
     transaction_stats = stats_df[stats_df['DataType'] == 'Transaction'].copy()
     deployment_stats = stats_df[stats_df['DataType'].isin(['Deployment', 'Initialization'])].copy()
@@ -194,7 +427,7 @@ def create_visualizations(df, stats_df):
     deployment_data = df[df['DataType'].isin(['Deployment', 'Initialization'])].copy()
     
     # Create Transaction Operations Window
-    if not transaction_stats.empty:
+    if 'transaction' in families and not transaction_stats.empty:
         fig1, axes1 = plt.subplots(2, 3, figsize=(20, 12))
         fig1.suptitle('Transaction Operations Performance Analysis', fontsize=16, fontweight='bold')
         
@@ -212,16 +445,18 @@ def create_visualizations(df, stats_df):
         ax1.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
         
         # Save individual chart
-        fig_single = plt.figure(figsize=(12, 8))
-        ax_single = fig_single.add_subplot(111)
-        gas_pivot.plot(kind='bar', ax=ax_single, rot=90)
-        ax_single.set_title('Average Gas Consumption by Source & Operation', fontsize=14, fontweight='bold')
-        ax_single.set_ylabel('Average Gas Units')
-        ax_single.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.tight_layout()
-        fig_single.savefig(f'{individual_charts_dir}/tx_01_gas_consumption.pdf', format='pdf', bbox_inches='tight')
-        fig_single.savefig(f'{individual_charts_dir}/tx_01_gas_consumption.png', dpi=300, bbox_inches='tight')
-        plt.close(fig_single)
+        chart_name = 'tx_01_gas_consumption'
+        chart_fp = individual_cache.fingerprint(gas_pivot, chart=chart_name)
+        if not individual_cache.is_current(chart_name, chart_fp):
+            fig_single = plt.figure(figsize=(12, 8))
+            ax_single = fig_single.add_subplot(111)
+            gas_pivot.plot(kind='bar', ax=ax_single, rot=90)
+            ax_single.set_title('Average Gas Consumption by Source & Operation', fontsize=14, fontweight='bold')
+            ax_single.set_ylabel('Average Gas Units')
+            ax_single.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
         
         # 2. Latency for transactions
         ax2 = axes1[0, 1]
@@ -237,16 +472,18 @@ def create_visualizations(df, stats_df):
         ax2.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
         
         # Save individual chart
-        fig_single = plt.figure(figsize=(12, 8))
-        ax_single = fig_single.add_subplot(111)
-        latency_pivot.plot(kind='bar', ax=ax_single, rot=90)
-        ax_single.set_title('Average Latency by Source & Operation', fontsize=14, fontweight='bold')
-        ax_single.set_ylabel('Average Latency (ms)')
-        ax_single.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.tight_layout()
-        fig_single.savefig(f'{individual_charts_dir}/tx_02_latency_by_source.pdf', format='pdf', bbox_inches='tight')
-        fig_single.savefig(f'{individual_charts_dir}/tx_02_latency_by_source.png', dpi=300, bbox_inches='tight')
-        plt.close(fig_single)
+        chart_name = 'tx_02_latency_by_source'
+        chart_fp = individual_cache.fingerprint(latency_pivot, chart=chart_name)
+        if not individual_cache.is_current(chart_name, chart_fp):
+            fig_single = plt.figure(figsize=(12, 8))
+            ax_single = fig_single.add_subplot(111)
+            latency_pivot.plot(kind='bar', ax=ax_single, rot=90)
+            ax_single.set_title('Average Latency by Source & Operation', fontsize=14, fontweight='bold')
+            ax_single.set_ylabel('Average Latency (ms)')
+            ax_single.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
         
         # 3. Fee comparison for transactions
         ax3 = axes1[0, 2]
@@ -262,28 +499,30 @@ def create_visualizations(df, stats_df):
         ax3.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
         
         # Save individual chart
-        fig_single = plt.figure(figsize=(12, 8))
-        ax_single = fig_single.add_subplot(111)
-        fee_pivot.plot(kind='bar', ax=ax_single, rot=90)
-        ax_single.set_title('Average Fee by Source & Operation', fontsize=14, fontweight='bold')
-        ax_single.set_ylabel('Average Fee (weis)')
-        ax_single.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.tight_layout()
-        fig_single.savefig(f'{individual_charts_dir}/tx_03_fees_by_source.pdf', format='pdf', bbox_inches='tight')
-        fig_single.savefig(f'{individual_charts_dir}/tx_03_fees_by_source.png', dpi=300, bbox_inches='tight')
-        plt.close(fig_single)
+        chart_name = 'tx_03_fees_by_source'
+        chart_fp = individual_cache.fingerprint(fee_pivot, chart=chart_name)
+        if not individual_cache.is_current(chart_name, chart_fp):
+            fig_single = plt.figure(figsize=(12, 8))
+            ax_single = fig_single.add_subplot(111)
+            fee_pivot.plot(kind='bar', ax=ax_single, rot=90)
+            ax_single.set_title('Average Fee by Source & Operation', fontsize=14, fontweight='bold')
+            ax_single.set_ylabel('Average Fee (weis)')
+            ax_single.legend(title='Operation/Blockchain', bbox_to_anchor=(1.05, 1), loc='upper left')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
+        
+        # Group by network (blockchain) and operation type, shared by charts 4 and 6
+        tx_network_perf = transaction_stats.groupby(['Blockchain', 'Operation']).agg({
+            'Gas_avg': 'mean',
+            'Fee (weis)_avg': 'mean',
+            'Latency (ms)_avg': 'mean',
+            'Count': 'sum'
+        }).reset_index()
         
         # 4. Latency by network for transactions
         ax4 = axes1[1, 0]
         if not transaction_stats.empty:
-            # Group by network (blockchain) and operation type
-            tx_network_perf = transaction_stats.groupby(['Blockchain', 'Operation']).agg({
-                'Gas_avg': 'mean',
-                'Fee (weis)_avg': 'mean',
-                'Latency (ms)_avg': 'mean',
-                'Count': 'sum'
-            }).reset_index()
-            
             if not tx_network_perf.empty:
                 # Create a pivot table for latency
                 latency_by_network = tx_network_perf.pivot_table(
@@ -306,62 +545,59 @@ def create_visualizations(df, stats_df):
                     ax4.bar_label(container, fmt='%.0f', fontsize=8, rotation=0)
                 
                 # Save individual chart
-                fig_single = plt.figure(figsize=(12, 8))
-                ax_single = fig_single.add_subplot(111)
-                latency_by_network.plot(kind='bar', ax=ax_single, width=0.8)
-                ax_single.set_title('Transaction Latency by Network and Operation', fontsize=14, fontweight='bold')
-                ax_single.set_xlabel('Network')
-                ax_single.set_ylabel('Average Latency (ms)')
-                ax_single.legend(title='Operation Type', loc='upper left')
-                ax_single.tick_params(axis='x', rotation=45)
-                for container in ax_single.containers:
-                    ax_single.bar_label(container, fmt='%.0f', fontsize=8, rotation=0)
-                plt.tight_layout()
-                fig_single.savefig(f'{individual_charts_dir}/tx_04_latency_by_network.pdf', format='pdf', bbox_inches='tight')
-                fig_single.savefig(f'{individual_charts_dir}/tx_04_latency_by_network.png', dpi=300, bbox_inches='tight')
-                plt.close(fig_single)
+                chart_name = 'tx_04_latency_by_network'
+                chart_fp = individual_cache.fingerprint(latency_by_network, chart=chart_name)
+                if not individual_cache.is_current(chart_name, chart_fp):
+                    fig_single = plt.figure(figsize=(12, 8))
+                    ax_single = fig_single.add_subplot(111)
+                    latency_by_network.plot(kind='bar', ax=ax_single, width=0.8)
+                    ax_single.set_title('Transaction Latency by Network and Operation', fontsize=14, fontweight='bold')
+                    ax_single.set_xlabel('Network')
+                    ax_single.set_ylabel('Average Latency (ms)')
+                    ax_single.legend(title='Operation Type', loc='upper left')
+                    ax_single.tick_params(axis='x', rotation=45)
+                    for container in ax_single.containers:
+                        ax_single.bar_label(container, fmt='%.0f', fontsize=8, rotation=0)
+                    plt.tight_layout()
+                    individual_cache.save(fig_single, chart_name, chart_fp)
+                    plt.close(fig_single)
             else:
                 ax4.text(0.5, 0.5, 'No network data available', 
                         ha='center', va='center', transform=ax4.transAxes)
                 ax4.set_title('Transaction Latency by Network and Operation')
         
-        # 5. Latency distribution box plot
+        # 5. Latency distribution box plot, drawn from the percentiles of the statistics stage
         ax5 = axes1[1, 1]
-        if not transaction_data.empty:
-            transaction_data['Op_Blockchain'] = transaction_data['Operation'] + ' (' + transaction_data['Blockchain'] + ')'
-            unique_combinations = transaction_data['Op_Blockchain'].unique()
+        pooled = distributions['pooled'] if distributions is not None else pd.DataFrame()
+        if not pooled.empty:
+            pooled_boxes = [box_stats(row, f"{row['Operation']} ({row['Blockchain']})") for _, row in pooled.iterrows()]
+            ax5.bxp(pooled_boxes, showfliers=False, showmeans=True)
+            ax5.set_title('Transaction Latency Distribution')
+            ax5.set_ylabel('Latency (ms)')
+            ax5.tick_params(axis='x', rotation=45, labelsize=8 if len(pooled_boxes) > FACET_SIZE else 10)
             
-            if len(unique_combinations) <= 10:
-                sns.boxplot(data=transaction_data, x='Op_Blockchain', y='Latency (ms)', ax=ax5)
-                ax5.set_title('Transaction Latency Distribution')
-                ax5.set_xticklabels(ax5.get_xticklabels(), rotation=45)
-                
-                # Save individual chart
-                fig_single = plt.figure(figsize=(12, 8))
-                ax_single = fig_single.add_subplot(111)
-                sns.boxplot(data=transaction_data, x='Op_Blockchain', y='Latency (ms)', ax=ax_single)
-                ax_single.set_title('Transaction Latency Distribution', fontsize=14, fontweight='bold')
-                ax_single.set_xticklabels(ax_single.get_xticklabels(), rotation=45)
+            # Save individual chart, split into facets when there are many operations and networks
+            chart_name = 'tx_05_latency_distribution'
+            chart_fp = individual_cache.fingerprint(pooled, chart=chart_name)
+            if not individual_cache.is_current(chart_name, chart_fp):
+                box_facets = facets(pooled_boxes)
+                fig_single, axes_single = plt.subplots(len(box_facets), 1, figsize=(12, 8 * len(box_facets)), squeeze=False)
+                fig_single.suptitle('Transaction Latency Distribution', fontsize=14, fontweight='bold')
+                for ax_single, boxes in zip(axes_single[:, 0], box_facets):
+                    ax_single.bxp(boxes, showfliers=False, showmeans=True)
+                    ax_single.set_ylabel('Latency (ms)')
+                    ax_single.tick_params(axis='x', rotation=45)
                 plt.tight_layout()
-                fig_single.savefig(f'{individual_charts_dir}/tx_05_latency_distribution.pdf', format='pdf', bbox_inches='tight')
-                fig_single.savefig(f'{individual_charts_dir}/tx_05_latency_distribution.png', dpi=300, bbox_inches='tight')
+                individual_cache.save(fig_single, chart_name, chart_fp)
                 plt.close(fig_single)
-            else:
-                ax5.text(0.5, 0.5, 'Too many combinations\nfor box plot', 
-                        ha='center', va='center', transform=ax5.transAxes)
-                ax5.set_title('Transaction Latency Distribution (Data too complex)')
+        else:
+            ax5.text(0.5, 0.5, 'No latency samples available', 
+                    ha='center', va='center', transform=ax5.transAxes)
+            ax5.set_title('Transaction Latency Distribution')
         
         # 6. Fees by network for transactions
         ax6 = axes1[1, 2]
         if not transaction_stats.empty:
-            # Group by network (blockchain) and operation type
-            tx_network_perf = transaction_stats.groupby(['Blockchain', 'Operation']).agg({
-                'Gas_avg': 'mean',
-                'Fee (weis)_avg': 'mean',
-                'Latency (ms)_avg': 'mean',
-                'Count': 'sum'
-            }).reset_index()
-            
             if not tx_network_perf.empty:
                 # Create a pivot table for fees
                 fees_by_network = tx_network_perf.pivot_table(
@@ -371,10 +607,9 @@ def create_visualizations(df, stats_df):
                     fill_value=0
                 )
                 
-                # Check for extreme outliers that might skew the visualization
-                max_fee = fees_by_network.values.max()
-                if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                    # Use log scale for better visualization
+                # A few outlying networks would flatten the other bars
+                log_fees = scales.use_log('tx_fees_by_network', fees_by_network)
+                if log_fees:
                     fees_by_network.plot(kind='bar', ax=ax6, width=0.8, logy=True)
                     ax6.set_title('Transaction Fees by Network and Operation (Log Scale)')
                     ax6.set_ylabel('Average Fee (weis) - Log Scale')
@@ -391,39 +626,46 @@ def create_visualizations(df, stats_df):
                 ax6.grid(True, alpha=0.3, axis='y')
                 
                 # Save individual chart
-                fig_single = plt.figure(figsize=(12, 8))
-                ax_single = fig_single.add_subplot(111)
+                chart_name = 'tx_06_fees_by_network'
+                chart_fp = individual_cache.fingerprint(fees_by_network, chart=chart_name, log=log_fees)
+                if not individual_cache.is_current(chart_name, chart_fp):
+                    fig_single = plt.figure(figsize=(12, 8))
+                    ax_single = fig_single.add_subplot(111)
                 
-                # Check for extreme outliers that might skew the visualization
-                max_fee = fees_by_network.values.max()
-                if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                    fees_by_network.plot(kind='bar', ax=ax_single, width=0.8, logy=True)
-                    ax_single.set_title('Transaction Fees by Network and Operation (Log Scale)', fontsize=14, fontweight='bold')
-                    ax_single.set_ylabel('Average Fee (weis) - Log Scale')
-                else:
-                    fees_by_network.plot(kind='bar', ax=ax_single, width=0.8)
-                    ax_single.set_title('Transaction Fees by Network and Operation', fontsize=14, fontweight='bold')
-                    ax_single.set_ylabel('Average Fee (weis)')
+                    if log_fees:
+                        fees_by_network.plot(kind='bar', ax=ax_single, width=0.8, logy=True)
+                        ax_single.set_title('Transaction Fees by Network and Operation (Log Scale)', fontsize=14, fontweight='bold')
+                        ax_single.set_ylabel('Average Fee (weis) - Log Scale')
+                    else:
+                        fees_by_network.plot(kind='bar', ax=ax_single, width=0.8)
+                        ax_single.set_title('Transaction Fees by Network and Operation', fontsize=14, fontweight='bold')
+                        ax_single.set_ylabel('Average Fee (weis)')
                 
-                ax_single.set_xlabel('Network')
-                ax_single.legend(title='Operation Type', loc='upper left')
-                ax_single.tick_params(axis='x', rotation=45)
-                ax_single.grid(True, alpha=0.3, axis='y')
-                plt.tight_layout()
-                fig_single.savefig(f'{individual_charts_dir}/tx_06_fees_by_network.pdf', format='pdf', bbox_inches='tight')
-                fig_single.savefig(f'{individual_charts_dir}/tx_06_fees_by_network.png', dpi=300, bbox_inches='tight')
-                plt.close(fig_single)
+                    ax_single.set_xlabel('Network')
+                    ax_single.legend(title='Operation Type', loc='upper left')
+                    ax_single.tick_params(axis='x', rotation=45)
+                    ax_single.grid(True, alpha=0.3, axis='y')
+                    plt.tight_layout()
+                    individual_cache.save(fig_single, chart_name, chart_fp)
+                    plt.close(fig_single)
             else:
                 ax6.text(0.5, 0.5, 'No network data available', 
                         ha='center', va='center', transform=ax6.transAxes)
                 ax6.set_title('Transaction Fees by Network and Operation')
         
+        window_fp = graphs_cache.fingerprint([transaction_stats, pooled], chart='transaction_performance_analysis',
+                                             outlier_threshold=scales.threshold)
         plt.tight_layout()
-        plt.savefig('graphs/transaction_performance_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        # An unchanged window is not saved again, but an interactive run still shows it
+        if not graphs_cache.is_current('transaction_performance_analysis', window_fp):
+            graphs_cache.save(fig1, 'transaction_performance_analysis', window_fp)
+        if show:
+            plt.show()
+        else:
+            plt.close(fig1)
     
     # Create Deployment Operations Window
-    if not deployment_stats.empty:
+    if 'deployment' in families and not deployment_stats.empty:
         fig2, axes2 = plt.subplots(2, 3, figsize=(20, 12))
         fig2.suptitle('Deployment & Initialization Performance Analysis', fontsize=16, fontweight='bold')
         
@@ -441,16 +683,18 @@ def create_visualizations(df, stats_df):
         ax1.legend(title='Operation Type')
         
         # Save individual chart
-        fig_single = plt.figure(figsize=(12, 8))
-        ax_single = fig_single.add_subplot(111)
-        deployment_gas.plot(kind='bar', ax=ax_single, rot=90)
-        ax_single.set_title('Average Gas Consumption by Source and Type', fontsize=14, fontweight='bold')
-        ax_single.set_ylabel('Average Gas Units')
-        ax_single.legend(title='Operation Type')
-        plt.tight_layout()
-        fig_single.savefig(f'{individual_charts_dir}/deploy_01_gas_consumption.pdf', format='pdf', bbox_inches='tight')
-        fig_single.savefig(f'{individual_charts_dir}/deploy_01_gas_consumption.png', dpi=300, bbox_inches='tight')
-        plt.close(fig_single)
+        chart_name = 'deploy_01_gas_consumption'
+        chart_fp = individual_cache.fingerprint(deployment_gas, chart=chart_name)
+        if not individual_cache.is_current(chart_name, chart_fp):
+            fig_single = plt.figure(figsize=(12, 8))
+            ax_single = fig_single.add_subplot(111)
+            deployment_gas.plot(kind='bar', ax=ax_single, rot=90)
+            ax_single.set_title('Average Gas Consumption by Source and Type', fontsize=14, fontweight='bold')
+            ax_single.set_ylabel('Average Gas Units')
+            ax_single.legend(title='Operation Type')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
         
         # 2. Deployment and initialization latency
         ax2 = axes2[0, 1]
@@ -466,16 +710,18 @@ def create_visualizations(df, stats_df):
         ax2.legend(title='Operation Type')
         
         # Save individual chart
-        fig_single = plt.figure(figsize=(12, 8))
-        ax_single = fig_single.add_subplot(111)
-        deployment_latency.plot(kind='bar', ax=ax_single, rot=90)
-        ax_single.set_title('Average Latency by Source and Type', fontsize=14, fontweight='bold')
-        ax_single.set_ylabel('Average Latency (ms)')
-        ax_single.legend(title='Operation Type')
-        plt.tight_layout()
-        fig_single.savefig(f'{individual_charts_dir}/deploy_02_latency_by_source.pdf', format='pdf', bbox_inches='tight')
-        fig_single.savefig(f'{individual_charts_dir}/deploy_02_latency_by_source.png', dpi=300, bbox_inches='tight')
-        plt.close(fig_single)
+        chart_name = 'deploy_02_latency_by_source'
+        chart_fp = individual_cache.fingerprint(deployment_latency, chart=chart_name)
+        if not individual_cache.is_current(chart_name, chart_fp):
+            fig_single = plt.figure(figsize=(12, 8))
+            ax_single = fig_single.add_subplot(111)
+            deployment_latency.plot(kind='bar', ax=ax_single, rot=90)
+            ax_single.set_title('Average Latency by Source and Type', fontsize=14, fontweight='bold')
+            ax_single.set_ylabel('Average Latency (ms)')
+            ax_single.legend(title='Operation Type')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
         
         # 3. Deployment and initialization fees
         ax3 = axes2[0, 2]
@@ -491,28 +737,30 @@ def create_visualizations(df, stats_df):
         ax3.legend(title='Operation Type')
         
         # Save individual chart
-        fig_single = plt.figure(figsize=(12, 8))
-        ax_single = fig_single.add_subplot(111)
-        deployment_fee.plot(kind='bar', ax=ax_single, rot=90)
-        ax_single.set_title('Average Fees by Source and Type', fontsize=14, fontweight='bold')
-        ax_single.set_ylabel('Average Fee (weis)')
-        ax_single.legend(title='Operation Type')
-        plt.tight_layout()
-        fig_single.savefig(f'{individual_charts_dir}/deploy_03_fees_by_source.pdf', format='pdf', bbox_inches='tight')
-        fig_single.savefig(f'{individual_charts_dir}/deploy_03_fees_by_source.png', dpi=300, bbox_inches='tight')
-        plt.close(fig_single)
+        chart_name = 'deploy_03_fees_by_source'
+        chart_fp = individual_cache.fingerprint(deployment_fee, chart=chart_name)
+        if not individual_cache.is_current(chart_name, chart_fp):
+            fig_single = plt.figure(figsize=(12, 8))
+            ax_single = fig_single.add_subplot(111)
+            deployment_fee.plot(kind='bar', ax=ax_single, rot=90)
+            ax_single.set_title('Average Fees by Source and Type', fontsize=14, fontweight='bold')
+            ax_single.set_ylabel('Average Fee (weis)')
+            ax_single.legend(title='Operation Type')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
+        
+        # Group by network (blockchain) and operation type, shared by charts 4 and 5
+        network_perf = deployment_stats.groupby(['Blockchain', 'DataType']).agg({
+            'Gas_avg': 'mean',
+            'Fee (weis)_avg': 'mean',
+            'Latency (ms)_avg': 'mean',
+            'Count': 'sum'
+        }).reset_index()
         
         # 4. Fees by network
         ax4 = axes2[1, 0]
         if not deployment_stats.empty:
-            # Group by network (blockchain) and operation type
-            network_perf = deployment_stats.groupby(['Blockchain', 'DataType']).agg({
-                'Gas_avg': 'mean',
-                'Fee (weis)_avg': 'mean',
-                'Latency (ms)_avg': 'mean',
-                'Count': 'sum'
-            }).reset_index()
-            
             if not network_perf.empty:
                 # Create a pivot table for fees
                 fees_by_network = network_perf.pivot_table(
@@ -522,10 +770,9 @@ def create_visualizations(df, stats_df):
                     fill_value=0
                 )
                 
-                # Check for extreme outliers that might skew the visualization
-                max_fee = fees_by_network.values.max()
-                if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                    # Use log scale for better visualization
+                # A few outlying networks would flatten the other bars
+                log_fees = scales.use_log('deploy_fees_by_network', fees_by_network)
+                if log_fees:
                     fees_by_network.plot(kind='bar', ax=ax4, width=0.8, logy=True)
                     ax4.set_title('Average Fees by Network (Log Scale)')
                     ax4.set_ylabel('Average Fee (weis) - Log Scale')
@@ -539,27 +786,27 @@ def create_visualizations(df, stats_df):
                 ax4.tick_params(axis='x', rotation=45)
                 
                 # Save individual chart
-                fig_single = plt.figure(figsize=(12, 8))
-                ax_single = fig_single.add_subplot(111)
+                chart_name = 'deploy_04_fees_by_network'
+                chart_fp = individual_cache.fingerprint(fees_by_network, chart=chart_name, log=log_fees)
+                if not individual_cache.is_current(chart_name, chart_fp):
+                    fig_single = plt.figure(figsize=(12, 8))
+                    ax_single = fig_single.add_subplot(111)
                 
-                # Check for extreme outliers that might skew the visualization
-                max_fee = fees_by_network.values.max()
-                if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                    fees_by_network.plot(kind='bar', ax=ax_single, width=0.8, logy=True)
-                    ax_single.set_title('Average Deployment Fees by Network (Log Scale)', fontsize=14, fontweight='bold')
-                    ax_single.set_ylabel('Average Fee (weis) - Log Scale')
-                else:
-                    fees_by_network.plot(kind='bar', ax=ax_single, width=0.8)
-                    ax_single.set_title('Average Deployment Fees by Network', fontsize=14, fontweight='bold')
-                    ax_single.set_ylabel('Average Fee (weis)')
+                    if log_fees:
+                        fees_by_network.plot(kind='bar', ax=ax_single, width=0.8, logy=True)
+                        ax_single.set_title('Average Deployment Fees by Network (Log Scale)', fontsize=14, fontweight='bold')
+                        ax_single.set_ylabel('Average Fee (weis) - Log Scale')
+                    else:
+                        fees_by_network.plot(kind='bar', ax=ax_single, width=0.8)
+                        ax_single.set_title('Average Deployment Fees by Network', fontsize=14, fontweight='bold')
+                        ax_single.set_ylabel('Average Fee (weis)')
                 
-                ax_single.set_xlabel('Network')
-                ax_single.legend(title='Operation Type', loc='upper left')
-                ax_single.tick_params(axis='x', rotation=45)
-                plt.tight_layout()
-                fig_single.savefig(f'{individual_charts_dir}/deploy_04_fees_by_network.pdf', format='pdf', bbox_inches='tight')
-                fig_single.savefig(f'{individual_charts_dir}/deploy_04_fees_by_network.png', dpi=300, bbox_inches='tight')
-                plt.close(fig_single)
+                    ax_single.set_xlabel('Network')
+                    ax_single.legend(title='Operation Type', loc='upper left')
+                    ax_single.tick_params(axis='x', rotation=45)
+                    plt.tight_layout()
+                    individual_cache.save(fig_single, chart_name, chart_fp)
+                    plt.close(fig_single)
             else:
                 ax4.text(0.5, 0.5, 'No network data available', 
                         ha='center', va='center', transform=ax4.transAxes)
@@ -568,14 +815,6 @@ def create_visualizations(df, stats_df):
         # 5. Latency by network
         ax5 = axes2[1, 1]
         if not deployment_stats.empty:
-            # Group by network (blockchain) and operation type
-            network_perf = deployment_stats.groupby(['Blockchain', 'DataType']).agg({
-                'Gas_avg': 'mean',
-                'Fee (weis)_avg': 'mean',
-                'Latency (ms)_avg': 'mean',
-                'Count': 'sum'
-            }).reset_index()
-            
             if not network_perf.empty:
                 # Create a pivot table for latency
                 latency_by_network = network_perf.pivot_table(
@@ -598,20 +837,22 @@ def create_visualizations(df, stats_df):
                     ax5.bar_label(container, fmt='%.0f', fontsize=8, rotation=0)
                 
                 # Save individual chart
-                fig_single = plt.figure(figsize=(12, 8))
-                ax_single = fig_single.add_subplot(111)
-                latency_by_network.plot(kind='bar', ax=ax_single, width=0.8)
-                ax_single.set_title('Average Deployment Latency by Network', fontsize=14, fontweight='bold')
-                ax_single.set_xlabel('Network')
-                ax_single.set_ylabel('Average Latency (ms)')
-                ax_single.legend(title='Operation Type', loc='upper left')
-                ax_single.tick_params(axis='x', rotation=45)
-                for container in ax_single.containers:
-                    ax_single.bar_label(container, fmt='%.0f', fontsize=8, rotation=0)
-                plt.tight_layout()
-                fig_single.savefig(f'{individual_charts_dir}/deploy_05_latency_by_network.pdf', format='pdf', bbox_inches='tight')
-                fig_single.savefig(f'{individual_charts_dir}/deploy_05_latency_by_network.png', dpi=300, bbox_inches='tight')
-                plt.close(fig_single)
+                chart_name = 'deploy_05_latency_by_network'
+                chart_fp = individual_cache.fingerprint(latency_by_network, chart=chart_name)
+                if not individual_cache.is_current(chart_name, chart_fp):
+                    fig_single = plt.figure(figsize=(12, 8))
+                    ax_single = fig_single.add_subplot(111)
+                    latency_by_network.plot(kind='bar', ax=ax_single, width=0.8)
+                    ax_single.set_title('Average Deployment Latency by Network', fontsize=14, fontweight='bold')
+                    ax_single.set_xlabel('Network')
+                    ax_single.set_ylabel('Average Latency (ms)')
+                    ax_single.legend(title='Operation Type', loc='upper left')
+                    ax_single.tick_params(axis='x', rotation=45)
+                    for container in ax_single.containers:
+                        ax_single.bar_label(container, fmt='%.0f', fontsize=8, rotation=0)
+                    plt.tight_layout()
+                    individual_cache.save(fig_single, chart_name, chart_fp)
+                    plt.close(fig_single)
             else:
                 ax5.text(0.5, 0.5, 'No network data available', 
                         ha='center', va='center', transform=ax5.transAxes)
@@ -631,22 +872,31 @@ def create_visualizations(df, stats_df):
             ax6.set_title('Setup Cost Distribution by Category & Type\n(Sum of Average Gas Units)')
             
             # Save individual chart
-            fig_single = plt.figure(figsize=(10, 10))
-            ax_single = fig_single.add_subplot(111)
-            ax_single.pie(category_type_costs.values, labels=labels, autopct='%1.1f%%', 
-                   colors=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', '#c2c2f0'])
-            ax_single.set_title('Setup Cost Distribution by Category & Type\n(Sum of Average Gas Units)', fontsize=14, fontweight='bold')
-            plt.tight_layout()
-            fig_single.savefig(f'{individual_charts_dir}/deploy_06_setup_cost_distribution.pdf', format='pdf', bbox_inches='tight')
-            fig_single.savefig(f'{individual_charts_dir}/deploy_06_setup_cost_distribution.png', dpi=300, bbox_inches='tight')
-            plt.close(fig_single)
+            chart_name = 'deploy_06_setup_cost_distribution'
+            chart_fp = individual_cache.fingerprint(category_type_costs, chart=chart_name)
+            if not individual_cache.is_current(chart_name, chart_fp):
+                fig_single = plt.figure(figsize=(10, 10))
+                ax_single = fig_single.add_subplot(111)
+                ax_single.pie(category_type_costs.values, labels=labels, autopct='%1.1f%%', 
+                       colors=['#ff9999', '#66b3ff', '#99ff99', '#ffcc99', '#ff99cc', '#c2c2f0'])
+                ax_single.set_title('Setup Cost Distribution by Category & Type\n(Sum of Average Gas Units)', fontsize=14, fontweight='bold')
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
         
+        window_fp = graphs_cache.fingerprint(deployment_stats, chart='deployment_performance_analysis',
+                                             outlier_threshold=scales.threshold)
         plt.tight_layout()
-        plt.savefig('graphs/deployment_performance_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        # An unchanged window is not saved again, but an interactive run still shows it
+        if not graphs_cache.is_current('deployment_performance_analysis', window_fp):
+            graphs_cache.save(fig2, 'deployment_performance_analysis', window_fp)
+        if show:
+            plt.show()
+        else:
+            plt.close(fig2)
     
     # Create Operation-Focused Window (NEW)
-    if not transaction_stats.empty:
+    if 'operation' in families and not transaction_stats.empty:
         # Get unique operations
         operations = sorted(transaction_stats['Operation'].unique())
         
@@ -657,6 +907,8 @@ def create_visualizations(df, stats_df):
             if op_data.empty:
                 continue
             
+            operation_clean = operation.lower().replace(' ', '_')
+            
             # Create a new window for this operation
             fig3, axes3 = plt.subplots(1, 3, figsize=(18, 6))
             fig3.suptitle(f'{operation} Operation Performance Across All ERC Implementations', fontsize=16, fontweight='bold')
@@ -669,9 +921,10 @@ def create_visualizations(df, stats_df):
                 values='Gas_avg',
                 fill_value=0
             )
+            gas_err_op = ci_error_bars(op_data, gas_pivot_op, 'Gas')
             
             if not gas_pivot_op.empty:
-                gas_pivot_op.plot(kind='bar', ax=ax1, rot=90)
+                gas_pivot_op.plot(kind='bar', ax=ax1, rot=90, yerr=gas_err_op, capsize=3)
                 ax1.set_title(f'Average Gas Consumption - {operation}')
                 ax1.set_ylabel('Average Gas Units')
                 ax1.set_xlabel('ERC/Implementation')
@@ -682,23 +935,24 @@ def create_visualizations(df, stats_df):
                 ax1.set_title(f'Average Gas Consumption - {operation}')
             
             # Save individual chart for gas
-            fig_single = plt.figure(figsize=(12, 8))
-            ax_single = fig_single.add_subplot(111)
-            if not gas_pivot_op.empty:
-                gas_pivot_op.plot(kind='bar', ax=ax_single, rot=90)
-                ax_single.set_title(f'Average Gas Consumption - {operation}', fontsize=14, fontweight='bold')
-                ax_single.set_ylabel('Average Gas Units')
-                ax_single.set_xlabel('ERC/Implementation')
-                ax_single.legend(title='Network', bbox_to_anchor=(1.05, 1), loc='upper left')
-                ax_single.tick_params(axis='x', rotation=90)
-            else:
-                ax_single.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax_single.transAxes)
-                ax_single.set_title(f'Average Gas Consumption - {operation}')
-            plt.tight_layout()
-            operation_clean = operation.lower().replace(' ', '_')
-            fig_single.savefig(f'{individual_charts_dir}/op_{operation_clean}_gas_all_ercs.pdf', format='pdf', bbox_inches='tight')
-            fig_single.savefig(f'{individual_charts_dir}/op_{operation_clean}_gas_all_ercs.png', dpi=300, bbox_inches='tight')
-            plt.close(fig_single)
+            chart_name = f'op_{operation_clean}_gas_all_ercs'
+            chart_fp = individual_cache.fingerprint([gas_pivot_op, gas_err_op], chart=chart_name)
+            if not individual_cache.is_current(chart_name, chart_fp):
+                fig_single = plt.figure(figsize=(12, 8))
+                ax_single = fig_single.add_subplot(111)
+                if not gas_pivot_op.empty:
+                    gas_pivot_op.plot(kind='bar', ax=ax_single, rot=90, yerr=gas_err_op, capsize=3)
+                    ax_single.set_title(f'Average Gas Consumption - {operation}', fontsize=14, fontweight='bold')
+                    ax_single.set_ylabel('Average Gas Units')
+                    ax_single.set_xlabel('ERC/Implementation')
+                    ax_single.legend(title='Network', bbox_to_anchor=(1.05, 1), loc='upper left')
+                    ax_single.tick_params(axis='x', rotation=90)
+                else:
+                    ax_single.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax_single.transAxes)
+                    ax_single.set_title(f'Average Gas Consumption - {operation}')
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
             
             # 2. Latency for this operation across all ERC implementations
             ax2 = axes3[1]
@@ -708,9 +962,10 @@ def create_visualizations(df, stats_df):
                 values='Latency (ms)_avg',
                 fill_value=0
             )
+            latency_err_op = ci_error_bars(op_data, latency_pivot_op, 'Latency (ms)')
             
             if not latency_pivot_op.empty:
-                latency_pivot_op.plot(kind='bar', ax=ax2, rot=90)
+                latency_pivot_op.plot(kind='bar', ax=ax2, rot=90, yerr=latency_err_op, capsize=3)
                 ax2.set_title(f'Average Latency - {operation}')
                 ax2.set_ylabel('Average Latency (ms)')
                 ax2.set_xlabel('ERC/Implementation')
@@ -721,22 +976,24 @@ def create_visualizations(df, stats_df):
                 ax2.set_title(f'Average Latency - {operation}')
             
             # Save individual chart for latency
-            fig_single = plt.figure(figsize=(12, 8))
-            ax_single = fig_single.add_subplot(111)
-            if not latency_pivot_op.empty:
-                latency_pivot_op.plot(kind='bar', ax=ax_single, rot=90)
-                ax_single.set_title(f'Average Latency - {operation}', fontsize=14, fontweight='bold')
-                ax_single.set_ylabel('Average Latency (ms)')
-                ax_single.set_xlabel('ERC/Implementation')
-                ax_single.legend(title='Network', bbox_to_anchor=(1.05, 1), loc='upper left')
-                ax_single.tick_params(axis='x', rotation=90)
-            else:
-                ax_single.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax_single.transAxes)
-                ax_single.set_title(f'Average Latency - {operation}')
-            plt.tight_layout()
-            fig_single.savefig(f'{individual_charts_dir}/op_{operation_clean}_latency_all_ercs.pdf', format='pdf', bbox_inches='tight')
-            fig_single.savefig(f'{individual_charts_dir}/op_{operation_clean}_latency_all_ercs.png', dpi=300, bbox_inches='tight')
-            plt.close(fig_single)
+            chart_name = f'op_{operation_clean}_latency_all_ercs'
+            chart_fp = individual_cache.fingerprint([latency_pivot_op, latency_err_op], chart=chart_name)
+            if not individual_cache.is_current(chart_name, chart_fp):
+                fig_single = plt.figure(figsize=(12, 8))
+                ax_single = fig_single.add_subplot(111)
+                if not latency_pivot_op.empty:
+                    latency_pivot_op.plot(kind='bar', ax=ax_single, rot=90, yerr=latency_err_op, capsize=3)
+                    ax_single.set_title(f'Average Latency - {operation}', fontsize=14, fontweight='bold')
+                    ax_single.set_ylabel('Average Latency (ms)')
+                    ax_single.set_xlabel('ERC/Implementation')
+                    ax_single.legend(title='Network', bbox_to_anchor=(1.05, 1), loc='upper left')
+                    ax_single.tick_params(axis='x', rotation=90)
+                else:
+                    ax_single.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax_single.transAxes)
+                    ax_single.set_title(f'Average Latency - {operation}')
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
             
             # 3. Fees for this operation across all ERC implementations
             ax3 = axes3[2]
@@ -746,16 +1003,17 @@ def create_visualizations(df, stats_df):
                 values='Fee (weis)_avg',
                 fill_value=0
             )
+            fee_err_op = ci_error_bars(op_data, fee_pivot_op, 'Fee (weis)')
+            
+            log_fees = scales.use_log(f'op_{operation_clean}_fees', fee_pivot_op)
             
             if not fee_pivot_op.empty:
-                # Check for extreme outliers
-                max_fee = fee_pivot_op.values.max()
-                if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                    fee_pivot_op.plot(kind='bar', ax=ax3, rot=90, logy=True)
+                if log_fees:
+                    fee_pivot_op.plot(kind='bar', ax=ax3, rot=90, logy=True, yerr=fee_err_op, capsize=3)
                     ax3.set_title(f'Average Fees - {operation} (Log Scale)')
                     ax3.set_ylabel('Average Fee (weis) - Log Scale')
                 else:
-                    fee_pivot_op.plot(kind='bar', ax=ax3, rot=90)
+                    fee_pivot_op.plot(kind='bar', ax=ax3, rot=90, yerr=fee_err_op, capsize=3)
                     ax3.set_title(f'Average Fees - {operation}')
                     ax3.set_ylabel('Average Fee (weis)')
                 
@@ -768,37 +1026,45 @@ def create_visualizations(df, stats_df):
                 ax3.set_title(f'Average Fees - {operation}')
             
             # Save individual chart for fees
-            fig_single = plt.figure(figsize=(12, 8))
-            ax_single = fig_single.add_subplot(111)
-            if not fee_pivot_op.empty:
-                max_fee = fee_pivot_op.values.max()
-                if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                    fee_pivot_op.plot(kind='bar', ax=ax_single, rot=90, logy=True)
-                    ax_single.set_title(f'Average Fees - {operation} (Log Scale)', fontsize=14, fontweight='bold')
-                    ax_single.set_ylabel('Average Fee (weis) - Log Scale')
-                else:
-                    fee_pivot_op.plot(kind='bar', ax=ax_single, rot=90)
-                    ax_single.set_title(f'Average Fees - {operation}', fontsize=14, fontweight='bold')
-                    ax_single.set_ylabel('Average Fee (weis)')
+            chart_name = f'op_{operation_clean}_fees_all_ercs'
+            chart_fp = individual_cache.fingerprint([fee_pivot_op, fee_err_op], chart=chart_name, log=log_fees)
+            if not individual_cache.is_current(chart_name, chart_fp):
+                fig_single = plt.figure(figsize=(12, 8))
+                ax_single = fig_single.add_subplot(111)
+                if not fee_pivot_op.empty:
+                    if log_fees:
+                        fee_pivot_op.plot(kind='bar', ax=ax_single, rot=90, logy=True, yerr=fee_err_op, capsize=3)
+                        ax_single.set_title(f'Average Fees - {operation} (Log Scale)', fontsize=14, fontweight='bold')
+                        ax_single.set_ylabel('Average Fee (weis) - Log Scale')
+                    else:
+                        fee_pivot_op.plot(kind='bar', ax=ax_single, rot=90, yerr=fee_err_op, capsize=3)
+                        ax_single.set_title(f'Average Fees - {operation}', fontsize=14, fontweight='bold')
+                        ax_single.set_ylabel('Average Fee (weis)')
                 
-                ax_single.set_xlabel('ERC/Implementation')
-                ax_single.legend(title='Network', bbox_to_anchor=(1.05, 1), loc='upper left')
-                ax_single.tick_params(axis='x', rotation=90)
-                ax_single.grid(True, alpha=0.3, axis='y')
-            else:
-                ax_single.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax_single.transAxes)
-                ax_single.set_title(f'Average Fees - {operation}')
-            plt.tight_layout()
-            fig_single.savefig(f'{individual_charts_dir}/op_{operation_clean}_fees_all_ercs.pdf', format='pdf', bbox_inches='tight')
-            fig_single.savefig(f'{individual_charts_dir}/op_{operation_clean}_fees_all_ercs.png', dpi=300, bbox_inches='tight')
-            plt.close(fig_single)
+                    ax_single.set_xlabel('ERC/Implementation')
+                    ax_single.legend(title='Network', bbox_to_anchor=(1.05, 1), loc='upper left')
+                    ax_single.tick_params(axis='x', rotation=90)
+                    ax_single.grid(True, alpha=0.3, axis='y')
+                else:
+                    ax_single.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax_single.transAxes)
+                    ax_single.set_title(f'Average Fees - {operation}')
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
             
+            window_name = f'{operation_clean}_operation_analysis'
+            window_fp = graphs_cache.fingerprint(op_data, chart=window_name, outlier_threshold=scales.threshold)
             plt.tight_layout()
-            plt.savefig(f'graphs/{operation_clean}_operation_analysis.png', dpi=300, bbox_inches='tight')
-            plt.show()
+            # An unchanged window is not saved again, but an interactive run still shows it
+            if not graphs_cache.is_current(window_name, window_fp):
+                graphs_cache.save(fig3, window_name, window_fp)
+            if show:
+                plt.show()
+            else:
+                plt.close(fig3)
     
     # Create ERC/Implementation Comparison Window (NEW)
-    if not transaction_stats.empty:
+    if 'erc' in families and not transaction_stats.empty:
         # Get unique ERC categories (e.g., ERC1400, ERC20, ERC3643)
         erc_categories = sorted(transaction_stats['Category'].unique())
         
@@ -824,49 +1090,36 @@ def create_visualizations(df, stats_df):
             elif cols == 1:
                 axes4 = axes4.reshape(-1, 1)
             
+            # One pivot per ERC standard, drawn in the window and again as its individual chart
+            # Index: implementation names (subcategories), columns: (Operation, Blockchain) multi-index
+            erc_pivots = {}
+            for erc_category in erc_categories:
+                erc_data = transaction_stats[transaction_stats['Category'] == erc_category]
+                erc_pivot = erc_data.pivot_table(index='Subcategory', columns=['Operation', 'Blockchain'],
+                                                 values=metric_col, fill_value=0)
+                if not erc_pivot.empty:
+                    erc_pivots[erc_category] = erc_pivot
+            # Only fees spread over orders of magnitude between networks
+            log_scales = {erc_category: metric_col == 'Fee (weis)_avg' and scales.use_log(f'erc_{erc_category}_fees', erc_pivot)
+                          for erc_category, erc_pivot in erc_pivots.items()}
+            
             for idx, erc_category in enumerate(erc_categories):
                 row = idx // cols
                 col = idx % cols
                 ax = axes4[row, col]
                 
-                # Filter data for this specific ERC category
-                erc_data = transaction_stats[transaction_stats['Category'] == erc_category].copy()
-                
-                if not erc_data.empty:
-                    # Create pivot table for this ERC category
-                    # Index: implementation names (subcategories)
-                    # Columns: (Operation, Blockchain) multi-index
-                    erc_pivot = erc_data.pivot_table(
-                        index='Subcategory',  # Implementation names (consensys, BNB, Oracle, etc.)
-                        columns=['Operation', 'Blockchain'],  # Multi-index columns
-                        values=metric_col,
-                        fill_value=0
-                    )
+                if erc_category in erc_pivots:
+                    erc_pivot = erc_pivots[erc_category]
+                    erc_pivot.plot(kind='bar', ax=ax, rot=45, logy=log_scales[erc_category])
+                    ax.set_ylabel(f'{ylabel} - Log Scale' if log_scales[erc_category] else ylabel)
                     
-                    if not erc_pivot.empty:
-                        # Check for extreme outliers in fees
-                        if metric_col == 'Fee (weis)_avg':
-                            max_fee = erc_pivot.values.max()
-                            if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                                erc_pivot.plot(kind='bar', ax=ax, rot=45, logy=True)
-                                ax.set_ylabel(f'{ylabel} - Log Scale')
-                            else:
-                                erc_pivot.plot(kind='bar', ax=ax, rot=45)
-                                ax.set_ylabel(ylabel)
-                        else:
-                            erc_pivot.plot(kind='bar', ax=ax, rot=45)
-                            ax.set_ylabel(ylabel)
-                        
-                        ax.set_title(f'{erc_category}')
-                        ax.set_xlabel('Implementation')
-                        ax.legend(title='Operation/Network', bbox_to_anchor=(1.05, 1), loc='upper left')
-                        ax.tick_params(axis='x', rotation=45)
-                        
-                        if metric_col == 'Fee (weis)_avg':
-                            ax.grid(True, alpha=0.3, axis='y')
-                    else:
-                        ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
-                        ax.set_title(f'{erc_category} - No Data')
+                    ax.set_title(f'{erc_category}')
+                    ax.set_xlabel('Implementation')
+                    ax.legend(title='Operation/Network', bbox_to_anchor=(1.05, 1), loc='upper left')
+                    ax.tick_params(axis='x', rotation=45)
+                    
+                    if metric_col == 'Fee (weis)_avg':
+                        ax.grid(True, alpha=0.3, axis='y')
                 else:
                     ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
                     ax.set_title(f'{erc_category} - No Data')
@@ -878,53 +1131,431 @@ def create_visualizations(df, stats_df):
                 col = idx % cols
                 axes4[row, col].set_visible(False)
             
-            plt.tight_layout()
             metric_clean = metric_name.lower().replace(' ', '_')
-            plt.savefig(f'graphs/{metric_clean}_by_erc_standard.png', dpi=300, bbox_inches='tight')
-            plt.show()
+            window_name = f'{metric_clean}_by_erc_standard'
+            window_fp = graphs_cache.fingerprint(transaction_stats[['Category', 'Subcategory', 'Operation', 'Blockchain', metric_col]], chart=window_name,
+                                                 outlier_threshold=scales.threshold)
+            plt.tight_layout()
+            # An unchanged window is not saved again, but an interactive run still shows it
+            if not graphs_cache.is_current(window_name, window_fp):
+                graphs_cache.save(fig4, window_name, window_fp)
+            if show:
+                plt.show()
+            else:
+                plt.close(fig4)
             
             # Save individual charts for each ERC standard
-            for erc_category in erc_categories:
-                erc_data = transaction_stats[transaction_stats['Category'] == erc_category].copy()
+            for erc_category, erc_pivot in erc_pivots.items():
+                erc_clean = erc_category.lower()
+                chart_name = f'erc_standard_{erc_clean}_{metric_clean}'
+                chart_fp = individual_cache.fingerprint(erc_pivot, chart=chart_name, log=log_scales[erc_category])
+                if individual_cache.is_current(chart_name, chart_fp):
+                    continue
                 
-                if not erc_data.empty:
-                    erc_pivot = erc_data.pivot_table(
-                        index='Subcategory',
-                        columns=['Operation', 'Blockchain'],
-                        values=metric_col,
-                        fill_value=0
-                    )
-                    
-                    if not erc_pivot.empty:
-                        fig_single = plt.figure(figsize=(12, 8))
-                        ax_single = fig_single.add_subplot(111)
-                        
-                        # Check for extreme outliers in fees
-                        if metric_col == 'Fee (weis)_avg':
-                            max_fee = erc_pivot.values.max()
-                            if max_fee > 1e12:  # If fees are extremely large (> 1 trillion)
-                                erc_pivot.plot(kind='bar', ax=ax_single, rot=45, logy=True)
-                                ax_single.set_ylabel(f'{ylabel} - Log Scale')
-                            else:
-                                erc_pivot.plot(kind='bar', ax=ax_single, rot=45)
-                                ax_single.set_ylabel(ylabel)
-                        else:
-                            erc_pivot.plot(kind='bar', ax=ax_single, rot=45)
-                            ax_single.set_ylabel(ylabel)
-                        
-                        ax_single.set_title(f'{metric_name} - {erc_category}', fontsize=14, fontweight='bold')
-                        ax_single.set_xlabel('Implementation')
-                        ax_single.legend(title='Operation/Network', bbox_to_anchor=(1.05, 1), loc='upper left')
-                        ax_single.tick_params(axis='x', rotation=45)
-                        
-                        if metric_col == 'Fee (weis)_avg':
-                            ax_single.grid(True, alpha=0.3, axis='y')
-                        
-                        plt.tight_layout()
-                        erc_clean = erc_category.lower()
-                        fig_single.savefig(f'{individual_charts_dir}/erc_standard_{erc_clean}_{metric_clean}.pdf', format='pdf', bbox_inches='tight')
-                        fig_single.savefig(f'{individual_charts_dir}/erc_standard_{erc_clean}_{metric_clean}.png', dpi=300, bbox_inches='tight')
-                        plt.close(fig_single)
+                fig_single = plt.figure(figsize=(12, 8))
+                ax_single = fig_single.add_subplot(111)
+                
+                erc_pivot.plot(kind='bar', ax=ax_single, rot=45, logy=log_scales[erc_category])
+                ax_single.set_ylabel(f'{ylabel} - Log Scale' if log_scales[erc_category] else ylabel)
+                
+                ax_single.set_title(f'{metric_name} - {erc_category}', fontsize=14, fontweight='bold')
+                ax_single.set_xlabel('Implementation')
+                ax_single.legend(title='Operation/Network', bbox_to_anchor=(1.05, 1), loc='upper left')
+                ax_single.tick_params(axis='x', rotation=45)
+                
+                if metric_col == 'Fee (weis)_avg':
+                    ax_single.grid(True, alpha=0.3, axis='y')
+                
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
+    
+    # Trend over time of every operation and metric, only schema v2 samples carry a timestamp
+    has_timestamps = 'Timestamp' in transaction_data.columns and transaction_data['Timestamp'].notna().any()
+    if 'trend' in families and has_timestamps:
+        timed_data = transaction_data[transaction_data['Timestamp'].notna()]
+        trend_metrics = [('Gas', 'Gas Units', 'gas'), ('Fee (weis)', 'Fee (weis)', 'fee'), ('Latency (ms)', 'Latency (ms)', 'latency')]
+        
+        for operation in sorted(timed_data['Operation'].unique()):
+            op_data = timed_data[timed_data['Operation'] == operation]
+            operation_clean = operation.lower().replace(' ', '_')
+            
+            for metric, ylabel, metric_clean in trend_metrics:
+                # Long histories are reduced to equal-count buckets before drawing
+                series = {}
+                for (source, blockchain), group in op_data.groupby(['Source', 'Blockchain'], observed=True):
+                    series[f'{source} ({blockchain})'] = downsample_trend(group['Timestamp'].dt.tz_localize(None).to_numpy(),
+                                                                         group[metric].to_numpy(dtype=np.float64), max_points)
+                series = {label: points for label, points in series.items() if len(points[0]) > 0}
+                if not series:
+                    continue
+                
+                chart_name = f'trend_{operation_clean}_{metric_clean}'
+                chart_fp = individual_cache.fingerprint([np.concatenate([t.astype(np.int64), mean, low, high])
+                                                         for _, (t, mean, low, high) in sorted(series.items())],
+                                                        chart=chart_name, labels=sorted(series), max_points=max_points)
+                if individual_cache.is_current(chart_name, chart_fp):
+                    continue
+                
+                fig_single = plt.figure(figsize=(14, 7))
+                ax_single = fig_single.add_subplot(111)
+                for label, (times, means, lows, highs) in sorted(series.items()):
+                    line, = ax_single.plot(times, means, marker='.', markersize=3, linewidth=1, label=label)
+                    # Envelope of the samples merged into each bucket
+                    if (lows != highs).any():
+                        ax_single.fill_between(times, lows, highs, color=line.get_color(), alpha=0.2, linewidth=0)
+                ax_single.set_title(f'{metric} Over Time - {operation}', fontsize=14, fontweight='bold')
+                ax_single.set_ylabel(ylabel)
+                ax_single.set_xlabel('Time (UTC)')
+                ax_single.legend(title='ERC/Implementation (Network)', bbox_to_anchor=(1.05, 1), loc='upper left')
+                ax_single.grid(True, alpha=0.3)
+                fig_single.autofmt_xdate()
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
+    
+    # Cold (first touch) and warm averages side by side, one subplot per network
+    if 'warmup' in families and 'Gas_cold_avg' in transaction_stats.columns:
+        warmup_metrics = [('Gas', 'Average Gas Units', 'gas'), ('Fee (weis)', 'Average Fee (weis)', 'fee'),
+                          ('Latency (ms)', 'Average Latency (ms)', 'latency')]
+        
+        for operation in sorted(transaction_stats['Operation'].unique()):
+            op_data = transaction_stats[transaction_stats['Operation'] == operation]
+            operation_clean = operation.lower().replace(' ', '_')
+            networks = sorted(op_data['Blockchain'].unique(), key=lambda x: x.lower())
+            
+            for metric, ylabel, metric_clean in warmup_metrics:
+                phase_data = op_data.set_index(['Blockchain', 'Source'])[[f'{metric}_cold_avg', f'{metric}_warm_avg']]
+                phase_data.columns = ['Cold (first touch)', 'Warm']
+                if phase_data['Cold (first touch)'].isna().all():
+                    continue
+                
+                chart_name = f'warmup_{operation_clean}_{metric_clean}'
+                chart_fp = individual_cache.fingerprint(phase_data, chart=chart_name)
+                if individual_cache.is_current(chart_name, chart_fp):
+                    continue
+                
+                fig_single, axes_single = plt.subplots(1, len(networks), figsize=(6 * len(networks), 7), squeeze=False)
+                fig_single.suptitle(f'Cold vs Warm {metric} - {operation}', fontsize=14, fontweight='bold')
+                for ax_single, network in zip(axes_single[0], networks):
+                    phase_data.loc[network].sort_index().plot(kind='bar', ax=ax_single, rot=90)
+                    ax_single.set_title(network)
+                    ax_single.set_ylabel(ylabel)
+                    ax_single.set_xlabel('ERC/Implementation')
+                    ax_single.legend(title='Regime')
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
+    
+    # Per-transfer cost of batch operations against batch size, with the fitted curve and a single transfer
+    if 'batch' in families and batch_costs is not None and not batch_costs.empty:
+        batch_metrics = [('Gas', 'Gas Units per Transfer', 'gas'), ('Fee (weis)', 'Fee per Transfer (weis)', 'fee'),
+                         ('Latency (ms)', 'Latency per Transfer (ms)', 'latency')]
+        
+        for operation in sorted(batch_costs['Operation'].unique()):
+            op_costs = batch_costs[batch_costs['Operation'] == operation]
+            op_fit = batch_fit[(batch_fit['Operation'] == operation)] if batch_fit is not None else pd.DataFrame()
+            operation_clean = operation.lower().replace(' ', '_')
+            
+            for metric, ylabel, metric_clean in batch_metrics:
+                metric_fit = op_fit[op_fit['Metric'] == metric] if not op_fit.empty else op_fit
+                chart_name = f'batch_{operation_clean}_{metric_clean}_per_transfer'
+                chart_fp = individual_cache.fingerprint([op_costs, metric_fit], chart=chart_name)
+                if individual_cache.is_current(chart_name, chart_fp):
+                    continue
+                
+                fig_single = plt.figure(figsize=(12, 8))
+                ax_single = fig_single.add_subplot(111)
+                for (source, blockchain), group in op_costs.groupby(['Source', 'Blockchain'], observed=True):
+                    group = group.sort_values('Batch Size')
+                    line, = ax_single.plot(group['Batch Size'], group[f'{metric}_per_transfer'], marker='o',
+                                           label=f'{source} ({blockchain})')
+                    fit = metric_fit[(metric_fit['Source'] == source) & (metric_fit['Blockchain'] == blockchain)] if not metric_fit.empty else metric_fit
+                    if fit.empty:
+                        continue
+                    fit = fit.iloc[0]
+                    if not pd.isna(fit['Fixed']):
+                        sizes = np.geomspace(group['Batch Size'].min(), group['Batch Size'].max(), 200)
+                        ax_single.plot(sizes, fit['Fixed'] / sizes + fit['Marginal'], linestyle='--', color=line.get_color())
+                    # Cost of the same transfers sent one by one
+                    if not pd.isna(fit['Single transfer']):
+                        ax_single.axhline(fit['Single transfer'], linestyle=':', color=line.get_color(), linewidth=1)
+                if op_costs['Batch Size'].max() / op_costs['Batch Size'].min() >= 20:
+                    ax_single.set_xscale('log')
+                ax_single.set_title(f'{metric} per Transfer vs Batch Size - {operation}', fontsize=14, fontweight='bold')
+                ax_single.set_ylabel(ylabel)
+                ax_single.set_xlabel('Transfers per Call')
+                ax_single.legend(title='ERC/Implementation (Network)', bbox_to_anchor=(1.05, 1), loc='upper left')
+                ax_single.grid(True, alpha=0.3)
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
+    
+    # Latency against sustained throughput of the open-loop runs, the saturation knee is the last sustained step
+    if 'throughput' in families and curves is not None and not curves.empty:
+        for network in sorted(curves['Blockchain'].unique(), key=lambda x: x.lower()):
+            network_curves = curves[curves['Blockchain'] == network]
+            chart_name = f'throughput_latency_{network.lower()}'
+            chart_fp = individual_cache.fingerprint(network_curves, chart=chart_name)
+            if individual_cache.is_current(chart_name, chart_fp):
+                continue
+            
+            fig_single = plt.figure(figsize=(12, 8))
+            ax_single = fig_single.add_subplot(111)
+            for (source, operation, arrival, run_id), curve in network_curves.groupby(['Source', 'Operation', 'Arrival', 'Run ID']):
+                curve = curve.sort_values('Target rate (tx/s)')
+                label = f'{source} {operation} ({arrival}, {run_id})'
+                line, = ax_single.plot(curve['Throughput (tx/s)'], curve['Latency p95 (ms)'], marker='o', label=label)
+                ax_single.plot(curve['Throughput (tx/s)'], curve['Latency p50 (ms)'], linestyle='--', color=line.get_color())
+                sustained = curve[~curve['Saturated'].astype(str).str.strip().str.lower().eq('true')]
+                if not sustained.empty:
+                    knee = sustained.iloc[-1]
+                    ax_single.scatter([knee['Throughput (tx/s)']], [knee['Latency p95 (ms)']], s=150, marker='*',
+                                      color=line.get_color(), zorder=3)
+            ax_single.set_yscale('log')
+            ax_single.set_title(f'Latency vs Throughput (open loop) - {network}', fontsize=14, fontweight='bold')
+            ax_single.set_xlabel('Sustained Throughput (tx/s)')
+            ax_single.set_ylabel('Latency from Intended Start (ms), p95 solid, p50 dashed')
+            ax_single.legend(title='Implementation Operation (arrivals, run)', bbox_to_anchor=(1.05, 1), loc='upper left')
+            ax_single.grid(True, alpha=0.3)
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
+    
+    # Latency split into build, submit, pending, inclusion and receipt, one subplot per network
+    phase_avg_columns = [f'{phase}_avg' for phase in PHASE_COLUMNS]
+    if 'phases' in families and all(column in transaction_stats.columns for column in phase_avg_columns):
+        timed_stats = transaction_stats.dropna(subset=phase_avg_columns, how='all')
+        
+        for operation in sorted(timed_stats['Operation'].unique()):
+            op_data = timed_stats[timed_stats['Operation'] == operation]
+            operation_clean = operation.lower().replace(' ', '_')
+            networks = sorted(op_data['Blockchain'].unique(), key=lambda x: x.lower())
+            phase_data = op_data.set_index(['Blockchain', 'Source'])[phase_avg_columns].fillna(0)
+            phase_data.columns = [phase.replace(' (ms)', '') for phase in PHASE_COLUMNS]
+            
+            chart_name = f'phases_{operation_clean}_latency_breakdown'
+            chart_fp = individual_cache.fingerprint(phase_data, chart=chart_name)
+            if individual_cache.is_current(chart_name, chart_fp):
+                continue
+            
+            fig_single, axes_single = plt.subplots(1, len(networks), figsize=(6 * len(networks), 7), squeeze=False)
+            fig_single.suptitle(f'Latency Breakdown by Phase - {operation}', fontsize=14, fontweight='bold')
+            for ax_single, network in zip(axes_single[0], networks):
+                phase_data.loc[network].sort_index().plot(kind='bar', stacked=True, ax=ax_single, rot=90)
+                ax_single.set_title(network)
+                ax_single.set_ylabel('Average Latency (ms)')
+                ax_single.set_xlabel('ERC/Implementation')
+                ax_single.legend(title='Phase')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
+    
+    # Setup cost of every suite split by deployed contract, for suites made of more than one part
+    if 'contracts' in families and setup_costs is not None and not setup_costs.empty:
+        contract_metrics = [('Gas', 'Gas Units', 'gas'), ('Fee (weis)', 'Fee (weis)', 'fee')]
+        parts_per_suite = setup_costs.groupby(['Source', 'Blockchain'])['Contract'].transform('nunique')
+        suites = setup_costs[parts_per_suite > 1]
+        
+        for category in sorted(suites['Category'].unique()):
+            category_costs = suites[suites['Category'] == category]
+            category_clean = category.lower().replace(' ', '_')
+            networks = sorted(category_costs['Blockchain'].unique(), key=lambda x: x.lower())
+            contract_order = category_costs.groupby('Contract')['Gas'].mean().sort_values(ascending=False).index
+            
+            for metric, ylabel, metric_clean in contract_metrics:
+                values = category_costs.pivot_table(index=['Blockchain', 'Contract'], columns='Subcategory',
+                                                    values=metric, aggfunc='sum')
+                
+                # Cost of each contract side by side across implementations
+                chart_name = f'contracts_{category_clean}_{metric_clean}'
+                chart_fp = individual_cache.fingerprint(values, chart=chart_name)
+                if not individual_cache.is_current(chart_name, chart_fp):
+                    fig_single, axes_single = plt.subplots(1, len(networks), figsize=(7 * len(networks), 8), squeeze=False)
+                    fig_single.suptitle(f'{metric} per Deployed Contract - {category}', fontsize=14, fontweight='bold')
+                    for ax_single, network in zip(axes_single[0], networks):
+                        network_values = values.loc[network]
+                        network_values.reindex([c for c in contract_order if c in network_values.index]).plot(
+                            kind='bar', ax=ax_single, rot=90)
+                        ax_single.set_title(network)
+                        ax_single.set_ylabel(ylabel)
+                        ax_single.set_xlabel('Contract')
+                        ax_single.legend(title='Implementation')
+                        ax_single.grid(True, alpha=0.3, axis='y')
+                    plt.tight_layout()
+                    individual_cache.save(fig_single, chart_name, chart_fp)
+                    plt.close(fig_single)
+                
+                # What the total setup cost of every implementation is made of
+                chart_name = f'setup_composition_{category_clean}_{metric_clean}'
+                chart_fp = individual_cache.fingerprint(values, chart=chart_name)
+                if individual_cache.is_current(chart_name, chart_fp):
+                    continue
+                
+                fig_single, axes_single = plt.subplots(1, len(networks), figsize=(6 * len(networks), 8), squeeze=False)
+                fig_single.suptitle(f'Setup {metric} Composition - {category}', fontsize=14, fontweight='bold')
+                for ax_single, network in zip(axes_single[0], networks):
+                    composition = values.loc[network].T.fillna(0)
+                    composition = composition[[c for c in contract_order if c in composition.columns]]
+                    composition.plot(kind='bar', stacked=True, ax=ax_single, rot=0, colormap='tab20')
+                    ax_single.set_title(network)
+                    ax_single.set_ylabel(f'Total Setup {ylabel}')
+                    ax_single.set_xlabel('Implementation')
+                    ax_single.legend(title='Contract', fontsize=8)
+                    ax_single.grid(True, alpha=0.3, axis='y')
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
+    
+    # Time and gas until a non-compliant transfer is stopped: inline checks stop it in the transfer itself,
+    # the oracle blocks the pair in a second transaction (OracleBlock, measured from sending the transfer)
+    if 'compliance' in families and not transaction_stats.empty:
+        oracle_categories = transaction_stats[transaction_stats['Operation'] == 'OracleBlock']['Category'].unique()
+        
+        for category in sorted(oracle_categories):
+            category_stats = transaction_stats[(transaction_stats['Category'] == category) &
+                                               transaction_stats['Operation'].isin(['Transfer', 'OracleBlock'])]
+            per_operation = category_stats.pivot_table(index=['Blockchain', 'Subcategory'], columns='Operation',
+                                                       values=['Latency (ms)_avg', 'Latency (ms)_std', 'Gas_avg'])
+            if ('Latency (ms)_avg', 'Transfer') not in per_operation.columns:
+                continue
+            category_clean = category.lower().replace(' ', '_')
+            enforcement = pd.DataFrame(index=per_operation.index)
+            enforcement['Mechanism'] = 'Inline'
+            enforcement['Latency'] = per_operation[('Latency (ms)_avg', 'Transfer')]
+            enforcement['Latency std'] = per_operation[('Latency (ms)_std', 'Transfer')]
+            enforcement['Gas'] = per_operation[('Gas_avg', 'Transfer')]
+            if ('Latency (ms)_avg', 'OracleBlock') in per_operation.columns:
+                blocked = per_operation[('Latency (ms)_avg', 'OracleBlock')].notna()
+                enforcement.loc[blocked, 'Mechanism'] = 'Oracle'
+                enforcement.loc[blocked, 'Latency'] = per_operation.loc[blocked, ('Latency (ms)_avg', 'OracleBlock')]
+                enforcement.loc[blocked, 'Latency std'] = per_operation.loc[blocked, ('Latency (ms)_std', 'OracleBlock')]
+                enforcement.loc[blocked, 'Gas'] += per_operation.loc[blocked, ('Gas_avg', 'OracleBlock')]
+                # Without its OracleBlock rows an oracle implementation's transfer alone enforces nothing
+                oracle_subcategories = per_operation[blocked].index.get_level_values('Subcategory').unique()
+                unmeasured = ~blocked & per_operation.index.get_level_values('Subcategory').isin(oracle_subcategories)
+                enforcement = enforcement[~unmeasured]
+            networks = sorted(enforcement.index.get_level_values('Blockchain').unique(), key=lambda x: x.lower())
+            
+            chart_name = f'compliance_enforcement_{category_clean}'
+            chart_fp = individual_cache.fingerprint(enforcement, chart=chart_name)
+            if individual_cache.is_current(chart_name, chart_fp):
+                continue
+            
+            fig_single, axes_single = plt.subplots(2, len(networks), figsize=(6 * len(networks), 12), squeeze=False)
+            fig_single.suptitle(f'Compliance Enforcement Cost - {category}', fontsize=14, fontweight='bold')
+            for column, network in enumerate(networks):
+                network_data = enforcement.loc[network].sort_index()
+                labels = [f'{subcategory}\n({mechanism})' for subcategory, mechanism in
+                          zip(network_data.index, network_data['Mechanism'])]
+                colors = ['tab:orange' if mechanism == 'Oracle' else 'tab:blue' for mechanism in network_data['Mechanism']]
+                
+                ax_latency = axes_single[0][column]
+                ax_latency.bar(labels, network_data['Latency'], yerr=network_data['Latency std'].fillna(0), capsize=4,
+                               color=colors, alpha=0.8)
+                ax_latency.set_title(network)
+                ax_latency.set_ylabel('Time until Blocked (ms)')
+                ax_latency.grid(True, alpha=0.3, axis='y')
+                
+                ax_gas = axes_single[1][column]
+                ax_gas.bar(labels, network_data['Gas'], color=colors, alpha=0.8)
+                ax_gas.set_ylabel('Gas Units per Enforced Transfer')
+                ax_gas.set_xlabel('Implementation')
+                ax_gas.grid(True, alpha=0.3, axis='y')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
+    
+    # Latency distribution of every implementation from its percentiles and histogram, so drawing
+    # costs the same for a hundred or a million samples
+    if 'distributions' in families and distributions is not None:
+        groups, histograms = distributions['groups'], distributions['histograms']
+        
+        for operation in sorted(groups['Operation'].unique()):
+            op_groups = groups[groups['Operation'] == operation].reset_index(drop=True)
+            op_histograms = histograms[histograms['Operation'] == operation]
+            operation_clean = operation.lower().replace(' ', '_')
+            log_latency = scales.use_log(f'dist_{operation_clean}_latency', op_groups['p50'])
+            # One facet per network, networks with many implementations are split further
+            panels = []
+            for network in sorted(op_groups['Blockchain'].unique(), key=lambda x: x.lower()):
+                rows = op_groups[op_groups['Blockchain'] == network]
+                chunks = facets(list(rows.index))
+                panels += [(network if len(chunks) == 1 else f'{network} ({i + 1}/{len(chunks)})', op_groups.loc[chunk])
+                           for i, chunk in enumerate(chunks)]
+            cols = min(3, len(panels))
+            rows_count = -(-len(panels) // cols)
+            
+            for view in ('box', 'ecdf'):
+                chart_name = f'dist_{operation_clean}_latency_{view}'
+                chart_fp = individual_cache.fingerprint(op_groups, chart=chart_name, log=log_latency)
+                if individual_cache.is_current(chart_name, chart_fp):
+                    continue
+                
+                fig_single, axes_single = plt.subplots(rows_count, cols, figsize=(7 * cols, 6 * rows_count), squeeze=False)
+                title = 'Latency Distribution' if view == 'box' else 'Latency ECDF'
+                fig_single.suptitle(f'{title} - {operation}', fontsize=14, fontweight='bold')
+                for ax_single, (panel_title, panel) in zip(axes_single.flat, panels):
+                    labels = panel['Category'].astype(str) + '/' + panel['Subcategory'].astype(str)
+                    if view == 'box':
+                        ax_single.bxp([box_stats(row, label) for label, (_, row) in zip(labels, panel.iterrows())],
+                                      showfliers=False, showmeans=True)
+                        ax_single.set_ylabel('Latency (ms)')
+                        ax_single.tick_params(axis='x', rotation=90)
+                        if log_latency:
+                            ax_single.set_yscale('log')
+                    else:
+                        colors = plt.cm.tab20(np.linspace(0, 1, 20))
+                        for index, (label, (_, row)) in enumerate(zip(labels, panel.iterrows())):
+                            ax_single.plot(row[QUANTILE_COLUMNS].to_numpy(dtype=np.float64), QUANTILES,
+                                           drawstyle='steps-post', label=label, color=colors[index % 20])
+                        ax_single.set_xlabel('Latency (ms)')
+                        ax_single.set_ylabel('Share of Transactions')
+                        ax_single.legend(fontsize=8, loc='lower right')
+                        if log_latency:
+                            ax_single.set_xscale('log')
+                    ax_single.set_title(panel_title)
+                    ax_single.grid(True, alpha=0.3)
+                for ax_single in list(axes_single.flat)[len(panels):]:
+                    ax_single.set_visible(False)
+                plt.tight_layout()
+                individual_cache.save(fig_single, chart_name, chart_fp)
+                plt.close(fig_single)
+            
+            # Every implementation as one row of its network's shared bins, readable for any number of groups
+            chart_name = f'dist_{operation_clean}_latency_heatmap'
+            chart_fp = individual_cache.fingerprint(op_histograms, chart=chart_name)
+            if individual_cache.is_current(chart_name, chart_fp):
+                continue
+            
+            networks = sorted(op_histograms['Blockchain'].unique(), key=lambda x: x.lower())
+            heights = [max(2, 0.35 * op_histograms[op_histograms['Blockchain'] == network][['Category', 'Subcategory']]
+                           .drop_duplicates().shape[0] + 1) for network in networks]
+            fig_single, axes_single = plt.subplots(len(networks), 1, figsize=(14, sum(heights) + 1), squeeze=False,
+                                                   gridspec_kw={'height_ratios': heights})
+            fig_single.suptitle(f'Latency Histogram - {operation}', fontsize=14, fontweight='bold')
+            for ax_single, network in zip(axes_single[:, 0], networks):
+                network_histograms = op_histograms[op_histograms['Blockchain'] == network]
+                shares = network_histograms.pivot_table(index=['Category', 'Subcategory'], columns='Bin', values='Count',
+                                                        aggfunc='sum', observed=True)
+                shares = shares.div(shares.sum(axis=1), axis=0)
+                edges = network_histograms.drop_duplicates('Bin').sort_values('Bin')
+                edges = np.append(edges['Low'].to_numpy(dtype=np.float64), edges['High'].iloc[-1])
+                mesh = ax_single.pcolormesh(edges, np.arange(len(shares) + 1), shares.to_numpy(dtype=np.float64), cmap='viridis')
+                if edges[0] > 0 and edges[-1] / edges[0] > 10:
+                    ax_single.set_xscale('log')
+                ax_single.set_yticks(np.arange(len(shares)) + 0.5)
+                ax_single.set_yticklabels([f'{category}/{subcategory}' for category, subcategory in shares.index], fontsize=8)
+                ax_single.invert_yaxis()
+                ax_single.set_title(network)
+                ax_single.set_xlabel('Latency (ms)')
+                fig_single.colorbar(mesh, ax=ax_single, label='Share of Transactions')
+            plt.tight_layout()
+            individual_cache.save(fig_single, chart_name, chart_fp)
+            plt.close(fig_single)
+    
+    print(f"Charts rendered: {len(graphs_cache.rendered) + len(individual_cache.rendered)}, "
+          f"unchanged and skipped: {len(graphs_cache.skipped) + len(individual_cache.skipped)}")
 
 def print_summary_table(stats_df):
     """Print a formatted summary table."""
@@ -957,42 +1588,159 @@ def print_summary_table(stats_df):
                         print(f"        Fee:     avg={row['Fee (weis)_avg']:.0f}, max={row['Fee (weis)_max']:.0f}, min={row['Fee (weis)_min']:.0f}")
                         print(f"        Latency: avg={row['Latency (ms)_avg']:.2f}ms, max={row['Latency (ms)_max']:.2f}ms, min={row['Latency (ms)_min']:.2f}ms")
                         print(f"        Samples: {row['Count']}")
+                        if row.get('Count_cold', 0) > 0 and row.get('Count_warm', 0) > 0:
+                            print(f"        Cold:    gas={row['Gas_cold_avg']:.0f}, latency={row['Latency (ms)_cold_avg']:.2f}ms ({row['Count_cold']:.0f} samples)")
+                            print(f"        Warm:    gas={row['Gas_warm_avg']:.0f}, latency={row['Latency (ms)_warm_avg']:.2f}ms ({row['Count_warm']:.0f} samples)")
                         print()
 
-def main():
-    """Main function to run the analysis."""
-    
-    # Get the base path (current directory)
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    
-    print(f"Analyzing performance data in: {base_path}")
+def print_break_even_table(batch_fit_df):
+    """Print the gas fit and break-even batch size of every batch operation."""
+    gas_fit = batch_fit_df[batch_fit_df['Metric'] == 'Gas']
+    print("\nBatch gas per call = fixed + marginal * transfers:")
+    for _, row in gas_fit.sort_values(['Operation', 'Source', 'Blockchain']).iterrows():
+        if pd.isna(row['Fixed']):
+            print(f"  {row['Source']} {row['Operation']} ({row['Blockchain']}): single batch size, no fit")
+            continue
+        print(f"  {row['Source']} {row['Operation']} ({row['Blockchain']}): fixed={row['Fixed']:.0f}, "
+              f"marginal={row['Marginal']:.0f}, break-even batch size={row['Break-even batch size']}")
+
+def print_setup_breakdown(setup_costs):
+    """Print the contracts that dominate the setup gas of every implementation."""
+    print("\nLargest parts of the setup gas (average over networks):")
+    for source, parts in largest_components(setup_costs).groupby('Source', sort=True):
+        summary = ', '.join(f"{row['Contract']} {row['Gas']:.0f} ({row['Gas share']:.0%})" for _, row in parts.iterrows())
+        print(f"  {source}: {summary}")
+
+def build_parser(description='Analyze ERC performance results and generate charts.'):
+    """Command-line options selecting data, charts and output formats."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--category', nargs='+', metavar='ERC',
+                        help='only analyze these ERC standards (e.g. ERC20 ERC1400 ERC3643)')
+    parser.add_argument('--subcategory', nargs='+', metavar='IMPL',
+                        help='only analyze these implementations (e.g. OpenZeppelin consensys TREX)')
+    parser.add_argument('--blockchain', nargs='+', metavar='NETWORK',
+                        help='only analyze these networks (e.g. hardhat sepolia holesky)')
+    parser.add_argument('--operation', nargs='+', metavar='OP',
+                        help='only analyze these operations (e.g. Transfer batchTransfer Deployment)')
+    parser.add_argument('--charts', nargs='+', choices=CHART_FAMILIES + ['all', 'none'], default=['all'],
+                        help='chart families to build (default: all)')
+    parser.add_argument('--formats', nargs='+', choices=['pdf', 'png', 'svg'], default=['pdf', 'png'],
+                        help='output formats of the individual charts (default: pdf png)')
+    parser.add_argument('--dpi', type=int, default=300, help='resolution of raster outputs (default: 300)')
+    parser.add_argument('--no-cache', action='store_true', help='redraw every chart even if unchanged')
+    parser.add_argument('--no-show', action='store_true', help='save charts without opening windows')
+    parser.add_argument('--max-points', type=int, default=2000,
+                        help='maximum points per line of the trend charts, longer histories are downsampled (default: 2000)')
+    parser.add_argument('--warmup-method', choices=WARMUP_METHODS, default='auto',
+                        help='how cold samples are found: iteration order, gas clustering, or auto '
+                             '(iteration where recorded, gas otherwise; default: auto)')
+    parser.add_argument('--warmup-iterations', type=int, default=1,
+                        help='leading iterations of every run counted as cold (default: 1)')
+    parser.add_argument('--streaming', action='store_true',
+                        help='compute statistics in bounded chunks without keeping raw rows in memory')
+    parser.add_argument('--chunksize', type=int, default=100000, help='rows per chunk in streaming mode (default: 100000)')
+    parser.add_argument('--memory-report', action='store_true', help='print the memory footprint of every column')
+    parser.add_argument('--bootstrap', action='store_true',
+                        help='compute bootstrap confidence intervals and pairwise significance tests')
+    parser.add_argument('--resamples', type=int, default=2000, help='bootstrap resamples per group (default: 2000)')
+    parser.add_argument('--confidence', type=float, default=0.95, help='confidence level of the intervals (default: 0.95)')
+    parser.add_argument('--alpha', type=float, default=0.05, help='significance level of the pairwise tests (default: 0.05)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed, fixed so cached charts stay valid (default: 0)')
+    parser.add_argument('--outliers', choices=OUTLIER_MODES, default='annotate',
+                        help='outlying averages among the implementations of an operation and network: keep as is, '
+                             'annotate with robust z-scores, or drop from the statistics (default: annotate)')
+    parser.add_argument('--outlier-threshold', type=float, default=THRESHOLD,
+                        help=f'modified z-score beyond which an average is an outlier (default: {THRESHOLD})')
+    parser.add_argument('--save-baseline', nargs='?', const='', metavar='LABEL',
+                        help='store the statistics of this run as a baseline (label defaults to the git commit)')
+    parser.add_argument('--compare-baseline', metavar='LABEL',
+                        help="compare this run with a stored baseline ('latest' for the most recent one)")
+    parser.add_argument('--baselines-dir', default='baselines', help='directory of stored baselines (default: baselines)')
+    parser.add_argument('--gas-tolerance', type=float, default=DEFAULT_TOLERANCES['Gas'],
+                        help='relative gas increase tolerated before flagging a regression (default: 0.01)')
+    parser.add_argument('--fee-tolerance', type=float, default=DEFAULT_TOLERANCES['Fee (weis)'],
+                        help='relative fee increase tolerated before flagging a regression (default: 0.10)')
+    parser.add_argument('--latency-tolerance', type=float, default=DEFAULT_TOLERANCES['Latency (ms)'],
+                        help='relative latency increase tolerated before flagging a regression (default: 0.25)')
+    parser.add_argument('--p-threshold', type=float, default=0.05,
+                        help='p-value below which a change beyond tolerance counts as real (default: 0.05)')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_DIR, metavar='DIR',
+                        help=f'save cProfile data of every stage to DIR (default: {PROFILE_DIR})')
+    parser.add_argument('--timings-top', type=int, default=10,
+                        help='slowest charts listed in the closing timing report (default: 10)')
+    return parser
+
+def parse_args(argv=None):
+    """Parse the command-line selection of data, charts and output formats."""
+    return build_parser().parse_args(argv)
+
+def new_run(args):
+    """State shared by the stages of one analysis run."""
+    return {'args': args, 'instrument': activate(Instrumentation(args.profile)),
+            'base_path': os.path.dirname(os.path.abspath(__file__)),
+            'data_files': None, 'df': None, 'stats_df': None, 'curves_df': None,
+            'batch_costs_df': None, 'batch_fit_df': None, 'setup_costs_df': None, 'distributions': None, 'status': 0}
+
+def discover_stage(run):
+    """Find the result files of the selected categories, False when there are none."""
+    args, instrument = run['args'], run['instrument']
+    print(f"Analyzing performance data in: {run['base_path']}")
     
     # Create output directories early
     os.makedirs('csv_output', exist_ok=True)
     
     # Find all data files
-    data_files = find_data_files(base_path)
-    print(f"Found {len(data_files['csv'])} CSV files and {len(data_files['json'])} JSON files:")
+    with instrument.stage('discovery'):
+        data_files = find_data_files(run['base_path'], args.category, args.subcategory)
+    run['data_files'] = data_files
+    print(f"Found {len(data_files['csv'])} CSV files, {len(data_files['log'])} results logs and {len(data_files['json'])} JSON files:")
     
     print("\nCSV Files:")
     for csv_file in data_files['csv']:
         print(f"  - {csv_file}")
     
+    if data_files['log']:
+        print("\nResults logs:")
+        for log_file in data_files['log']:
+            print(f"  - {log_file}")
+    
     print("\nJSON Files:")
     for json_file in data_files['json']:
         print(f"  - {json_file}")
     
-    if not data_files['csv'] and not data_files['json']:
+    if not data_files['csv'] and not data_files['log'] and not data_files['json']:
         print("No data files found!")
-        return
+        return False
+    return True
+
+def load_stage(run):
+    """Load the raw results and classify their warm-up, False when nothing matched."""
+    args, instrument, data_files = run['args'], run['instrument'], run['data_files']
+    with instrument.stage('open-loop curves'):
+        run['curves_df'] = load_open_loop_results(data_files['openloop'], args.blockchain)
+        if not run['curves_df'].empty:
+            run['curves_df'].to_csv('csv_output/latency_throughput.csv', index=False)
+    if matches_filter('Deployment', args.operation):
+        with instrument.stage('contract costs'):
+            contract_costs_df = load_contract_costs(data_files['json'], args.blockchain)
+            run['setup_costs_df'] = setup_components(contract_costs_df)
+            if not contract_costs_df.empty:
+                contract_costs_df.to_csv('csv_output/contract_costs.csv', index=False)
+                run['setup_costs_df'].to_csv('csv_output/setup_cost_breakdown.csv', index=False)
+                print_setup_breakdown(run['setup_costs_df'])
+    if args.streaming:
+        # Raw rows are never combined in memory, the statistics stage aggregates them chunk by chunk
+        run['df'] = pd.DataFrame(columns=DATA_COLUMNS)
+        return True
     
     # Load and process data
     print("\nLoading data...")
-    df = load_and_process_data(data_files)
+    with instrument.stage('load'):
+        df = load_and_process_data(data_files, args.blockchain, args.operation)
     
     if df.empty:
         print("No data loaded!")
-        return
+        return False
     
     print(f"\nTotal records loaded: {len(df)}")
     print(f"Categories found: {df['Category'].unique()}")
@@ -1002,24 +1750,179 @@ def main():
     if 'DataType' in df.columns:
         print(f"Data types found: {df['DataType'].unique()}")
     
+    footprint = memory_footprint(df)
+    total_bytes = footprint.iloc[-1]
+    print(f"In-memory size: {total_bytes['Bytes']} bytes ({total_bytes['Bytes/row']:.1f} bytes/row)")
+    if args.memory_report:
+        print(footprint.to_string(index=False))
+    
+    # Separate first-touch samples from the steady state
+    with instrument.stage('warmup'):
+        df = classify_warmup(df, args.warmup_method, args.warmup_iterations)
+    print(f"Cold samples: {(df['Phase'] == 'cold').sum()}, warm samples: {(df['Phase'] == 'warm').sum()} "
+          f"(method: {args.warmup_method})")
+    run['df'] = df
+    return True
+
+def stats_stage(run):
+    """Compute and save the statistics, batch costs and bootstrap intervals, False when nothing was aggregated."""
+    args, instrument, data_files, df = run['args'], run['instrument'], run['data_files'], run['df']
+    if args.streaming:
+        # Aggregate chunk by chunk, raw rows are never combined in memory
+        print(f"\nStreaming statistics in chunks of {args.chunksize} rows...")
+        aggregates = {}
+        with instrument.stage('streaming statistics'):
+            stats_df = compute_streaming_statistics(data_files, args.blockchain, args.operation, args.chunksize, aggregates)
+        
+        if stats_df.empty:
+            print("No data loaded!")
+            return False
+        
+        print(f"\nTotal records aggregated: {stats_df['Count'].sum()}")
+        stats_df = flag_outliers(stats_df, args)
+        # The sketches of the streamed groups already hold their distributions
+        with instrument.stage('distributions'):
+            run['distributions'] = save_distributions(pool_sketches(
+                {key: group_stats[DISTRIBUTION_METRIC] for key, group_stats in aggregates.items()
+                 if key[4] == 'Transaction' and group_stats[DISTRIBUTION_METRIC].count > 0},
+                lambda key: key[:4]))
+        if args.bootstrap:
+            print("Bootstrap needs the raw samples and is skipped in streaming mode.")
+        print("Cold and warm samples are not separated in streaming mode.")
+        run['stats_df'] = stats_df
+        return True
+    
     # Compute statistics
     print("\nComputing statistics...")
-    stats_df = compute_statistics(df)
+    with instrument.stage('statistics'):
+        stats_df = compute_statistics(df)
+        phase_stats_df = compute_phase_statistics(df)
+        stats_df = stats_df.merge(phase_columns(phase_stats_df), on=grouping_keys(GROUP_COLUMNS, stats_df), how='left')
+        stats_df = flag_outliers(stats_df, args)
+        
+        # Save results to CSV
+        phase_stats_df.to_csv('csv_output/phase_statistics.csv', index=False)
+    
+    # Percentiles and histograms the distribution charts are drawn from, whatever the sample count
+    with instrument.stage('distributions'):
+        run['distributions'] = save_distributions(group_sketches(df[df['DataType'] == 'Transaction']))
     
-    # Save results to CSV
-    stats_df.to_csv('csv_output/performance_statistics.csv', index=False)
-    df.to_csv('csv_output/combined_data.csv', index=False)
+    # Batch operations normalised to one transfer, with their fixed and marginal cost
+    with instrument.stage('batch costs'):
+        batch_costs_df = per_transfer_costs(df)
+        batch_fit_df = fit_batch_costs(batch_costs_df, single_transfer_costs(df))
+        if not batch_costs_df.empty:
+            batch_costs_df.to_csv('csv_output/batch_per_transfer.csv', index=False)
+            batch_fit_df.to_csv('csv_output/batch_cost_fit.csv', index=False)
+            print_break_even_table(batch_fit_df)
+    run['batch_costs_df'], run['batch_fit_df'] = batch_costs_df, batch_fit_df
+    with instrument.stage('export'):
+        df.to_csv('csv_output/combined_data.csv', index=False)
+    
+    if args.bootstrap:
+        print(f"\nBootstrapping confidence intervals and significance tests ({args.resamples} resamples)...")
+        with instrument.stage('bootstrap'):
+            intervals_df = compute_bootstrap_intervals(df, args.resamples, args.confidence, args.seed)
+            tests_df = compute_pairwise_tests(df, args.resamples, args.confidence, args.alpha, args.seed)
+        intervals_df.to_csv('csv_output/bootstrap_intervals.csv', index=False)
+        tests_df.to_csv('csv_output/pairwise_significance.csv', index=False)
+        if not tests_df.empty:
+            print(f"{tests_df['Significant'].sum()} of {len(tests_df)} pairwise differences are significant "
+                  f"at alpha={args.alpha} (Holm-corrected)")
+        # Interval columns drive the error bars of the charts
+        interval_columns = [c for c in intervals_df.columns if '_ci_' in c]
+        keys = grouping_keys(GROUP_COLUMNS, stats_df)
+        stats_df = stats_df.merge(intervals_df[keys + interval_columns], on=keys, how='left')
+    run['stats_df'] = stats_df
+    return True
+
+def save_distributions(sketches):
+    """Build and save the latency distribution tables of the sketched groups."""
+    if not sketches:
+        return None
+    distributions = distribution_tables(sketches)
+    distributions['groups'].to_csv('csv_output/latency_distributions.csv', index=False)
+    distributions['histograms'].to_csv('csv_output/latency_histograms.csv', index=False)
+    return distributions
+
+def flag_outliers(stats_df, args):
+    """Save the statistics with their outlier scores, return them without the outliers in drop mode."""
+    if args.outliers == 'keep':
+        stats_df.to_csv('csv_output/performance_statistics.csv', index=False)
+        return stats_df
+    annotated = annotate_outliers(stats_df, args.outlier_threshold)
+    # The CSV keeps every average, dropping only applies to the charts, tables and comparisons
+    annotated.to_csv('csv_output/performance_statistics.csv', index=False)
+    metrics = [metric for metric in OUTLIER_METRICS if f'{metric}_outlier' in annotated.columns]
+    outlying = annotated[annotated[[f'{metric}_outlier' for metric in metrics]].any(axis=1)] if metrics else annotated.iloc[:0]
+    print(f"{len(outlying)} of {len(annotated)} statistics rows have an outlying average "
+          f"(modified z-score beyond {args.outlier_threshold}){', dropped' if args.outliers == 'drop' and len(outlying) else ''}")
+    for _, row in outlying.iterrows():
+        flagged = ', '.join(f"{metric} z={row[f'{metric}_robust_z']:+.1f}" for metric in metrics if row[f'{metric}_outlier'])
+        print(f"  - {row['Source']} {row['Operation']} on {row['Blockchain']}: {flagged}")
+    return drop_outliers(annotated) if args.outliers == 'drop' else annotated
+
+def charts_stage(run):
+    """Render the selected chart families."""
+    args = run['args']
+    families = CHART_FAMILIES if 'all' in args.charts else [c for c in args.charts if c != 'none']
+    if families:
+        print("\nCreating visualizations...")
+        with run['instrument'].stage('rendering'):
+            create_visualizations(run['df'], run['stats_df'], use_cache=not args.no_cache, families=families,
+                                  formats=tuple(args.formats), dpi=args.dpi, show=not args.no_show,
+                                  max_points=args.max_points, batch_costs=run['batch_costs_df'],
+                                  batch_fit=run['batch_fit_df'], curves=run['curves_df'],
+                                  setup_costs=run['setup_costs_df'], outlier_threshold=args.outlier_threshold,
+                                  distributions=run['distributions'])
+    return True
+
+def compare_stage(run):
+    """Print the summary and check the statistics against a stored baseline, False when it cannot be loaded."""
+    args, stats_df = run['args'], run['stats_df']
     
     # Print summary
-    print_summary_table(stats_df)
+    with run['instrument'].stage('summary'):
+        print_summary_table(stats_df)
     
-    # Create visualizations
-    print("\nCreating visualizations...")
-    create_visualizations(df, stats_df)
+    # Check this run against a stored baseline before it is possibly replaced
+    if args.compare_baseline:
+        try:
+            label, baseline_df = load_baseline(args.compare_baseline, args.baselines_dir)
+        except FileNotFoundError as e:
+            print(f"Error loading baseline {args.compare_baseline}: {e}")
+            run['status'] = 2
+            return False
+        tolerances = {'Gas': args.gas_tolerance, 'Fee (weis)': args.fee_tolerance, 'Latency (ms)': args.latency_tolerance}
+        comparison = compare_to_baseline(stats_df, baseline_df, tolerances, args.p_threshold)
+        passed = write_regression_report(comparison, label)
+        os.makedirs('graphs', exist_ok=True)
+        plot_regression_diff(comparison, label, f'graphs/regression_vs_{label}.png')
+        counts = comparison['Status'].value_counts().to_dict()
+        print(f"\nBaseline comparison against {label}: {'PASSED' if passed else 'FAILED'} {counts}")
+        for _, row in comparison[comparison['Status'] == 'regression'].iterrows():
+            print(f"  REGRESSION {row['Category']}/{row['Subcategory']} {row['Operation']} ({row['Blockchain']}) "
+                  f"{row['Metric']}: {row['Baseline']:.2f} -> {row['Current']:.2f} ({row['Change']:+.1%})")
+        if not passed:
+            run['status'] = 1
     
+    if args.save_baseline is not None:
+        label = save_baseline(stats_df, args.save_baseline or None, args.baselines_dir)
+        print(f"\nBaseline saved as: {os.path.join(args.baselines_dir, label)}.csv")
+    return True
+
+def print_outputs(run):
+    """List the files written by the run and save its timings."""
+    args, instrument = run['args'], run['instrument']
     print(f"\nAnalysis complete!")
-    print(f"- Combined data saved to: csv_output/combined_data.csv")
+    if not args.streaming:
+        print(f"- Combined data saved to: csv_output/combined_data.csv")
     print(f"- Statistics saved to: csv_output/performance_statistics.csv")
+    if not args.streaming:
+        print(f"- Cold/warm statistics saved to: csv_output/phase_statistics.csv")
+    if args.bootstrap and not args.streaming:
+        print(f"- Confidence intervals saved to: csv_output/bootstrap_intervals.csv")
+        print(f"- Pairwise significance tests saved to: csv_output/pairwise_significance.csv")
     print(f"- Transaction visualizations saved to: graphs/transaction_performance_analysis.png")
     print(f"- Deployment & initialization visualizations saved to: graphs/deployment_performance_analysis.png")
     print(f"- Operation-focused visualizations saved to: graphs/[operation_name]_operation_analysis.png")
@@ -1029,8 +1932,38 @@ def main():
     print(f"  * Deployment charts: deploy_01 to deploy_06")
     print(f"  * Operation-focused charts: op_[operation]_[metric]_all_ercs.pdf/png")
     print(f"  * ERC Standard charts: erc_standard_[erc]_[metric].pdf/png")
+    print(f"  * Trend charts (schema v2+ results only): trend_[operation]_[metric].pdf/png")
+    print(f"  * Cold vs warm charts: warmup_[operation]_[metric].pdf/png")
+    print(f"  * Batch cost charts: batch_[operation]_[metric]_per_transfer.pdf/png")
+    print(f"  * Open-loop latency vs throughput charts: throughput_latency_[network].pdf/png")
+    print(f"  * Latency phase breakdown charts (schema v3+ results only): phases_[operation]_latency_breakdown.pdf/png")
+    print(f"  * Per-contract setup charts: contracts_[erc]_[metric] and setup_composition_[erc]_[metric].pdf/png")
+    print(f"  * Compliance enforcement charts (OracleBlock results only): compliance_enforcement_[erc].pdf/png")
+    print(f"  * Latency distribution charts: dist_[operation]_latency_[box|ecdf|heatmap].pdf/png")
+    if run['distributions'] is not None:
+        print(f"- Latency percentiles and histograms saved to: csv_output/latency_distributions.csv and latency_histograms.csv")
+    if run['batch_costs_df'] is not None and not run['batch_costs_df'].empty:
+        print(f"- Per-transfer batch costs saved to: csv_output/batch_per_transfer.csv and batch_cost_fit.csv")
+    if run['setup_costs_df'] is not None and not run['setup_costs_df'].empty:
+        print(f"- Per-contract setup costs saved to: csv_output/contract_costs.csv and setup_cost_breakdown.csv")
+    if args.compare_baseline:
+        print(f"- Regression report saved to: csv_output/regression_report.json")
+    print(f"- Stage and chart timings saved to: {TIMINGS_FILE}")
+    
+    instrument.write_csv(TIMINGS_FILE)
+    instrument.report(args.timings_top)
+
+def main(argv=None):
+    """Main function to run the analysis."""
+    
+    run = new_run(parse_args(argv))
+    for stage in (discover_stage, load_stage, stats_stage, compare_stage, charts_stage):
+        if not stage(run):
+            return run['status']
+    print_outputs(run)
+    return run['status']
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
 
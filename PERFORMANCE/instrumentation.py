@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import io
+import time
+import threading
+import cProfile
+import pstats
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+
+TIMINGS_FILE = 'csv_output/pipeline_timings.csv'
+PROFILE_DIR = 'profiles'
+PROFILE_TOP_FUNCTIONS = 30
+
+def peak_rss_mb():
+    """High-water mark of the resident set size of this process in MB."""
+    try:
+        import resource
+    except ImportError:
+        return np.nan
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def current_rss_mb():
+    """Resident set size of this process in MB, where the platform exposes it cheaply."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return np.nan
+
+class Instrumentation:
+    """Timers and memory counters of the stages and items (charts, tables) of one pipeline run."""
+
+    def __init__(self, profile_dir=None):
+        self.profile_dir = profile_dir
+        self.records = []
+        self.open_items = {}
+        self.profiling = False
+        # Stages open around the current one in each thread (pipeline.py runs stages concurrently),
+        # nested stages are indented and left out of the total
+        self.nesting = threading.local()
+        self.created = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        """Time a pipeline stage, profiling it with cProfile in profile mode."""
+        profiler = None
+        if self.profile_dir and not self.profiling:
+            # Only one profiler can run at a time, nested stages are covered by their parent
+            profiler = cProfile.Profile()
+            self.profiling = True
+        rss_before = current_rss_mb()
+        # Start times of the enclosing stages, the stage is listed below its parent in the report
+        parents = getattr(self.nesting, 'path', ())
+        start = time.perf_counter()
+        self.nesting.path = parents + (start,)
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+                self.profiling = False
+            self.nesting.path = parents
+            self.record('stage', name, time.perf_counter() - start, rss_before, path=parents + (start,))
+            if profiler:
+                self.write_profile(name, profiler)
+
+    @contextmanager
+    def item(self, kind, name):
+        """Time one item of a stage, e.g. a chart or a table."""
+        self.start_item(kind, name)
+        try:
+            yield
+        finally:
+            self.end_item(kind, name)
+
+    def start_item(self, kind, name):
+        """Start timing an item whose end is reported separately by end_item()."""
+        self.open_items[(kind, name)] = (time.perf_counter(), current_rss_mb())
+
+    def end_item(self, kind, name, status='done'):
+        """Stop timing an item started by start_item(), unknown items are ignored."""
+        started = self.open_items.pop((kind, name), None)
+        if started is not None:
+            self.record(kind, name, time.perf_counter() - started[0], started[1], status)
+
+    def record(self, kind, name, seconds, rss_before, status='done', path=()):
+        """Store one timing with the memory counters at its end."""
+        rss_after = current_rss_mb()
+        start = time.perf_counter() - seconds - self.created
+        self.records.append({'Kind': kind, 'Name': name, 'Status': status, 'Depth': max(len(path) - 1, 0),
+                             'Start (s)': start, 'Seconds': seconds, 'RSS delta (MB)': rss_after - rss_before,
+                             'Peak RSS (MB)': peak_rss_mb(), 'Path': path})
+
+    def write_profile(self, name, profiler):
+        """Save the cProfile data of a stage and a text summary of its most expensive functions."""
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base = os.path.join(self.profile_dir, name.replace(' ', '_'))
+        profiler.dump_stats(f'{base}.prof')
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+        with open(f'{base}.txt', 'w') as f:
+            f.write(summary.getvalue())
+
+    def timings(self):
+        """All timings recorded so far as a frame."""
+        return pd.DataFrame(self.records, columns=['Kind', 'Name', 'Status', 'Depth', 'Start (s)', 'Seconds',
+                                                   'RSS delta (MB)', 'Peak RSS (MB)'])
+
+    def write_csv(self, path=TIMINGS_FILE):
+        """Save the timings of this run."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.timings().to_csv(path, index=False)
+
+    def report(self, top=10):
+        """Print the stages in order and the slowest items of every kind."""
+        timings = self.timings()
+        if timings.empty:
+            return
+        # Nested stages finish, and are recorded, before their parent
+        paths = [record['Path'] for record in self.records]
+        stages = timings[timings['Kind'] == 'stage']
+        stages = stages.loc[sorted(stages.index, key=lambda index: paths[index])]
+        print("\n" + "=" * 80)
+        print("PIPELINE TIMINGS")
+        print("=" * 80)
+        if not stages.empty:
+            # Nested stages are part of their parent's time, only the top level adds up to the run
+            total = stages.loc[stages['Depth'] == 0, 'Seconds'].sum()
+            for _, row in stages.iterrows():
+                name = '  ' * row['Depth'] + row['Name']
+                print(f"  {name:<24} {row['Seconds']:9.3f} s {100 * row['Seconds'] / total:5.1f}%  "
+                      f"RSS {row['RSS delta (MB)']:+8.1f} MB  peak {row['Peak RSS (MB)']:8.1f} MB")
+            print(f"  {'total':<24} {total:9.3f} s")
+        for kind, items in timings[timings['Kind'] != 'stage'].groupby('Kind', sort=True):
+            slowest = items.sort_values('Seconds', ascending=False).head(top)
+            print(f"\n  Slowest {kind}s ({len(items)} timed, {items['Seconds'].sum():.3f} s in total):")
+            for _, row in slowest.iterrows():
+                status = '' if row['Status'] == 'done' else f" [{row['Status']}]"
+                print(f"    {row['Name']:<60} {row['Seconds']:9.3f} s  RSS {row['RSS delta (MB)']:+8.1f} MB{status}")
+        if self.profile_dir:
+            print(f"\n  cProfile data per stage saved to: {self.profile_dir}/[stage].prof and .txt")
+
+# Instrumentation of the running pipeline, reached by shared helpers such as RenderCache without passing it around
+_active = None
+
+def activate(instrumentation):
+    """Make an instrumentation the target of the module-level hooks, None disables them."""
+    global _active
+    _active = instrumentation
+    return instrumentation
+
+def start_item(kind, name):
+    """Hook: start timing an item on the active instrumentation, if any."""
+    if _active is not None and name is not None:
+        _active.start_item(kind, name)
+
+def end_item(kind, name, status='done'):
+    """Hook: stop timing an item on the active instrumentation, if any."""
+    if _active is not None and name is not None:
+        _active.end_item(kind, name, status)
@@ -3,12 +3,17 @@
 import pandas as pd
 import numpy as np
 import os
+import argparse
+import json
 from pathlib import Path
+from render_cache import hash_data, script_version
+from instrumentation import Instrumentation, activate, PROFILE_DIR
 
 def load_performance_data():
     """Load the performance statistics CSV file."""
     try:
-        stats_df = pd.read_csv('csv_output/performance_statistics.csv')
+        # Exact float parsing keeps the cache fingerprints equal to those of in-memory statistics
+        stats_df = pd.read_csv('csv_output/performance_statistics.csv', float_precision='round_trip')
         return stats_df
     except FileNotFoundError:
         print("Error: csv_output/performance_statistics.csv not found. Please run graphs.py first.")
@@ -48,497 +53,286 @@ def get_network_display_name(network):
     }
     return name_mapping.get(network.lower(), network.capitalize())
 
-def generate_deployment_table(category_data, category):
-    """Generate LaTeX table for deployment metrics."""
-    # Filter deployment data
-    deployment_data = category_data[category_data['DataType'] == 'Deployment'].copy()
-    
-    if deployment_data.empty:
-        return ""
-    
-    # Get unique subcategories and networks
-    subcategories = sorted(deployment_data['Subcategory'].unique())
-    networks = sorted(deployment_data['Blockchain'].unique(), key=lambda x: x.lower())
-    
-    # Create pivot table for gas consumption (convert to Gweis)
-    gas_pivot = deployment_data.pivot_table(
-        index='Blockchain', 
-        columns='Subcategory', 
-        values='Gas_avg', 
-        fill_value=0
-    )
-    
-    # Create pivot table for fees (convert to Gweis)
-    fee_pivot = deployment_data.pivot_table(
-        index='Blockchain', 
-        columns='Subcategory', 
-        values='Fee (weis)_avg', 
-        fill_value=0
-    )
-    fee_pivot = fee_pivot.apply(weis_to_gweis)
-    
-    # Create pivot table for latency
-    latency_pivot = deployment_data.pivot_table(
-        index='Blockchain', 
-        columns='Subcategory', 
-        values='Latency (ms)_avg', 
-        fill_value=0
-    )
-    
-    tables = []
-    
-    # Gas consumption table
-    if not gas_pivot.empty:
-        table_gas = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(subcategories)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in subcategories])} \\\\
-  \\hline
-  \\hline"""
-        
-        for network in networks:
-            if network in gas_pivot.index:
-                values = []
-                for sub in subcategories:
-                    if sub in gas_pivot.columns:
-                        value = gas_pivot.loc[network, sub]
-                        values.append(format_number(value, 0))  # Gas as integer
-                    else:
-                        values.append("0")
-                table_gas += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-        
-        table_gas += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Consumo de gas en despliegue de {category} (en unidades de gas)}}
-\\label{{tab:{category.lower()}_gas_deployment}}
-\\end{{table}}
+# Steady-state averages of the three metrics: column, label suffix, decimals and unit conversion
+TABLE_METRICS = [
+    ('Gas_avg', 'gas', 0, None),
+    ('Fee (weis)_avg', 'fees', 2, weis_to_gweis),
+    ('Latency (ms)_avg', 'latency', 2, None)
+]
+COLD_COLUMN = 'Gas_cold_avg'
+WARM_COLUMNS = {'Gas_avg': 'Gas_warm_avg', 'Fee (weis)_avg': 'Fee (weis)_warm_avg', 'Latency (ms)_avg': 'Latency (ms)_warm_avg'}
+KEY_COLUMNS = ['DataType', 'Operation', 'Blockchain', 'Subcategory']
+SETUP_TYPES = [('Deployment', 'despliegue', 'deployment'), ('Initialization', 'inicialización', 'init')]
+TRANSACTION_CAPTIONS = {
+    'gas': 'Consumo de gas en {operation} de {category} en régimen estable (en unidades de gas)',
+    'fees': 'Tarifas en {operation} de {category} en régimen estable (en Gweis)',
+    'latency': 'Latencia en {operation} de {category} en régimen estable (en milisegundos)'
+}
+SETUP_CAPTIONS = {
+    'gas': 'Consumo de gas en {stage} de {category} (en unidades de gas)',
+    'fees': 'Tarifas de {stage} de {category} (en Gweis)',
+    'latency': 'Latencia de {stage} de {category} (en milisegundos)'
+}
+COLD_CAPTION = 'Consumo de gas en la primera llamada (almacenamiento en frío) de {operation} de {category} (en unidades de gas)'
 
-"""
-        tables.append(table_gas)
-    
-    # Fees table
-    if not fee_pivot.empty:
-        table_fees = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(subcategories)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in subcategories])} \\\\
-  \\hline
-  \\hline"""
-        
-        for network in networks:
-            if network in fee_pivot.index:
-                values = []
-                for sub in subcategories:
-                    if sub in fee_pivot.columns:
-                        value = fee_pivot.loc[network, sub]
-                        values.append(format_number(value))
-                    else:
-                        values.append("0.00")
-                table_fees += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-        
-        table_fees += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Tarifas de despliegue de {category} (en Gweis)}}
-\\label{{tab:{category.lower()}_fees_deployment}}
-\\end{{table}}
+LATEX_OUTPUT_DIR = 'latex_output'
+COMBINED_FILE = 'performance_latex_tables.tex'
+INDEX_FILE = 'tables_index.tex'
+FRAGMENT_PREFIX = 'tables_'
+CACHE_FILE = '.latex_cache.json'
+PREAMBLE = """% LaTeX Tables for Blockchain Performance Analysis
+% Generated automatically from performance statistics
 
-"""
-        tables.append(table_fees)
-    
-    # Latency table
-    if not latency_pivot.empty:
-        table_latency = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(subcategories)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in subcategories])} \\\\
-  \\hline
-  \\hline"""
-        
-        for network in networks:
-            if network in latency_pivot.index:
-                values = []
-                for sub in subcategories:
-                    if sub in latency_pivot.columns:
-                        value = latency_pivot.loc[network, sub]
-                        values.append(format_number(value))
-                    else:
-                        values.append("0.00")
-                table_latency += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-        
-        table_latency += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Latencia de despliegue de {category} (en milisegundos)}}
-\\label{{tab:{category.lower()}_latency_deployment}}
-\\end{{table}}
+% Required packages:
+% \\usepackage{xcolor}
+% \\usepackage{colortbl}
+% \\usepackage{booktabs}
 
 """
-        tables.append(table_latency)
-    
-    return "\n".join(tables)
 
-def generate_initialization_table(category_data, category):
-    """Generate LaTeX table for initialization metrics."""
-    # Filter initialization data
-    init_data = category_data[category_data['DataType'] == 'Initialization'].copy()
-    
-    if init_data.empty:
-        return ""
-    
-    # Get unique subcategories and networks
-    subcategories = sorted(init_data['Subcategory'].unique())
-    networks = sorted(init_data['Blockchain'].unique(), key=lambda x: x.lower())
-    
-    # Create pivot table for gas consumption
-    gas_pivot = init_data.pivot_table(
-        index='Blockchain', 
-        columns='Subcategory', 
-        values='Gas_avg', 
-        fill_value=0
-    )
-    
-    # Create pivot table for fees (convert to Gweis)
-    fee_pivot = init_data.pivot_table(
-        index='Blockchain', 
-        columns='Subcategory', 
-        values='Fee (weis)_avg', 
-        fill_value=0
-    )
-    fee_pivot = fee_pivot.apply(weis_to_gweis)
-    
-    # Create pivot table for latency
-    latency_pivot = init_data.pivot_table(
-        index='Blockchain', 
-        columns='Subcategory', 
-        values='Latency (ms)_avg', 
-        fill_value=0
-    )
-    
-    tables = []
-    
-    # Gas consumption table
-    if not gas_pivot.empty:
-        table_gas = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(subcategories)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in subcategories])} \\\\
-  \\hline
-  \\hline"""
-        
-        for network in networks:
-            if network in gas_pivot.index:
-                values = []
-                for sub in subcategories:
-                    if sub in gas_pivot.columns:
-                        value = gas_pivot.loc[network, sub]
-                        values.append(format_number(value, 0))  # Gas as integer
-                    else:
-                        values.append("0")
-                table_gas += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-        
-        table_gas += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Consumo de gas en inicialización de {category} (en unidades de gas)}}
-\\label{{tab:{category.lower()}_gas_init}}
-\\end{{table}}
+def category_pivot(category_data):
+    """One pivot of every table metric of a category by data type, operation and network."""
+    data = category_data.copy()
+    # Report the steady state, first-touch samples get a table of their own
+    transactions = data['DataType'] == 'Transaction'
+    for column, warm_column in WARM_COLUMNS.items():
+        if warm_column in data.columns:
+            data.loc[transactions, column] = data.loc[transactions, warm_column].fillna(data.loc[transactions, column])
+    values = [column for column, _, _, _ in TABLE_METRICS + [(COLD_COLUMN, None, None, None)] if column in data.columns]
+    pivot = data.pivot_table(index=['DataType', 'Operation', 'Blockchain'], columns='Subcategory', values=values,
+                             aggfunc='mean')
+    # Implementations and networks of every table, including those whose values are all missing
+    subcategories = data.groupby(['DataType', 'Operation'])['Subcategory'].unique()
+    networks = data.groupby('DataType')['Blockchain'].unique()
+    return pivot, subcategories, networks
 
-"""
-        tables.append(table_gas)
-    
-    # Fees table
-    if not fee_pivot.empty:
-        table_fees = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(subcategories)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in subcategories])} \\\\
-  \\hline
-  \\hline"""
-        
-        for network in networks:
-            if network in fee_pivot.index:
-                values = []
-                for sub in subcategories:
-                    if sub in fee_pivot.columns:
-                        value = fee_pivot.loc[network, sub]
-                        values.append(format_number(value))
-                    else:
-                        values.append("0.00")
-                table_fees += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-        
-        table_fees += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Tarifas de inicialización de {category} (en Gweis)}}
-\\label{{tab:{category.lower()}_fees_init}}
-\\end{{table}}
+def format_cells(values, decimals, missing="0.00"):
+    """Format a block of table values at once, zero and missing cells like format_number()."""
+    cells = np.char.mod(f'%.{decimals}f', np.nan_to_num(values))
+    cells = np.where(np.isnan(values), missing, cells)
+    return np.where(values == 0, "0.00", cells)
 
-"""
-        tables.append(table_fees)
-    
-    # Latency table (like your example)
-    if not latency_pivot.empty:
-        table_latency = f"""\\begin{{table}}[!ht]
+def render_rows(networks, cells):
+    """Body lines of a table, one per network, joined column by column over all rows."""
+    body = cells[:, 0]
+    for column in range(1, cells.shape[1]):
+        body = np.char.add(np.char.add(body, ' & '), cells[:, column])
+    labels = np.array([f"\n  \\textbf{{{get_network_display_name(network)}}} & " for network in networks])
+    return ''.join(np.char.add(np.char.add(labels, body), " \\\\"))
+
+def render_table(networks, subcategories, cells, caption, label):
+    """Complete LaTeX table of network rows by implementation columns."""
+    header = ' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in subcategories])
+    return f"""\\begin{{table}}[!ht]
 \\centering
 \\rowcolors{{1}}{{blue!20}}{{white}}
 \\begin{{tabular}}{{|c|{'c|' * len(subcategories)}}}
 \\rowcolor{{blue!50}}
   \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in subcategories])} \\\\
+  \\textbf{{Red/ERC}} & {header} \\\\
   \\hline
-  \\hline"""
-        
-        for network in networks:
-            if network in latency_pivot.index:
-                values = []
-                for sub in subcategories:
-                    if sub in latency_pivot.columns:
-                        value = latency_pivot.loc[network, sub]
-                        values.append(format_number(value))
-                    else:
-                        values.append("0.00")
-                table_latency += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-        
-        table_latency += f"""
+  \\hline{render_rows(networks, cells) if len(networks) else ''}
   \\hline
 \\end{{tabular}}
-\\caption{{Latencia de inicialización de {category} (en milisegundos)}}
-\\label{{tab:{category.lower()}_latency_init}}
+\\caption{{{caption}}}
+\\label{{{label}}}
 \\end{{table}}
 
 """
-        tables.append(table_latency)
-    
-    return "\n".join(tables)
 
-def generate_transaction_tables(category_data, category):
+def metric_values(block, column, networks, subcategories):
+    """Values of one metric of a pivot block as a network by implementation array."""
+    if column not in block.columns.get_level_values(0):
+        return np.full((len(networks), len(subcategories)), np.nan)
+    return block[column].reindex(index=networks, columns=subcategories).to_numpy(dtype=np.float64)
+
+def block_tables(pivot, data_type, operation, subcategories, networks, captions, labels):
+    """Metric tables of one data type and operation, networks without any value are left out."""
+    key = (data_type, operation)
+    if key not in pivot.index.droplevel(2):
+        return []
+    block = pivot.xs(key, level=['DataType', 'Operation'])
+    subcategories = sorted(subcategories)
+    tables = []
+    for column, name, decimals, convert in TABLE_METRICS:
+        values = metric_values(block, column, networks, subcategories)
+        present = ~np.isnan(values).all(axis=1)
+        if not present.any():
+            continue
+        values = values[present]
+        if convert is not None:
+            values = convert(values)
+        tables.append(render_table([n for n, keep in zip(networks, present) if keep], subcategories,
+                                   format_cells(values, decimals), captions[name], labels[name]))
+    return tables
+
+def generate_cold_start_table(pivot, operation, category, subcategories, networks):
+    """Generate LaTeX table for the gas of first-touch (cold) samples of an operation."""
+    key = ('Transaction', operation)
+    if key not in pivot.index.droplevel(2):
+        return ""
+    values = metric_values(pivot.xs(key, level=['DataType', 'Operation']), COLD_COLUMN, networks, sorted(subcategories))
+    if np.isnan(values).all():
+        return ""
+    operation_clean = operation.lower().replace(' ', '_')
+    # Implementations without a cold regime pay the steady-state cost from the first call
+    return render_table(networks, sorted(subcategories), format_cells(values, 0, "-"),
+                        COLD_CAPTION.format(operation=operation, category=category),
+                        f"tab:{category.lower()}_{operation_clean}_gas_cold")
+
+def generate_setup_tables(pivot, subcategories, networks, category, data_type, stage, label_suffix):
+    """Generate LaTeX tables for the deployment or initialization metrics of a category."""
+    if (data_type, data_type) not in subcategories.index:
+        return ""
+    setup_networks = sorted(networks[data_type], key=lambda x: x.lower())
+    captions = {name: caption.format(stage=stage, category=category) for name, caption in SETUP_CAPTIONS.items()}
+    labels = {name: f"tab:{category.lower()}_{name}_{label_suffix}" for name in SETUP_CAPTIONS}
+    return "\n".join(block_tables(pivot, data_type, data_type, subcategories[(data_type, data_type)], setup_networks,
+                                  captions, labels))
+
+def generate_transaction_tables(pivot, subcategories, networks, category):
     """Generate LaTeX tables for transaction operations."""
-    # Filter transaction data
-    tx_data = category_data[category_data['DataType'] == 'Transaction'].copy()
-    
-    if tx_data.empty:
+    if 'Transaction' not in networks.index:
         return ""
-    
-    # Get unique operations, subcategories, and networks
-    operations = sorted(tx_data['Operation'].unique())
-    subcategories = sorted(tx_data['Subcategory'].unique())
-    networks = sorted(tx_data['Blockchain'].unique(), key=lambda x: x.lower())
-    
+    tx_networks = sorted(networks['Transaction'], key=lambda x: x.lower())
     tables = []
-    
-    # Create tables for each operation
-    for operation in operations:
-        op_data = tx_data[tx_data['Operation'] == operation].copy()
-        
-        if op_data.empty:
+    for (data_type, operation), operation_subcategories in subcategories.sort_index().items():
+        if data_type != 'Transaction':
             continue
-        
-        # Create pivot tables
-        gas_pivot = op_data.pivot_table(
-            index='Blockchain', 
-            columns='Subcategory', 
-            values='Gas_avg', 
-            fill_value=0
-        )
-        
-        fee_pivot = op_data.pivot_table(
-            index='Blockchain', 
-            columns='Subcategory', 
-            values='Fee (weis)_avg', 
-            fill_value=0
-        )
-        fee_pivot = fee_pivot.apply(weis_to_gweis)
-        
-        latency_pivot = op_data.pivot_table(
-            index='Blockchain', 
-            columns='Subcategory', 
-            values='Latency (ms)_avg', 
-            fill_value=0
-        )
-        
-        # Get available subcategories for this operation
-        available_subcats = sorted(op_data['Subcategory'].unique())
-        
-        # Gas consumption table
-        if not gas_pivot.empty:
-            table_gas = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(available_subcats)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in available_subcats])} \\\\
-  \\hline
-  \\hline"""
-            
-            for network in networks:
-                if network in gas_pivot.index:
-                    values = []
-                    for sub in available_subcats:
-                        if sub in gas_pivot.columns:
-                            value = gas_pivot.loc[network, sub]
-                            values.append(format_number(value, 0))
-                        else:
-                            values.append("0")
-                    table_gas += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-            
-            operation_clean = operation.lower().replace(' ', '_')
-            table_gas += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Consumo de gas en {operation} de {category} (en unidades de gas)}}
-\\label{{tab:{category.lower()}_{operation_clean}_gas}}
-\\end{{table}}
+        operation_clean = operation.lower().replace(' ', '_')
+        captions = {name: caption.format(operation=operation, category=category)
+                    for name, caption in TRANSACTION_CAPTIONS.items()}
+        labels = {name: f"tab:{category.lower()}_{operation_clean}_{name}" for name in TRANSACTION_CAPTIONS}
+        tables += block_tables(pivot, data_type, operation, operation_subcategories, tx_networks, captions, labels)
+        cold_table = generate_cold_start_table(pivot, operation, category, operation_subcategories, tx_networks)
+        if cold_table:
+            tables.append(cold_table)
+    return "\n".join(tables)
 
-"""
-            tables.append(table_gas)
-        
-        # Fees table
-        if not fee_pivot.empty:
-            table_fees = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(available_subcats)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in available_subcats])} \\\\
-  \\hline
-  \\hline"""
-            
-            for network in networks:
-                if network in fee_pivot.index:
-                    values = []
-                    for sub in available_subcats:
-                        if sub in fee_pivot.columns:
-                            value = fee_pivot.loc[network, sub]
-                            values.append(format_number(value))
-                        else:
-                            values.append("0.00")
-                    table_fees += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-            
-            table_fees += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Tarifas en {operation} de {category} (en Gweis)}}
-\\label{{tab:{category.lower()}_{operation_clean}_fees}}
-\\end{{table}}
+def generate_category_tables(category_data, category):
+    """All tables of one category as a self-contained .tex fragment."""
+    pivot, subcategories, networks = category_pivot(category_data)
+    parts = [f"""
+% ===============================================
+% {category} TABLES
+% ===============================================
 
-"""
-            tables.append(table_fees)
-        
-        # Latency table
-        if not latency_pivot.empty:
-            table_latency = f"""\\begin{{table}}[!ht]
-\\centering
-\\rowcolors{{1}}{{blue!20}}{{white}}
-\\begin{{tabular}}{{|c|{'c|' * len(available_subcats)}}}
-\\rowcolor{{blue!50}}
-  \\hline
-  \\textbf{{Red/ERC}} & {' & '.join([f'\\textbf{{{get_subcategory_display_name(sub)}}}' for sub in available_subcats])} \\\\
-  \\hline
-  \\hline"""
-            
-            for network in networks:
-                if network in latency_pivot.index:
-                    values = []
-                    for sub in available_subcats:
-                        if sub in latency_pivot.columns:
-                            value = latency_pivot.loc[network, sub]
-                            values.append(format_number(value))
-                        else:
-                            values.append("0.00")
-                    table_latency += f"\n  \\textbf{{{get_network_display_name(network)}}} & {' & '.join(values)} \\\\"
-            
-            table_latency += f"""
-  \\hline
-\\end{{tabular}}
-\\caption{{Latencia en {operation} de {category} (en milisegundos)}}
-\\label{{tab:{category.lower()}_{operation_clean}_latency}}
-\\end{{table}}
+"""]
+    sections = [(data_type, generate_setup_tables(pivot, subcategories, networks, category, data_type, stage, suffix))
+                for data_type, stage, suffix in SETUP_TYPES]
+    sections.append(('Transaction', generate_transaction_tables(pivot, subcategories, networks, category)))
+    for title, tables in sections:
+        if tables:
+            parts.append(f"% {category} {title} Tables\n")
+            parts.append(tables + "\n")
+    return ''.join(parts)
 
-"""
-            tables.append(table_latency)
-    
-    return "\n".join(tables)
+def category_fingerprint(category_data, version):
+    """Fingerprint of the statistics a category's tables are built from."""
+    columns = [c for c in KEY_COLUMNS + [m for m, _, _, _ in TABLE_METRICS] + list(WARM_COLUMNS.values()) + [COLD_COLUMN]
+               if c in category_data.columns]
+    data = category_data[columns].sort_values(KEY_COLUMNS).reset_index(drop=True)
+    return hash_data([data, version])
+
+def load_cache(output_dir):
+    """Fingerprints of the fragments written by the previous run."""
+    try:
+        with open(os.path.join(output_dir, CACHE_FILE)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def write_cache(output_dir, cache):
+    """Atomically persist the fragment fingerprints."""
+    path = os.path.join(output_dir, CACHE_FILE)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+def table_statistics(stats_df):
+    """Statistics as read back from performance_statistics.csv, with plain text keys and float metrics."""
+    data = stats_df.copy()
+    for column in ['Category'] + KEY_COLUMNS:
+        data[column] = data[column].astype(str)
+    metrics = [c for c in [m for m, _, _, _ in TABLE_METRICS] + list(WARM_COLUMNS.values()) + [COLD_COLUMN]
+               if c in data.columns]
+    data[metrics] = data[metrics].astype(np.float64)
+    return data
 
-def generate_latex_tables():
-    """Main function to generate all LaTeX tables."""
+def generate_latex_tables(instrument=None, force=False, stats_df=None):
+    """Main function to generate all LaTeX tables, from in-memory statistics when given."""
+    instrument = instrument or Instrumentation()
     # Load data
-    stats_df = load_performance_data()
     if stats_df is None:
-        return
+        with instrument.stage('load statistics'):
+            stats_df = load_performance_data()
+        if stats_df is None:
+            return None
+    stats_df = table_statistics(stats_df)
     
     # Create output directory
-    latex_output_dir = 'latex_output'
-    os.makedirs(latex_output_dir, exist_ok=True)
-    
-    # Create output content
-    latex_content = """% LaTeX Tables for Blockchain Performance Analysis
-% Generated automatically from performance statistics
-
-% Required packages:
-% \\usepackage{xcolor}
-% \\usepackage{colortbl}
-% \\usepackage{booktabs}
-
-"""
+    os.makedirs(LATEX_OUTPUT_DIR, exist_ok=True)
+    version = script_version(os.path.abspath(__file__))
+    cache = {} if force else load_cache(LATEX_OUTPUT_DIR)
     
     # Get unique categories (ERCs)
     categories = sorted(stats_df['Category'].unique())
     
-    for category in categories:
-        category_data = stats_df[stats_df['Category'] == category].copy()
-        
-        latex_content += f"""
-% ===============================================
-% {category} TABLES
-% ===============================================
-
-"""
-        
-        # Generate deployment tables
-        deployment_tables = generate_deployment_table(category_data, category)
-        if deployment_tables:
-            latex_content += f"% {category} Deployment Tables\n"
-            latex_content += deployment_tables + "\n"
-        
-        # Generate initialization tables
-        init_tables = generate_initialization_table(category_data, category)
-        if init_tables:
-            latex_content += f"% {category} Initialization Tables\n"
-            latex_content += init_tables + "\n"
-        
-        # Generate transaction tables
-        tx_tables = generate_transaction_tables(category_data, category)
-        if tx_tables:
-            latex_content += f"% {category} Transaction Tables\n"
-            latex_content += tx_tables + "\n"
+    fragments = {}
+    regenerated = []
+    with instrument.stage('tables'):
+        for category, category_data in stats_df.groupby('Category', sort=True):
+            fragment_name = f"{FRAGMENT_PREFIX}{category}.tex"
+            fragment_path = os.path.join(LATEX_OUTPUT_DIR, fragment_name)
+            fingerprint = category_fingerprint(category_data, version)
+            entry = cache.get(category, {})
+            # Only categories whose statistics changed are rendered again
+            if entry.get('fingerprint') == fingerprint and os.path.exists(fragment_path):
+                with open(fragment_path, encoding='utf-8') as f:
+                    fragments[category] = f.read()
+                continue
+            with instrument.item('table', category):
+                fragments[category] = generate_category_tables(category_data, category)
+            with open(fragment_path, 'w', encoding='utf-8') as f:
+                f.write(fragments[category])
+            cache[category] = {'fingerprint': fingerprint, 'file': fragment_name}
+            regenerated.append(category)
     
-    # Save to file
-    output_file = os.path.join(latex_output_dir, 'performance_latex_tables.tex')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(latex_content)
+    # Save the index, the combined file and the fingerprints
+    with instrument.stage('write'):
+        for category in set(cache) - set(categories):
+            stale = os.path.join(LATEX_OUTPUT_DIR, cache.pop(category)['file'])
+            if os.path.exists(stale):
+                os.remove(stale)
+        index = [PREAMBLE, "% Fragments are \\input relative to latex_output\n"]
+        index += [f"\\input{{{FRAGMENT_PREFIX}{category}}}\n" for category in categories]
+        with open(os.path.join(LATEX_OUTPUT_DIR, INDEX_FILE), 'w', encoding='utf-8') as f:
+            f.write(''.join(index))
+        output_file = os.path.join(LATEX_OUTPUT_DIR, COMBINED_FILE)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(PREAMBLE + ''.join(fragments[category] for category in categories))
+        write_cache(LATEX_OUTPUT_DIR, cache)
     
     print(f"LaTeX tables generated successfully!")
     print(f"Output saved to: {output_file}")
+    print(f"Per-category fragments: {os.path.join(LATEX_OUTPUT_DIR, FRAGMENT_PREFIX)}[category].tex, "
+          f"index: {os.path.join(LATEX_OUTPUT_DIR, INDEX_FILE)}")
     print(f"Tables generated for categories: {', '.join(categories)}")
+    print(f"Regenerated: {', '.join(regenerated) if regenerated else 'none, all categories unchanged'}")
+    return output_file
+
+def parse_args(argv=None):
+    """Parse the profiling options."""
+    parser = argparse.ArgumentParser(description='Generate LaTeX tables from csv_output/performance_statistics.csv.')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_DIR, metavar='DIR',
+                        help=f'save cProfile data of every stage to DIR (default: {PROFILE_DIR})')
+    parser.add_argument('--timings', action='store_true', help='print the stage and table timings')
+    parser.add_argument('--force', action='store_true', help='regenerate every category even if its statistics are unchanged')
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    generate_latex_tables()
+    args = parse_args()
+    instrument = activate(Instrumentation(args.profile))
+    generate_latex_tables(instrument, args.force)
+    if args.timings or args.profile:
+        instrument.report()
@@ -0,0 +1,10 @@
+"""Concurrent load generator for the ERC benchmark contracts.
+
+Run it from the PERFORMANCE directory with ``python -m loadgen <implementation dir>``.
+"""
+
+from .config import load_target
+from .results import prepare_results_file, append_results, format_row, append_summary
+from .generator import run_load
+
+__all__ = ['load_target', 'prepare_results_file', 'append_results', 'format_row', 'append_summary', 'run_load']
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+import sys
+from .config import DEFAULT_RPC_URLS, load_target, network_name
+from .results import new_run_id, append_results, format_row, append_summary, SUMMARY_FILE
+from .generator import run_load
+from .openloop import ARRIVAL_PROCESSES, OPENLOOP_FILE, run_open_loop, step_rates, append_open_loop
+from results_log import RESULTS_LOG, append_records
+
+def parse_args(argv=None):
+    """Parse the target implementation, network and load shape."""
+    parser = argparse.ArgumentParser(prog='python -m loadgen',
+                                     description='Send concurrent token transfers and append them to the results of the implementation.')
+    parser.add_argument('implementation', help='implementation directory (e.g. ERC20/OpenZeppelin)')
+    parser.add_argument('--network', default='hardhat', help='network of deployment-addresses.json (default: hardhat)')
+    parser.add_argument('--rpc-url', help='RPC endpoint (default: the usual endpoint of the network)')
+    parser.add_argument('--senders', type=int, default=4, help='concurrent sender accounts (default: 4)')
+    parser.add_argument('--in-flight', type=int, default=1,
+                        help='pending transactions per sender, each with its own nonce (default: 1)')
+    parser.add_argument('--transactions', type=int, default=100, help='transactions in total (default: 100)')
+    parser.add_argument('--amount', type=int, default=1, help='tokens per transfer (default: 1)')
+    parser.add_argument('--receiver', help='receiver address (default: the second account of the node)')
+    parser.add_argument('--fund', type=int, default=0,
+                        help='tokens sent from the first sender to the others before the run (default: 0)')
+    parser.add_argument('--private-keys-env', metavar='VAR',
+                        help='environment variable with comma-separated sender keys (default: unlocked node accounts)')
+    parser.add_argument('--gas-limit', type=int, default=300000, help='gas limit of every transfer (default: 300000)')
+    parser.add_argument('--operation', help="operation label of the samples (default: 'Transfer xN' for N senders)")
+    parser.add_argument('--dry-run', action='store_true', help='measure without writing any results')
+    parser.add_argument('--csv', action='store_true',
+                        help=f'append the samples to results.csv as text instead of the {RESULTS_LOG} binary log')
+    parser.add_argument('--open-loop', action='store_true',
+                        help='send at a fixed offered rate regardless of completions and step it up to saturation')
+    parser.add_argument('--arrival', choices=ARRIVAL_PROCESSES, default='constant',
+                        help='arrival process of the open-loop mode (default: constant)')
+    parser.add_argument('--rates', type=float, nargs='+', metavar='TX_PER_S',
+                        help='offered rates to step through (default: a ladder from --start-rate to --max-rate)')
+    parser.add_argument('--start-rate', type=float, default=1.0, help='first offered rate in tx/s (default: 1)')
+    parser.add_argument('--rate-factor', type=float, default=2.0, help='growth of the offered rate per step (default: 2)')
+    parser.add_argument('--max-rate', type=float, default=256.0, help='highest offered rate in tx/s (default: 256)')
+    parser.add_argument('--step-duration', type=float, default=10.0, help='seconds per offered rate (default: 10)')
+    parser.add_argument('--keep-going', action='store_true', help='keep stepping after the saturation knee')
+    parser.add_argument('--seed', type=int, help='random seed of the Poisson arrivals')
+    return parser.parse_args(argv)
+
+def main_open_loop(args, network, rpc_url, token_address, private_keys):
+    """Step the offered rate of an open-loop run and record the latency-throughput curve."""
+    rates = args.rates or step_rates(args.start_rate, args.rate_factor, args.max_rate)
+    operation = args.operation or 'Transfer'
+    steps = asyncio.run(run_open_loop(
+        rpc_url, token_address, network, rates, duration=args.step_duration, process=args.arrival,
+        operation=operation, senders=args.senders, amount=args.amount, receiver=args.receiver,
+        private_keys=private_keys, gas_limit=args.gas_limit, fund=args.fund, seed=args.seed,
+        stop_after_knee=not args.keep_going))
+    sustained = [step for step in steps if not step['Saturated']]
+    if sustained:
+        knee = sustained[-1]
+        print(f"Saturation knee: {knee['Target rate (tx/s)']} tx/s offered, {knee['Throughput (tx/s)']} tx/s sustained "
+              f"at p95 {knee['Latency p95 (ms)']} ms")
+    else:
+        print("Saturated already at the lowest offered rate")
+    if not args.dry_run:
+        output_file = os.path.join(args.implementation, OPENLOOP_FILE)
+        append_open_loop(output_file, new_run_id(), steps)
+        print(f"Latency-throughput curve appended to {output_file}")
+    return 0
+
+def main(argv=None):
+    """Run one load test against an implementation and record its samples."""
+    args = parse_args(argv)
+    network = network_name(args.network)
+    rpc_url = args.rpc_url or DEFAULT_RPC_URLS.get(network)
+    if rpc_url is None:
+        print(f"No RPC URL known for network {network}, pass --rpc-url")
+        return 2
+    private_keys = None
+    if args.private_keys_env:
+        private_keys = [key.strip() for key in os.getenv(args.private_keys_env, '').split(',') if key.strip()]
+
+    token_address = load_target(args.implementation, network)
+    if args.open_loop:
+        return main_open_loop(args, network, rpc_url, token_address, private_keys)
+    # Loaded samples get their own operation so they never mix with the unloaded single-sender latency
+    concurrency = args.senders * args.in_flight
+    operation = args.operation or f'Transfer x{concurrency}'
+    print(f"Sending {args.transactions} transfers to {token_address} on {network} ({rpc_url}) "
+          f"from {args.senders} senders with {args.in_flight} in flight each")
+
+    samples, summary = asyncio.run(run_load(
+        rpc_url, token_address, network, operation=operation, senders=args.senders, in_flight=args.in_flight,
+        transactions=args.transactions, amount=args.amount, receiver=args.receiver, private_keys=private_keys,
+        gas_limit=args.gas_limit, fund=args.fund))
+
+    run_id = new_run_id()
+    summary['Run ID'] = run_id
+    print(f"Completed {summary['Transactions']} transfers ({summary['Failed']} failed) in {summary['Duration (s)']} s: "
+          f"{summary['Throughput (tx/s)']} tx/s, p50 {summary['Latency p50 (ms)']} ms, p95 {summary['Latency p95 (ms)']} ms")
+    if args.dry_run:
+        return 0 if not summary['Failed'] else 1
+
+    if args.csv:
+        results_file = os.path.join(args.implementation, 'results.csv')
+        append_results(results_file, [format_row(sample['Operation'], sample['Gas'], sample['Fee (weis)'],
+                                                 sample['Latency (ms)'], sample['Blockchain'], run_id, sample['Timestamp'],
+                                                 sample['Iteration'], sample['Block']) for sample in samples])
+    else:
+        # One locked append, so concurrent runs against the same directory never interleave
+        results_file = os.path.join(args.implementation, RESULTS_LOG)
+        append_records(results_file, [dict(sample, **{'Run ID': run_id, 'Batch Size': 1}) for sample in samples])
+    append_summary(os.path.join(args.implementation, SUMMARY_FILE), summary)
+    print(f"Results appended to {results_file}")
+    return 0 if not summary['Failed'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
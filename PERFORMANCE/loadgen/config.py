@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+DEFAULT_RPC_URLS = {
+    'hardhat': 'http://127.0.0.1:8544',
+    'sepolia': 'https://ethereum-sepolia-rpc.publicnode.com',
+    'holesky': 'https://ethereum-holesky.publicnode.com'
+}
+
+# The test scripts call the hardhat network "hh", deployment files store it as "hardhat"
+NETWORK_ALIASES = {'hh': 'hardhat'}
+
+# transfer(address,uint256) is shared by the ERC20, ERC1400 and ERC3643 tokens under test
+TRANSFER_ABI = [{
+    'name': 'transfer',
+    'type': 'function',
+    'stateMutability': 'nonpayable',
+    'inputs': [{'name': 'to', 'type': 'address'}, {'name': 'value', 'type': 'uint256'}],
+    'outputs': [{'name': '', 'type': 'bool'}]
+}]
+
+def network_name(network):
+    """Canonical network name used as key in deployment-addresses.json and results.csv."""
+    return NETWORK_ALIASES.get(network.lower(), network.lower())
+
+def load_target(implementation_dir, network):
+    """Token address of an implementation on a network, read from its deployment-addresses.json."""
+    deployment_file = os.path.join(implementation_dir, 'deployment-addresses.json')
+    with open(deployment_file) as f:
+        deployments = json.load(f)
+    network = network_name(network)
+    try:
+        contracts = deployments[network]['deployment']['contracts']
+    except KeyError:
+        raise ValueError(f"No deployment for network {network} in {deployment_file}")
+    # ERC20 and ERC1400 deployments store "Token", ERC3643 deployments "token"
+    for name, contract in contracts.items():
+        if name.lower() == 'token':
+            return contract['address']
+    raise ValueError(f"No token contract for network {network} in {deployment_file}")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+import asyncio
+import time
+from datetime import datetime, timezone
+import numpy as np
+
+TRANSFER_SELECTOR = bytes.fromhex('a9059cbb')
+# Times a sender re-reads its nonce after a failed send before it gives up on the rest of its quota
+SENDER_RECOVERIES = 3
+
+def encode_transfer(receiver, amount):
+    """Calldata of transfer(address,uint256), encoded once and reused by every transaction."""
+    address = bytes.fromhex(receiver[2:] if receiver.startswith('0x') else receiver)
+    return '0x' + (TRANSFER_SELECTOR + address.rjust(32, b'\0') + amount.to_bytes(32, 'big')).hex()
+
+def raw_transaction(signed):
+    """Raw bytes of a signed transaction across eth_account versions."""
+    return getattr(signed, 'raw_transaction', None) or signed.rawTransaction
+
+class Sender:
+    """An account sending transactions with a locally tracked nonce."""
+
+    def __init__(self, address, account=None):
+        self.address = address
+        self.account = account
+        self.next_nonce = None
+        # Set when a send of this account failed, its other transactions may wait behind the lost nonce
+        self.failed = asyncio.Event()
+
+    def take_nonce(self):
+        """Reserve the next nonce, no await happens between read and increment."""
+        nonce = self.next_nonce
+        self.next_nonce += 1
+        return nonce
+
+    async def send(self, w3, tx):
+        """Send a transaction, signed locally with a private key or by the node for unlocked accounts."""
+        tx = dict(tx, nonce=self.take_nonce())
+        if self.account is None:
+            return await w3.eth.send_transaction(dict(tx, **{'from': self.address}))
+        signed = self.account.sign_transaction(tx)
+        return await w3.eth.send_raw_transaction(raw_transaction(signed))
+
+    async def wait_for_receipt(self, w3, tx_hash, timeout, poll_interval):
+        """Receipt of a transaction, or None as soon as another send of this account has failed."""
+        receipt = asyncio.ensure_future(w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout,
+                                                                            poll_latency=poll_interval))
+        failed = asyncio.ensure_future(self.failed.wait())
+        await asyncio.wait([receipt, failed], return_when=asyncio.FIRST_COMPLETED)
+        failed.cancel()
+        if not receipt.done():
+            receipt.cancel()
+            return None
+        return receipt.result()
+
+    async def resync_nonce(self, w3):
+        """Continue from the node's pending nonce after a failure, clearing the failed flag."""
+        self.next_nonce = await w3.eth.get_transaction_count(self.address, 'pending')
+        self.failed.clear()
+
+async def connect(rpc_url):
+    """Asynchronous web3 connection, imported lazily so the analysis scripts never need web3."""
+    from web3 import AsyncWeb3, AsyncHTTPProvider
+    return AsyncWeb3(AsyncHTTPProvider(rpc_url))
+
+async def open_senders(w3, count, private_keys=None):
+    """Senders from private keys, or from the node's unlocked accounts (hardhat)."""
+    if private_keys:
+        from eth_account import Account
+        senders = [Sender(account.address, account) for account in map(Account.from_key, private_keys[:count])]
+    else:
+        accounts = await w3.eth.accounts
+        senders = [Sender(address) for address in accounts[:count]]
+    if len(senders) < count:
+        raise ValueError(f"{count} senders requested but only {len(senders)} accounts are available")
+    for sender in senders:
+        sender.next_nonce = await w3.eth.get_transaction_count(sender.address, 'pending')
+    return senders
+
+async def fund_senders(w3, senders, token_address, amount, base_tx, timeout):
+    """Give every sender but the first one tokens from the first sender before measuring."""
+    funder = senders[0]
+    for sender in senders[1:]:
+        tx = dict(base_tx, to=token_address, data=encode_transfer(sender.address, amount))
+        tx_hash = await funder.send(w3, tx)
+        receipt = await w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        # An unfunded sender would revert every transfer of the run
+        if receipt['status'] == 0:
+            raise RuntimeError(f"Funding {sender.address} from {funder.address} reverted (tx {w3.to_hex(tx_hash)})")
+
+async def run_load(rpc_url, token_address, network, operation='Transfer', senders=1, in_flight=1, transactions=100,
+                   amount=1, receiver=None, private_keys=None, gas_limit=300000, fund=0, timeout=120,
+                   poll_interval=0.05):
+    """Drive transfers from concurrent senders and return the measured samples and a throughput summary."""
+    w3 = await connect(rpc_url)
+    chain_id = await w3.eth.chain_id
+    gas_price = await w3.eth.gas_price
+    sender_list = await open_senders(w3, senders, private_keys)
+    if receiver is None:
+        # Same receiver as the test scripts: the second account of the node
+        accounts = await w3.eth.accounts
+        receiver = accounts[1] if len(accounts) > 1 else sender_list[0].address
+
+    # Static fields are fixed once, only the nonce changes between transactions
+    base_tx = {'chainId': chain_id, 'gas': gas_limit, 'gasPrice': gas_price, 'value': 0}
+    if fund:
+        await fund_senders(w3, sender_list, token_address, fund, base_tx, timeout)
+    transfer_tx = dict(base_tx, to=token_address, data=encode_transfer(receiver, amount))
+
+    samples = []
+    failures = []
+    counter = {'next': 0}
+    quota = {sender.address: transactions // senders + (1 if index < transactions % senders else 0)
+             for index, sender in enumerate(sender_list)}
+
+    async def worker(sender):
+        while quota[sender.address] > 0 and not sender.failed.is_set():
+            quota[sender.address] -= 1
+            iteration = counter['next']
+            counter['next'] += 1
+            timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+            start = time.perf_counter()
+            try:
+                tx_hash = await sender.send(w3, transfer_tx)
+                receipt = await sender.wait_for_receipt(w3, tx_hash, timeout, poll_interval)
+            except Exception as e:
+                # A lost nonce would stall every later transaction of this sender, all its workers stop
+                failures.append(str(e))
+                print(f"Error sending from {sender.address}: {e}")
+                sender.failed.set()
+                return
+            end = time.perf_counter()
+            if receipt is None:
+                # Another worker of this sender failed, this transaction may wait behind its lost nonce
+                failures.append(f"abandoned: {w3.to_hex(tx_hash)}")
+                return
+            if receipt['status'] == 0:
+                # Reverted transfers (e.g. a sender without a registered identity) are neither samples nor throughput,
+                # their nonce is used so the sender carries on
+                failures.append(f"reverted: {w3.to_hex(tx_hash)}")
+                print(f"Transfer from {sender.address} reverted: tx {w3.to_hex(tx_hash)}")
+                continue
+            samples.append({
+                'Operation': operation,
+                'Gas': receipt['gasUsed'],
+                'Fee (weis)': receipt['gasUsed'] * receipt.get('effectiveGasPrice', gas_price),
+                'Latency (ms)': (end - start) * 1000,
+                'Blockchain': network,
+                'Timestamp': timestamp,
+                'Iteration': iteration,
+                'Block': receipt['blockNumber'],
+                'Start': start,
+                'End': end
+            })
+
+    async def drive(sender):
+        for recovery in range(SENDER_RECOVERIES + 1):
+            # in_flight workers per sender keep several nonces of the same account pending at once
+            await asyncio.gather(*(worker(sender) for _ in range(in_flight)))
+            if not sender.failed.is_set() or quota[sender.address] == 0:
+                return
+            if recovery == SENDER_RECOVERIES:
+                break
+            try:
+                # Every worker has stopped, so no nonce is taken while the pending one is read
+                await sender.resync_nonce(w3)
+            except Exception as e:
+                failures.append(str(e))
+                print(f"Error reading the nonce of {sender.address}: {e}")
+                break
+            print(f"Resuming {sender.address} at nonce {sender.next_nonce}")
+        print(f"Giving up on {sender.address}, {quota[sender.address]} transactions not sent")
+        failures.extend(['not sent'] * quota[sender.address])
+
+    run_start = time.perf_counter()
+    await asyncio.gather(*(drive(sender) for sender in sender_list))
+    duration = (max(s['End'] for s in samples) - run_start) if samples else 0.0
+
+    latencies = np.array([s['Latency (ms)'] for s in samples], dtype=np.float64)
+    summary = {
+        'Operation': operation,
+        'Blockchain': network,
+        'Senders': senders,
+        'In flight': in_flight,
+        'Transactions': len(samples),
+        'Failed': len(failures),
+        'Duration (s)': round(duration, 3),
+        'Throughput (tx/s)': round(len(samples) / duration, 3) if duration > 0 else 0.0,
+        'Latency p50 (ms)': round(float(np.percentile(latencies, 50)), 3) if len(latencies) else '',
+        'Latency p95 (ms)': round(float(np.percentile(latencies, 95)), 3) if len(latencies) else ''
+    }
+    return sorted(samples, key=lambda s: s['Iteration']), summary
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+import asyncio
+import os
+import time
+import numpy as np
+from .generator import connect, open_senders, fund_senders, encode_transfer
+
+ARRIVAL_PROCESSES = ['constant', 'poisson']
+
+OPENLOOP_FILE = 'loadgen_openloop.csv'
+OPENLOOP_COLUMNS = ['Run ID', 'Operation', 'Blockchain', 'Arrival', 'Target rate (tx/s)', 'Throughput (tx/s)',
+                    'Sent', 'Completed', 'Failed', 'Latency p50 (ms)', 'Latency p95 (ms)', 'Latency p99 (ms)',
+                    'Service p50 (ms)', 'Service p95 (ms)', 'Saturated']
+
+# A step is saturated when throughput falls this far behind the target rate
+THROUGHPUT_SHORTFALL = 0.9
+# ... or when its corrected p95 latency grows this many times above the lightest step
+LATENCY_GROWTH = 5.0
+
+def arrival_offsets(rate, duration, process='constant', rng=None):
+    """Intended send times (seconds from the step start) of a constant-rate or Poisson arrival process."""
+    if process == 'constant':
+        return np.arange(0, duration, 1.0 / rate)
+    rng = rng if rng is not None else np.random.default_rng()
+    # Draw comfortably more gaps than needed, then cut at the step duration
+    gaps = rng.exponential(1.0 / rate, size=int(rate * duration * 1.5) + 10)
+    offsets = np.cumsum(gaps) - gaps[0]
+    return offsets[offsets < duration]
+
+class BlockReceipts:
+    """Receipts of the transactions in flight, resolved once per new block instead of one poll per transaction."""
+
+    def __init__(self, w3, poll_interval, keep=120):
+        self.w3 = w3
+        self.poll_interval = poll_interval
+        # How long an included hash is remembered, a send may return after its block was already seen
+        self.keep = keep
+        self.waiting = {}
+        self.included = {}
+        self.last_block = None
+        self.task = None
+
+    async def start(self):
+        """Start watching from the current block."""
+        self.last_block = await self.w3.eth.block_number
+        self.task = asyncio.create_task(self.watch())
+
+    def stop(self):
+        """Stop watching."""
+        if self.task is not None:
+            self.task.cancel()
+
+    async def watch(self):
+        """One block number call per interval, and the hashes of every new block."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                latest = await self.w3.eth.block_number
+                if latest <= self.last_block:
+                    continue
+                for number in range(self.last_block + 1, latest + 1):
+                    block = await self.w3.eth.get_block(number)
+                    seen = time.perf_counter()
+                    for tx_hash in block['transactions']:
+                        key = bytes(tx_hash)
+                        self.included[key] = seen
+                        future = self.waiting.pop(key, None)
+                        if future is not None and not future.done():
+                            future.set_result(None)
+                    self.last_block = number
+            except Exception as e:
+                # The blocks not read yet are retried on the next interval
+                print(f"Error reading blocks: {e}")
+                continue
+            cutoff = time.perf_counter() - self.keep
+            self.included = {key: seen for key, seen in self.included.items() if seen >= cutoff}
+
+    async def receipt(self, tx_hash, timeout):
+        """Receipt of a sent transaction and the time its block was seen."""
+        key = bytes(tx_hash)
+        if key not in self.included:
+            future = self.waiting.setdefault(key, asyncio.get_running_loop().create_future())
+            try:
+                await asyncio.wait_for(future, timeout)
+            finally:
+                self.waiting.pop(key, None)
+        seen = self.included.pop(key)
+        return await self.w3.eth.get_transaction_receipt(tx_hash), seen
+
+def step_rates(start_rate, factor, max_rate):
+    """Geometric ladder of target rates."""
+    rates = []
+    rate = start_rate
+    while rate <= max_rate:
+        rates.append(round(rate, 3))
+        rate *= factor
+    return rates
+
+async def run_step(w3, senders, transfer_tx, rate, duration, process, rng, timeout, receipts):
+    """Fire transfers at their intended times regardless of completions and time every one of them."""
+    offsets = arrival_offsets(rate, duration, process, rng)
+    samples = []
+    failures = []
+
+    async def fire(sender, intended):
+        sent = time.perf_counter()
+        try:
+            tx_hash = await sender.send(w3, transfer_tx)
+            receipt, done = await receipts.receipt(tx_hash, timeout)
+        except Exception as e:
+            failures.append(str(e) or type(e).__name__)
+            return
+        # A reverted transfer did not complete, counting it would move the knee
+        if receipt['status'] == 0:
+            failures.append(f"reverted: {w3.to_hex(tx_hash)}")
+            return
+        samples.append((intended, sent, done))
+
+    tasks = []
+    step_start = time.perf_counter()
+    for index, offset in enumerate(offsets):
+        intended = step_start + offset
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Arrivals rotate over the senders, nonces are reserved in arrival order
+        tasks.append(asyncio.create_task(fire(senders[index % len(senders)], intended)))
+    await asyncio.gather(*tasks)
+
+    if not samples:
+        return {'Sent': len(offsets), 'Completed': 0, 'Failed': len(failures)}
+    intended, sent, done = (np.array(column) for column in zip(*samples))
+    # Latency from the intended start counts the queueing a closed loop would have hidden
+    corrected = (done - intended) * 1000
+    service = (done - sent) * 1000
+    elapsed = max(done.max() - step_start, duration)
+    return {
+        'Sent': len(offsets),
+        'Completed': len(samples),
+        'Failed': len(failures),
+        'Throughput (tx/s)': round(len(samples) / elapsed, 3),
+        'Latency p50 (ms)': round(float(np.percentile(corrected, 50)), 3),
+        'Latency p95 (ms)': round(float(np.percentile(corrected, 95)), 3),
+        'Latency p99 (ms)': round(float(np.percentile(corrected, 99)), 3),
+        'Service p50 (ms)': round(float(np.percentile(service, 50)), 3),
+        'Service p95 (ms)': round(float(np.percentile(service, 95)), 3)
+    }
+
+def is_saturated(step, rate, lightest_p95):
+    """Whether a step shows the implementation can no longer keep up with the offered rate."""
+    if step['Completed'] == 0:
+        return True
+    if step['Throughput (tx/s)'] < THROUGHPUT_SHORTFALL * rate:
+        return True
+    return lightest_p95 is not None and step['Latency p95 (ms)'] > LATENCY_GROWTH * lightest_p95
+
+async def run_open_loop(rpc_url, token_address, network, rates, duration=10, process='constant', operation='Transfer',
+                        senders=1, amount=1, receiver=None, private_keys=None, gas_limit=300000, fund=0,
+                        timeout=120, poll_interval=0.05, seed=None, stop_after_knee=True):
+    """Step the offered rate up and return one summary per step, flagging the saturation knee."""
+    w3 = await connect(rpc_url)
+    chain_id = await w3.eth.chain_id
+    gas_price = await w3.eth.gas_price
+    sender_list = await open_senders(w3, senders, private_keys)
+    if receiver is None:
+        accounts = await w3.eth.accounts
+        receiver = accounts[1] if len(accounts) > 1 else sender_list[0].address
+    base_tx = {'chainId': chain_id, 'gas': gas_limit, 'gasPrice': gas_price, 'value': 0}
+    if fund:
+        await fund_senders(w3, sender_list, token_address, fund, base_tx, timeout)
+    transfer_tx = dict(base_tx, to=token_address, data=encode_transfer(receiver, amount))
+
+    rng = np.random.default_rng(seed)
+    # Per-transaction receipt polling would load the node in proportion to the offered rate and skew the knee
+    receipts = BlockReceipts(w3, poll_interval)
+    await receipts.start()
+    try:
+        steps = await run_steps(w3, sender_list, transfer_tx, rates, duration, process, operation, network, rng,
+                                timeout, receipts, stop_after_knee)
+    finally:
+        receipts.stop()
+    return steps
+
+async def run_steps(w3, sender_list, transfer_tx, rates, duration, process, operation, network, rng, timeout, receipts,
+                    stop_after_knee):
+    """Offer every rate in turn until the saturation knee."""
+    steps = []
+    lightest_p95 = None
+    for rate in rates:
+        print(f"Offering {rate} tx/s ({process}) for {duration} s...")
+        step = await run_step(w3, sender_list, transfer_tx, rate, duration, process, rng, timeout, receipts)
+        step.update({'Operation': operation, 'Blockchain': network, 'Arrival': process, 'Target rate (tx/s)': rate})
+        step['Saturated'] = is_saturated(step, rate, lightest_p95)
+        if lightest_p95 is None and step['Completed']:
+            lightest_p95 = step['Latency p95 (ms)']
+        print(f"  throughput {step.get('Throughput (tx/s)', 0)} tx/s, corrected p95 {step.get('Latency p95 (ms)', '')} ms"
+              f"{' (saturated)' if step['Saturated'] else ''}")
+        steps.append(step)
+        if step['Saturated'] and stop_after_knee:
+            break
+        # Let the node drain before offering the next rate
+        await asyncio.sleep(1)
+    return steps
+
+def append_open_loop(output_file, run_id, steps):
+    """Append the step summaries of one open-loop run."""
+    new_file = not os.path.exists(output_file)
+    with open(output_file, 'a') as f:
+        if new_file:
+            f.write(', '.join(OPENLOOP_COLUMNS) + '\n')
+        for step in steps:
+            step = dict(step, **{'Run ID': run_id})
+            f.write(', '.join(str(step.get(column, '')) for column in OPENLOOP_COLUMNS) + '\n')
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import os
+import secrets
+from datetime import datetime, timezone
+from results_log import csv_lock
+from run_history import PHASE_COLUMNS
+
+# Same schema as resultsWriter.js so graphs.py reads load-test rows unchanged
+HEADER_V1 = 'Operation, Gas, Fee (weis), Latency (ms), Blockchain'
+HEADER_V2 = f'{HEADER_V1}, Run ID, Timestamp, Iteration, Block, Batch Size'
+HEADER_V3 = f"{HEADER_V2}, {', '.join(PHASE_COLUMNS)}"
+HEADER = HEADER_V3
+
+SUMMARY_FILE = 'loadgen_summary.csv'
+SUMMARY_HEADER = ('Run ID, Operation, Blockchain, Senders, In flight, Transactions, Failed, Duration (s), '
+                  'Throughput (tx/s), Latency p50 (ms), Latency p95 (ms)')
+
+def new_run_id():
+    """Run identifier sortable by start time, with a random suffix for parallel runs."""
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{secrets.token_hex(3)}"
+
+def prepare_results_file(results_file):
+    """Create results.csv with the current header, or upgrade an older file in place."""
+    if not os.path.exists(results_file) or os.path.getsize(results_file) == 0:
+        with open(results_file, 'w') as f:
+            f.write(HEADER + '\n')
+        return
+    with open(results_file, encoding='utf-8-sig') as f:
+        lines = f.read().splitlines()
+    if lines[0].strip() == HEADER:
+        return
+    padding = ',' * (HEADER.count(',') - lines[0].count(','))
+    upgraded = [HEADER] + [line + padding for line in lines[1:] if line.strip()]
+    with open(results_file, 'w') as f:
+        f.write('\n'.join(upgraded) + '\n')
+
+def append_results(results_file, lines):
+    """Upgrade results.csv and append lines under the lockfile shared with resultsWriter.js."""
+    with csv_lock(results_file):
+        prepare_results_file(results_file)
+        with open(results_file, 'a') as f:
+            f.writelines(lines)
+
+def format_row(operation, gas, fee, latency, network, run_id, timestamp, iteration, block, batch_size=1, phases=None):
+    """One results.csv line in schema v3, phases are left empty when not measured."""
+    phases = phases or [''] * len(PHASE_COLUMNS)
+    return (f"{operation}, {gas}, {fee}, {latency}, {network}, "
+            f"{run_id}, {timestamp}, {iteration}, {block}, {batch_size}, {', '.join(str(p) for p in phases)}\n")
+
+def append_summary(summary_file, summary):
+    """Append the throughput summary of one load run."""
+    new_file = not os.path.exists(summary_file)
+    with open(summary_file, 'a') as f:
+        if new_file:
+            f.write(SUMMARY_HEADER + '\n')
+        f.write(', '.join(str(summary[column.strip()]) for column in SUMMARY_HEADER.split(',')) + '\n')
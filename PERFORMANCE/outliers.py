@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+from batch_costs import grouping_keys
+
+# Gas is deterministic, testnet noise shows in the fee (through the gas price) and the latency
+METRICS = ['Fee (weis)', 'Latency (ms)']
+# Averages compared with each other: the implementations of one operation on one network
+PEER_COLUMNS = ['DataType', 'Operation', 'Blockchain']
+# Modified z-score beyond which a value is an outlier (Iglewicz and Hoaglin)
+THRESHOLD = 3.5
+# A log axis is only worth it when the outliers span at least this factor over the smallest value
+LOG_RATIO = 10
+OUTLIER_MODES = ['keep', 'annotate', 'drop']
+# Both make a spread match the standard deviation of normal data, the mean absolute deviation
+# stands in for the MAD where more than half the values are equal
+MAD_SCALE = 1.4826
+MEAN_AD_SCALE = 1.2533
+# Lower bound of the spread relative to the median, near-identical peers (e.g. the fixed gas price of a
+# local node) would otherwise turn rounding differences into outliers
+MIN_RELATIVE_SPREAD = 0.01
+
+def robust_scores(stats_df, metrics=METRICS, threshold=THRESHOLD):
+    """Modified z-score of every average against its peers, and whether it is an outlier."""
+    scores = pd.DataFrame(index=stats_df.index)
+    keys = [stats_df[column] for column in grouping_keys(PEER_COLUMNS, stats_df)]
+    for metric in metrics:
+        column = f'{metric}_avg'
+        if column not in stats_df.columns:
+            continue
+        values = stats_df[column].astype(np.float64)
+        if metric == 'Fee (weis)' and 'Gas_avg' in stats_df.columns:
+            # Fees are compared per gas unit, so a heavier implementation is not an outlier by itself
+            values = values / stats_df['Gas_avg'].astype(np.float64).where(stats_df['Gas_avg'] > 0)
+        grouped = values.groupby(keys, observed=True, sort=False)
+        median = grouped.transform('median')
+        deviation = (values - median).abs()
+        deviations = deviation.groupby(keys, observed=True, sort=False)
+        mad = deviations.transform('median')
+        spread = (mad * MAD_SCALE).where(mad > 0, deviations.transform('mean') * MEAN_AD_SCALE)
+        spread = np.maximum(spread, median.abs() * MIN_RELATIVE_SPREAD)
+        z = (values - median) / spread.where(spread > 0)
+        # Two values have no majority to deviate from
+        z = z.where(grouped.transform('count') >= 3)
+        scores[f'{metric}_robust_z'] = z
+        scores[f'{metric}_outlier'] = z.abs() > threshold
+    return scores
+
+def recommend_scale(values, threshold=THRESHOLD, ratio=LOG_RATIO):
+    """'log' when a few positive values lie far from the rest, 'linear' otherwise."""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    # Zeros are the fill value of missing pivot cells
+    values = values[np.isfinite(values) & (values > 0)]
+    if len(values) < 3:
+        return 'linear'
+    median = np.median(values)
+    deviation = np.abs(values - median)
+    mad = np.median(deviation)
+    spread = max(mad * MAD_SCALE if mad > 0 else deviation.mean() * MEAN_AD_SCALE, median * MIN_RELATIVE_SPREAD)
+    if spread == 0:
+        return 'linear'
+    has_outliers = (deviation / spread > threshold).any()
+    return 'log' if has_outliers and values.max() >= ratio * values.min() else 'linear'
+
+def annotate_outliers(stats_df, threshold=THRESHOLD):
+    """Statistics with the robust z-score and outlier flag of every metric average."""
+    if stats_df.empty:
+        return stats_df
+    return pd.concat([stats_df, robust_scores(stats_df, threshold=threshold)], axis=1)
+
+def drop_outliers(annotated):
+    """Annotated statistics without the rows that have an outlying average."""
+    flags = [f'{metric}_outlier' for metric in METRICS if f'{metric}_outlier' in annotated.columns]
+    if not flags:
+        return annotated
+    return annotated[~annotated[flags].any(axis=1)].reset_index(drop=True)
+
+class OutlierAnalysis:
+    """Axis scales decided once per data slice and shared by the windows and individual charts drawing it."""
+
+    def __init__(self, threshold=THRESHOLD, ratio=LOG_RATIO):
+        self.threshold = threshold
+        self.ratio = ratio
+        self.scales = {}
+
+    def scale(self, key, values):
+        """Recommended scale of a slice, computed on first use."""
+        if key not in self.scales:
+            self.scales[key] = recommend_scale(values, self.threshold, self.ratio)
+        return self.scales[key]
+
+    def use_log(self, key, values):
+        """Whether the slice is drawn on a log axis."""
+        return self.scale(key, values) == 'log'
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from graphs import (build_parser, new_run, discover_stage, load_stage, stats_stage, charts_stage, compare_stage,
+                    print_outputs)
+from latex_table_generator import generate_latex_tables
+
+STAGES = ['discover', 'load', 'stats', 'charts', 'latex', 'report']
+# Stages whose output another stage reads from memory
+STAGE_INPUTS = {'discover': [], 'load': ['discover'], 'stats': ['load'], 'charts': ['stats'], 'latex': ['stats'],
+                'report': ['stats']}
+# Stages that only read earlier results and can run at the same time
+CONCURRENT_STAGES = ['charts', 'latex']
+
+def resolve_stages(requested):
+    """Requested stages and the stages they read from, in pipeline order."""
+    selected = set()
+    pending = list(requested)
+    while pending:
+        stage = pending.pop()
+        if stage not in selected:
+            selected.add(stage)
+            pending.extend(STAGE_INPUTS[stage])
+    return [stage for stage in STAGES if stage in selected]
+
+def latex_stage(run):
+    """Generate the LaTeX tables from the statistics of this run."""
+    print("\nGenerating LaTeX tables...")
+    run['latex_file'] = generate_latex_tables(run['instrument'], run['args'].force_latex, run['stats_df'])
+    return True
+
+def report_stage(run):
+    """Print the summary, check the baseline and list the outputs."""
+    if not compare_stage(run):
+        return False
+    print_outputs(run)
+    if run.get('latex_file'):
+        print(f"- LaTeX tables saved to: {run['latex_file']}")
+    return True
+
+STAGE_FUNCTIONS = {'discover': discover_stage, 'load': load_stage, 'stats': stats_stage, 'charts': charts_stage,
+                   'latex': latex_stage, 'report': report_stage}
+
+def run_concurrently(run, stages):
+    """Run independent stages together, charts stay on the main thread because matplotlib is not thread-safe."""
+    background = [stage for stage in stages if stage != 'charts']
+    with ThreadPoolExecutor(max_workers=len(background)) as pool:
+        futures = [pool.submit(STAGE_FUNCTIONS[stage], run) for stage in background]
+        results = [STAGE_FUNCTIONS['charts'](run)] if 'charts' in stages else []
+        results += [future.result() for future in futures]
+    return all(results)
+
+def run_pipeline(args, stages):
+    """Run the selected stages in order, passing data between them in memory."""
+    run = new_run(args)
+    run['latex_file'] = None
+    concurrent = [stage for stage in stages if stage in CONCURRENT_STAGES]
+    # Overlapping stages would share one profiler, so profile runs keep them sequential
+    overlap = len(concurrent) > 1 and not args.sequential and not args.profile
+    done = set()
+    for stage in stages:
+        if stage in done:
+            continue
+        if overlap and stage in concurrent:
+            print(f"\nRunning {' and '.join(concurrent)} concurrently...")
+            ok = run_concurrently(run, concurrent)
+            done.update(concurrent)
+        else:
+            ok = STAGE_FUNCTIONS[stage](run)
+            done.add(stage)
+        if not ok:
+            return run['status']
+    if 'report' not in stages:
+        # The report stage saves the timings otherwise
+        run['instrument'].report(args.timings_top)
+    return run['status']
+
+def parse_args(argv=None):
+    """Parse the stage selection and the analysis options of graphs.py."""
+    parser = build_parser('Run the analysis pipeline: discover, load, stats, charts, latex and report.')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES,
+                        help='stages to run, the stages they depend on are added (default: all)')
+    parser.add_argument('--sequential', action='store_true', help='run the chart and LaTeX stages one after the other')
+    parser.add_argument('--force-latex', action='store_true',
+                        help='regenerate every LaTeX category even if its statistics are unchanged')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the requested pipeline stages in one process."""
+    args = parse_args(argv)
+    stages = resolve_stages(args.stages)
+    print(f"Pipeline stages: {', '.join(stages)}")
+    return run_pipeline(args, stages)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+import instrumentation
+
+CACHE_INDEX_NAME = '.render_cache.json'
+
+def script_version(*paths):
+    """Hash the source of the given scripts so any code change invalidates cached charts."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def hash_data(data):
+    """Hash a DataFrame, Series, array or nested list of them into a hex digest."""
+    digest = hashlib.sha256()
+    if data is None:
+        digest.update(b'None')
+    elif isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode())
+        digest.update(repr(list(data.index.names)).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    elif isinstance(data, pd.Series):
+        digest.update(repr(data.name).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(str(data.dtype).encode())
+        digest.update(np.ascontiguousarray(data).tobytes())
+    elif isinstance(data, (list, tuple)):
+        for item in data:
+            digest.update(hash_data(item).encode())
+    else:
+        digest.update(repr(data).encode())
+    return digest.hexdigest()
+
+class RenderCache:
+    """Fingerprint index of the charts saved in one output directory."""
+
+    def __init__(self, output_dir, version, formats=('pdf', 'png'), dpi=300, enabled=True):
+        self.output_dir = output_dir
+        self.version = version
+        self.formats = tuple(formats)
+        self.dpi = dpi
+        self.enabled = enabled
+        self.index_path = os.path.join(output_dir, CACHE_INDEX_NAME)
+        self.index = self.load_index()
+        self.rendered = []
+        self.skipped = []
+
+    def load_index(self):
+        """Load the cache index stored next to the outputs, or start an empty one."""
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def write_index(self):
+        """Atomically persist the cache index."""
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def fingerprint(self, data, **params):
+        """Fingerprint a chart from its input data slice, plotting parameters and script version."""
+        # Fingerprinting starts every chart, so a chart is timed from here to save() or a cache hit
+        instrumentation.start_item('chart', params.get('chart'))
+        digest = hashlib.sha256()
+        digest.update(self.version.encode())
+        digest.update(hash_data(data).encode())
+        params = dict(params, formats=self.formats, dpi=self.dpi)
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def is_current(self, name, fingerprint):
+        """Return True if every output file of the chart exists and matches the fingerprint."""
+        if not self.enabled:
+            return False
+        entry = self.index.get(name)
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        for file_name, size in entry.get('files', {}).items():
+            path = os.path.join(self.output_dir, file_name)
+            if not os.path.exists(path) or os.path.getsize(path) != size:
+                return False
+        self.skipped.append(name)
+        instrumentation.end_item('chart', name, 'cached')
+        return True
+
+    def save(self, fig, name, fingerprint):
+        """Save the figure in every configured format and record its fingerprint."""
+        files = {}
+        for fmt in self.formats:
+            file_name = f'{name}.{fmt}'
+            path = os.path.join(self.output_dir, file_name)
+            if fmt == 'pdf':
+                fig.savefig(path, format='pdf', bbox_inches='tight')
+            else:
+                fig.savefig(path, dpi=self.dpi, bbox_inches='tight')
+            files[file_name] = os.path.getsize(path)
+        self.index[name] = {'fingerprint': fingerprint, 'files': files}
+        self.rendered.append(name)
+        self.write_index()
+        instrumentation.end_item('chart', name)
@@ -0,0 +1,105 @@
+const fs = require("fs");
+const crypto = require("crypto");
+const { PHASE_COLUMNS } = require("./txPhases");
+
+// Schema v1 only had the first five columns, v2 adds the run context of every sample, v3 its latency phases
+const HEADER_V1 = "Operation, Gas, Fee (weis), Latency (ms), Blockchain";
+const HEADER_V2 = `${HEADER_V1}, Run ID, Timestamp, Iteration, Block, Batch Size`;
+const HEADER_V3 = `${HEADER_V2}, ${PHASE_COLUMNS.join(", ")}`;
+const HEADER = HEADER_V3;
+
+const LOCK_SUFFIX = ".lock";
+const LOCK_TIMEOUT_MS = 60000;
+const LOCK_POLL_MS = 20;
+const lockWait = new Int32Array(new SharedArrayBuffer(4));
+
+function newRunId() {
+    // Sortable by start time, random suffix keeps parallel runs apart
+    const stamp = new Date().toISOString().replace(/[-:]/g, "").replace(/\.\d+Z$/, "Z");
+    return `${stamp}-${crypto.randomBytes(3).toString("hex")}`;
+}
+
+function withResultsLock(resultsFile, action) {
+    // Every writer of a results.csv, Python ones included, holds this lockfile while it upgrades or appends
+    const lockFile = resultsFile + LOCK_SUFFIX;
+    const deadline = Date.now() + LOCK_TIMEOUT_MS;
+    let fd;
+    for (;;) {
+        try {
+            fd = fs.openSync(lockFile, "wx");
+            break;
+        } catch (error) {
+            if (error.code !== "EEXIST") {
+                throw error;
+            }
+            if (Date.now() > deadline) {
+                throw new Error(`${lockFile} is still held, remove it if no benchmark is writing to ${resultsFile}`);
+            }
+            Atomics.wait(lockWait, 0, 0, LOCK_POLL_MS);
+        }
+    }
+    try {
+        fs.writeSync(fd, String(process.pid));
+        return action();
+    } finally {
+        fs.closeSync(fd);
+        fs.unlinkSync(lockFile);
+    }
+}
+
+function upgradeResultsFile(resultsFile) {
+    // Exclusive create, so a concurrent run never truncates a file another run has just started
+    try {
+        fs.writeFileSync(resultsFile, HEADER + "\n", { flag: "wx" });
+        return;
+    } catch (error) {
+        if (error.code !== "EEXIST") {
+            throw error;
+        }
+    }
+    if (fs.statSync(resultsFile).size === 0) {
+        fs.appendFileSync(resultsFile, HEADER + "\n");
+        return;
+    }
+
+    const content = fs.readFileSync(resultsFile, "utf8").replace(/^﻿/, "");
+    const lines = content.split(/\r?\n/);
+    if (lines[0].trim() === HEADER) {
+        return;
+    }
+
+    // Upgrade an older file in place, old rows keep empty fields for the new columns
+    const padding = ",".repeat(HEADER.split(",").length - lines[0].split(",").length);
+    const upgraded = [HEADER];
+    for (const line of lines.slice(1)) {
+        if (line.trim() !== "") {
+            upgraded.push(line + padding);
+        }
+    }
+    // Replace the file atomically so readers never see a half-written upgrade
+    const tmpFile = `${resultsFile}.${process.pid}.tmp`;
+    fs.writeFileSync(tmpFile, upgraded.join("\n") + "\n");
+    fs.renameSync(tmpFile, resultsFile);
+}
+
+function prepareResultsFile(resultsFile) {
+    withResultsLock(resultsFile, () => upgradeResultsFile(resultsFile));
+}
+
+function appendResults(resultsFile, csvData) {
+    // One lock over the upgrade and the append, a row appended in between would be lost by the rename
+    withResultsLock(resultsFile, () => {
+        upgradeResultsFile(resultsFile);
+        fs.appendFileSync(resultsFile, csvData);
+    });
+}
+
+function formatRow({ operation, receipt, latency, network, runId, timestamp, iteration, batchSize = 1, phases = null }) {
+    const phaseValues = phases
+        ? [phases.build, phases.submit, phases.pending, phases.inclusion, phases.receipt]
+        : PHASE_COLUMNS.map(() => "");
+    return `${operation}, ${receipt.gasUsed.toString()}, ${receipt.fee.toString()}, ${latency}, ${network}, ` +
+        `${runId}, ${timestamp}, ${iteration}, ${receipt.blockNumber}, ${batchSize}, ${phaseValues.join(", ")}\n`;
+}
+
+module.exports = { HEADER_V1, HEADER_V2, HEADER_V3, newRunId, prepareResultsFile, appendResults, formatRow };
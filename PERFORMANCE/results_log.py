@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import time
+import argparse
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from run_history import PHASE_COLUMNS
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+RESULTS_LOG = 'results.log'
+EXPORT_FILE = 'results_log.csv'
+MAGIC = b'ERCLOG\x00\x00'
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+
+# Results schema v3 as fixed-size little-endian records, text labels are NUL-padded UTF-8
+LABEL_FIELDS = [('Operation', 40), ('Blockchain', 16), ('Run ID', 24)]
+INTEGER_FIELDS = ['Iteration', 'Block', 'Batch Size']
+RECORD_DTYPE = np.dtype(
+    [(name, f'S{size}') for name, size in LABEL_FIELDS] +
+    [('Gas', '<u8'), ('Fee (weis)', '<u8'), ('Fee high', '<u8'), ('Latency (ms)', '<f8'), ('Timestamp', '<i8')] +
+    [(name, '<i8') for name in INTEGER_FIELDS] +
+    [(name, '<f8') for name in PHASE_COLUMNS])
+CSV_COLUMNS = ['Operation', 'Gas', 'Fee (weis)', 'Latency (ms)', 'Blockchain', 'Run ID', 'Timestamp'] + INTEGER_FIELDS + PHASE_COLUMNS
+MISSING_INTEGER = -1
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+UINT64_LIMIT = 1 << 64
+# Lockfile held by every writer of a results.csv (resultsWriter.js uses the same name) while it upgrades or appends
+CSV_LOCK_SUFFIX = '.lock'
+CSV_LOCK_TIMEOUT = 60
+# Suffix of a results.csv moved aside after its import, graphs.py no longer reads it
+IMPORTED_SUFFIX = '.imported'
+
+def file_header():
+    """Header identifying the format version and record size of a results log."""
+    header = MAGIC + np.array([FORMAT_VERSION, RECORD_DTYPE.itemsize], dtype='<u4').tobytes()
+    return header.ljust(HEADER_SIZE, b'\x00')
+
+def check_header(header, log_file):
+    """Reject files that are not results logs of the current record layout."""
+    if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{log_file} is not a results log")
+    version, record_size = np.frombuffer(header[len(MAGIC):len(MAGIC) + 8], dtype='<u4')
+    if version != FORMAT_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{log_file} uses results log version {version} with {record_size}-byte records, "
+                         f"expected version {FORMAT_VERSION} with {RECORD_DTYPE.itemsize}-byte records")
+
+def lock_file(fd):
+    """Take an exclusive lock on an open file, blocking until other writers release it."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+def unlock_file(fd):
+    """Release the lock taken by lock_file()."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def csv_lock(csv_file, timeout=CSV_LOCK_TIMEOUT, poll_interval=0.02):
+    """Hold the lockfile of a results.csv, waiting for other writers to release it."""
+    lock_path = csv_file + CSV_LOCK_SUFFIX
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{lock_path} is still held, remove it if no benchmark is writing to {csv_file}")
+            time.sleep(poll_interval)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        yield
+    finally:
+        os.close(fd)
+        os.remove(lock_path)
+
+def optional_integer(value):
+    """Integer field of a row, or the missing sentinel."""
+    if value is None or value == '' or (isinstance(value, float) and np.isnan(value)):
+        return MISSING_INTEGER
+    return int(value)
+
+def encode_records(rows):
+    """Pack result rows keyed by the results.csv column names into log records."""
+    records = np.zeros(len(rows), dtype=RECORD_DTYPE)
+    if not rows:
+        return records
+    for name, size in LABEL_FIELDS:
+        values = [str(row.get(name) or '').strip().encode('utf-8') for row in rows]
+        too_long = [value for value in values if len(value) > size]
+        if too_long:
+            raise ValueError(f"{name} {too_long[0].decode('utf-8')!r} exceeds the {size} bytes of a results log record")
+        records[name] = values
+    fees = [int(row['Fee (weis)']) for row in rows]
+    if any(fee < 0 or fee >= UINT64_LIMIT * UINT64_LIMIT for fee in fees):
+        raise ValueError("Fee (weis) out of the 128-bit range of a results log record")
+    records['Gas'] = [int(row['Gas']) for row in rows]
+    records['Fee (weis)'] = [fee % UINT64_LIMIT for fee in fees]
+    records['Fee high'] = [fee // UINT64_LIMIT for fee in fees]
+    records['Latency (ms)'] = [float(row['Latency (ms)']) for row in rows]
+    timestamps = pd.to_datetime(pd.Series([row.get('Timestamp') for row in rows], dtype=object), utc=True, errors='coerce')
+    # NaT is stored as the int64 minimum, MISSING_TIMESTAMP
+    records['Timestamp'] = timestamps.dt.tz_convert(None).to_numpy(dtype='datetime64[ns]').view(np.int64)
+    for name in INTEGER_FIELDS:
+        records[name] = [optional_integer(row.get(name)) for row in rows]
+    for name in PHASE_COLUMNS:
+        records[name] = [np.nan if row.get(name) in (None, '') else float(row[name]) for row in rows]
+    return records
+
+def append_records(log_file, rows, sync=False):
+    """Append rows to a results log as one locked write, creating the log if needed."""
+    data = encode_records(rows).tobytes()
+    fd = os.open(log_file, os.O_RDWR | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        lock_file(fd)
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                data = file_header() + data
+            else:
+                check_header(read_header(log_file), log_file)
+                # Drop the partial record of a writer that died mid-append so later records stay aligned
+                torn = (size - HEADER_SIZE) % RECORD_DTYPE.itemsize
+                if torn:
+                    os.ftruncate(fd, size - torn)
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if sync:
+                os.fsync(fd)
+        finally:
+            unlock_file(fd)
+    finally:
+        os.close(fd)
+    return len(rows)
+
+def read_header(log_file):
+    """First HEADER_SIZE bytes of a file."""
+    with open(log_file, 'rb') as f:
+        return f.read(HEADER_SIZE)
+
+def open_log(log_file):
+    """Memory-map the complete records of a results log without reading them."""
+    check_header(read_header(log_file), log_file)
+    count = (os.path.getsize(log_file) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(log_file, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+
+def label_column(values):
+    """Categorical of a fixed-width text field, decoding each distinct label once."""
+    labels, codes = np.unique(values, return_inverse=True)
+    categories = [label.decode('utf-8') for label in labels]
+    return pd.Categorical.from_codes(codes.reshape(-1), categories=categories)
+
+def label_mask(values, selected):
+    """Rows whose label matches a case-insensitive selection."""
+    labels, codes = np.unique(values, return_inverse=True)
+    wanted = {str(s).strip().lower() for s in selected}
+    keep = np.array([label.decode('utf-8').lower() in wanted for label in labels], dtype=bool)
+    return keep[codes.reshape(-1)] if len(labels) else np.zeros(len(values), dtype=bool)
+
+def records_frame(records, blockchains=None, operations=None):
+    """Results frame of mapped records, filtering on the map so only selected rows are copied."""
+    if blockchains:
+        records = records[label_mask(records['Blockchain'], blockchains)]
+    if operations:
+        records = records[label_mask(records['Operation'], operations)]
+    df = pd.DataFrame({name: label_column(records[name]) for name, _ in LABEL_FIELDS})
+    df['Gas'] = np.asarray(records['Gas'])
+    fee_high = np.asarray(records['Fee high'])
+    if fee_high.any():
+        # Fees beyond 64 bits are kept as exact Python ints, like in the CSV loader
+        df['Fee (weis)'] = [int(high) * UINT64_LIMIT + int(low) for high, low in zip(fee_high, records['Fee (weis)'])]
+    else:
+        df['Fee (weis)'] = np.asarray(records['Fee (weis)'])
+    df['Latency (ms)'] = np.asarray(records['Latency (ms)'])
+    run_ids = df['Run ID'].astype('string')
+    df['Run ID'] = run_ids.mask(run_ids == '')
+    # MISSING_TIMESTAMP is the int64 minimum, which is NaT as datetime64
+    df['Timestamp'] = pd.to_datetime(np.asarray(records['Timestamp']).view('datetime64[ns]'), utc=True)
+    for name in INTEGER_FIELDS:
+        values = np.asarray(records[name]).astype(np.float64)
+        values[values == MISSING_INTEGER] = np.nan
+        df[name] = values
+    for name in PHASE_COLUMNS:
+        df[name] = np.asarray(records[name])
+    return df[CSV_COLUMNS]
+
+def read_log(log_file, blockchains=None, operations=None):
+    """Load a results log in the column layout of a parsed results.csv."""
+    return records_frame(open_log(log_file), blockchains, operations)
+
+def export_csv(log_file, csv_file):
+    """Write a results log as results.csv text in schema v3."""
+    df = read_log(log_file)
+    df['Timestamp'] = df['Timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%S.%fZ').str.replace(r'\d{3}Z$', 'Z', regex=True)
+    for name in INTEGER_FIELDS:
+        df[name] = df[name].astype('Int64')
+    df.to_csv(csv_file, index=False, sep=',', na_rep='')
+    # results.csv separates values with ", " which pandas cannot write directly
+    with open(csv_file) as f:
+        lines = [line.replace(',', ', ') for line in f.read().splitlines()]
+    with open(csv_file, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    return len(df)
+
+def import_csv(csv_file, log_file):
+    """Append the rows of a results.csv file to a results log, returning the row count and where the CSV moved."""
+    with csv_lock(csv_file):
+        df = pd.read_csv(csv_file, skipinitialspace=True, dtype=str, keep_default_na=False)
+        df.columns = df.columns.str.strip()
+        df = df[(df != '').any(axis=1)]
+        count = append_records(log_file, df.to_dict('records'))
+        moved = None
+        # graphs.py reads both files of a directory, the CSV is moved aside so every sample is read once
+        if os.path.samefile(os.path.dirname(os.path.abspath(csv_file)), os.path.dirname(os.path.abspath(log_file))):
+            moved = f"{csv_file}{IMPORTED_SUFFIX}-{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}"
+            os.replace(csv_file, moved)
+    return count, moved
+
+def parse_args(argv=None):
+    """Parse the log conversion command."""
+    parser = argparse.ArgumentParser(description='Convert between results logs and results.csv files.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    export_parser = commands.add_parser('export', help='write a results log as CSV')
+    export_parser.add_argument('log', help='results log to read')
+    export_parser.add_argument('csv', nargs='?', help=f'CSV file to write (default: {EXPORT_FILE} next to the log)')
+    import_parser = commands.add_parser('import', help='append a results.csv file to a results log')
+    import_parser.add_argument('csv', help='results.csv file to read')
+    import_parser.add_argument('log', nargs='?', help=f'results log to append to (default: {RESULTS_LOG} next to the CSV)')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Export a results log to CSV or import a CSV file into a log."""
+    args = parse_args(argv)
+    if args.command == 'export':
+        csv_file = args.csv or os.path.join(os.path.dirname(args.log), EXPORT_FILE)
+        count = export_csv(args.log, csv_file)
+        print(f"Exported {count} records from {args.log} to {csv_file}")
+    else:
+        log_file = args.log or os.path.join(os.path.dirname(args.csv), RESULTS_LOG)
+        count, moved = import_csv(args.csv, log_file)
+        print(f"Appended {count} records from {args.csv} to {log_file}")
+        if moved:
+            print(f"Moved {args.csv} to {moved} so graphs.py does not read its samples twice")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+# Columns added by results schema v2, v1 files only have Operation, Gas, Fee (weis), Latency (ms), Blockchain
+RUN_COLUMNS = ['Run ID', 'Timestamp', 'Iteration', 'Block', 'Batch Size']
+RUN_INTEGER_COLUMNS = ['Iteration', 'Block', 'Batch Size']
+# Schema v3 splits the latency of every sample into consecutive phases
+PHASE_COLUMNS = ['Build (ms)', 'Submit (ms)', 'Pending (ms)', 'Inclusion (ms)', 'Receipt (ms)']
+
+def schema_version(df):
+    """Results schema version of a results.csv frame with stripped column names."""
+    if not all(column in df.columns for column in RUN_COLUMNS):
+        return 1
+    return 3 if all(column in df.columns for column in PHASE_COLUMNS) else 2
+
+def parse_run_columns(df):
+    """Parse the run context and latency phases of a v2/v3 frame, v1 frames are returned unchanged."""
+    if schema_version(df) == 1:
+        return df
+    df = df.copy()
+    run_ids = df['Run ID'].astype('string').str.strip()
+    df['Run ID'] = run_ids.mask(run_ids == '')
+    df['Timestamp'] = pd.to_datetime(df['Timestamp'].astype('string').str.strip(), utc=True, errors='coerce')
+    for column in RUN_INTEGER_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+    for column in PHASE_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column].astype('string').str.strip(), errors='coerce').astype(np.float64)
+    return df
+
+def downsample_trend(timestamps, values, max_points=2000):
+    """Reduce a time series to at most max_points equal-count buckets of (time, mean, min, max)."""
+    timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+    values = np.asarray(values, dtype=np.float64)
+    keep = ~(np.isnat(timestamps) | np.isnan(values))
+    timestamps, values = timestamps[keep], values[keep]
+    order = np.argsort(timestamps, kind='stable')
+    timestamps, values = timestamps[order], values[order]
+    if len(values) <= max_points:
+        return timestamps, values, values, values
+
+    # Bucket boundaries split the sorted samples into near-equal counts
+    starts = np.linspace(0, len(values), max_points + 1).astype(np.int64)[:-1]
+    counts = np.diff(np.append(starts, len(values)))
+    ticks = timestamps.astype(np.int64)
+    centers = (np.add.reduceat(ticks.astype(np.float64), starts) / counts).astype(np.int64).astype('datetime64[ns]')
+    means = np.add.reduceat(values, starts) / counts
+    return centers, means, np.minimum.reduceat(values, starts), np.maximum.reduceat(values, starts)
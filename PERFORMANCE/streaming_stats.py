@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+class QuantileSketch:
+    """Mergeable relative-error quantile sketch with logarithmic buckets (DDSketch style)."""
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def update(self, values):
+        """Add a chunk of values to the sketch."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        # Benchmark metrics are non-negative, anything not above zero lands in the zero bucket
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        self.count += len(values)
+        if len(positive) == 0:
+            return
+        indices = np.ceil(np.log(positive) / self.log_gamma).astype(np.int64)
+        keys, counts = np.unique(indices, return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def merge(self, other):
+        """Merge another sketch built with the same accuracy into this one."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge quantile sketches with different accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def value_at_rank(self, rank):
+        """Estimate the value of the element at an integer rank of the sorted input."""
+        cumulative = self.zero_count
+        if rank < cumulative:
+            return 0.0
+        for key in sorted(self.buckets):
+            cumulative += self.buckets[key]
+            if cumulative > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def quantile(self, q):
+        """Estimate the q-quantile (0 <= q <= 1), interpolating linearly between ranks like pandas."""
+        if self.count == 0:
+            return np.nan
+        rank = q * (self.count - 1)
+        lower = int(np.floor(rank))
+        upper = min(lower + 1, self.count - 1)
+        low_value = self.value_at_rank(lower)
+        high_value = self.value_at_rank(upper)
+        return low_value + (high_value - low_value) * (rank - lower)
+
+    def quantiles(self, qs):
+        """Estimate several quantiles at once, with one pass over the sorted buckets."""
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+        keys = np.array(sorted(self.buckets), dtype=np.int64)
+        values = np.concatenate([[0.0], 2 * self.gamma ** keys / (self.gamma + 1)])
+        cumulative = np.concatenate([[self.zero_count], self.zero_count + np.cumsum([self.buckets[k] for k in keys.tolist()])])
+        ranks = qs * (self.count - 1)
+        lower = np.floor(ranks).astype(np.int64)
+        upper = np.minimum(lower + 1, self.count - 1)
+        # Index 0 is the zero bucket, the first bucket whose cumulative count exceeds the rank holds it
+        low_values = values[np.minimum(np.searchsorted(cumulative, lower, side='right'), len(values) - 1)]
+        high_values = values[np.minimum(np.searchsorted(cumulative, upper, side='right'), len(values) - 1)]
+        return low_values + (high_values - low_values) * (ranks - lower)
+
+    def histogram(self, edges):
+        """Sample counts between the given bin edges, each bucket counted at its representative value."""
+        keys = np.array(sorted(self.buckets), dtype=np.int64)
+        values = 2 * self.gamma ** keys / (self.gamma + 1)
+        weights = np.array([self.buckets[k] for k in keys.tolist()], dtype=np.float64)
+        # Representatives may lie up to the relative accuracy outside the observed range
+        counts, _ = np.histogram(np.clip(values, edges[0], edges[-1]), bins=edges, weights=weights)
+        counts[0] += self.zero_count
+        return counts
+
+class RunningStats:
+    """One-pass count, mean, variance, min, max and quantiles of a metric."""
+
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def update(self, values):
+        """Fold a chunk of values in using Welford's update generalised to batches."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        chunk = RunningStats(self.sketch.relative_accuracy)
+        chunk.count = len(values)
+        chunk.mean = values.mean()
+        chunk.m2 = ((values - chunk.mean) ** 2).sum()
+        chunk.min = values.min()
+        chunk.max = values.max()
+        chunk.sketch.update(values)
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combine two partial aggregates (Chan et al. parallel variance)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def std(self):
+        """Sample standard deviation, matching pandas' default ddof=1."""
+        if self.count < 2:
+            return np.nan
+        return np.sqrt(self.m2 / (self.count - 1))
+
+    def quantile(self, q):
+        """Sketch quantile clamped to the exact observed range."""
+        if self.count == 0:
+            return np.nan
+        return float(np.clip(self.sketch.quantile(q), self.min, self.max))
+
+    def quantiles(self, qs):
+        """Several sketch quantiles clamped to the exact observed range."""
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+        return np.clip(self.sketch.quantiles(qs), self.min, self.max)
+
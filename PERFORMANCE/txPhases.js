@@ -0,0 +1,72 @@
+// Phases of one transaction, their durations add up to the total latency
+const PHASE_COLUMNS = ["Build (ms)", "Submit (ms)", "Pending (ms)", "Inclusion (ms)", "Receipt (ms)"];
+
+function elapsedMs(start) {
+    const elapsed = process.hrtime(start);
+    return elapsed[0] * 1000 + elapsed[1] / 1e6;
+}
+
+function sleep(ms) {
+    return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+async function watchTransaction(provider, hash, start, seen, pollInterval) {
+    // Local times at which the node first reports the transaction, and first reports it in a block
+    try {
+        while (!seen.done) {
+            const tx = await provider.getTransaction(hash);
+            if (seen.done) {
+                return;
+            }
+            const now = elapsedMs(start);
+            if (tx && seen.pending === null) {
+                seen.pending = now;
+            }
+            if (tx && tx.blockNumber !== null) {
+                seen.included = now;
+                return;
+            }
+            await sleep(pollInterval);
+        }
+    } catch (error) {
+        // Phases are best effort, the receipt and total latency do not depend on them
+    }
+}
+
+async function sendWithPhases(signer, buildRequest, pollInterval = 50) {
+    const provider = signer.provider;
+    // Same span as the total latency always measured: from building the call until tx.wait() returns
+    const start = process.hrtime();
+
+    // Build: encode the call and fill nonce, gas limit and fees
+    const request = await signer.populateTransaction(await buildRequest());
+    const built = elapsedMs(start);
+
+    // Submit: sign and get the eth_sendRawTransaction (or eth_sendTransaction) acknowledgement
+    const tx = await signer.sendTransaction(request);
+    const submitted = elapsedMs(start);
+
+    // Pending and inclusion are watched alongside tx.wait(), so watching never delays the receipt.
+    // Only local clocks are used, block timestamps have one-second resolution and drift on hardhat.
+    const seen = { pending: null, included: null, done: false };
+    const watcher = watchTransaction(provider, tx.hash, start, seen, pollInterval);
+    const receipt = await tx.wait();
+    const latency = elapsedMs(start);
+    seen.done = true;
+    await watcher;
+
+    // A stage the watcher did not catch before the receipt is counted in the stage after it
+    const included = Math.min(seen.included ?? latency, latency);
+    const pending = Math.min(Math.max(seen.pending ?? submitted, submitted), included);
+
+    const phases = {
+        build: built,
+        submit: submitted - built,
+        pending: pending - submitted,
+        inclusion: included - pending,
+        receipt: latency - included
+    };
+    return { receipt, latency, phases };
+}
+
+module.exports = { PHASE_COLUMNS, sendWithPhases };
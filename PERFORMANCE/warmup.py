@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+from batch_costs import grouping_keys
+
+METRICS = ['Gas', 'Fee (weis)', 'Latency (ms)']
+GROUP_COLUMNS = ['Operation', 'Blockchain', 'Category', 'Subcategory', 'DataType']
+PHASES = ['cold', 'warm']
+WARMUP_METHODS = ['auto', 'iteration', 'gas']
+
+# Samples costing this much more gas than the group median are first-touch (cold storage) writes
+GAS_CLUSTER_TOLERANCE = 0.05
+
+def iteration_index(df):
+    """Iteration of every sample, v1 rows are numbered in file order as a single run."""
+    position = df.groupby(grouping_keys(['Source', 'Operation', 'Blockchain'], df), observed=True).cumcount()
+    if 'Iteration' not in df.columns:
+        return position
+    return df['Iteration'].astype('Float64').fillna(position).astype(np.int64)
+
+def gas_clusters(df, tolerance=GAS_CLUSTER_TOLERANCE):
+    """Flag samples whose gas lies above the dominant (warm) level of their group."""
+    gas = pd.to_numeric(df['Gas'], errors='coerce').astype(np.float64)
+    # Larger batches cost more gas, a sweep mixing them would otherwise mark every large batch cold
+    keys = [df[column] for column in grouping_keys(['Source', 'Operation', 'Blockchain'], df)]
+    warm_level = gas.groupby(keys, observed=True).transform('median')
+    return gas > warm_level * (1 + tolerance)
+
+def classify_warmup(df, method='auto', warmup_iterations=1, tolerance=GAS_CLUSTER_TOLERANCE):
+    """Label every transaction sample as cold (first touch) or warm in a Phase column."""
+    df = df.copy()
+    transactions = df['DataType'] == 'Transaction'
+    tx = df[transactions]
+    by_iteration = iteration_index(tx) < warmup_iterations
+    by_gas = gas_clusters(tx, tolerance)
+    if method == 'iteration':
+        cold = by_iteration
+    elif method == 'gas':
+        cold = by_gas
+    else:
+        # Run-aware rows know their iteration, v1 rows only reveal cold writes through their gas
+        has_iteration = tx['Iteration'].notna() if 'Iteration' in tx.columns else pd.Series(False, index=tx.index)
+        cold = by_iteration.where(has_iteration, by_gas)
+    phase = pd.Series(pd.NA, index=df.index, dtype=pd.CategoricalDtype(PHASES))
+    phase[transactions] = np.where(cold.to_numpy(dtype=bool), 'cold', 'warm')
+    df['Phase'] = phase
+    return df
+
+def compute_phase_statistics(df):
+    """Statistics of the cold and warm regimes of every transaction group."""
+    tx = df[df['Phase'].notna()]
+    keys = grouping_keys(GROUP_COLUMNS, tx) + ['Phase']
+    results = []
+    for key, group in tx.groupby(keys, observed=True):
+        result = dict(zip(keys, key))
+        result['Source'] = f"{result['Category']}/{result['Subcategory']}"
+        result['Count'] = len(group)
+        for metric in METRICS:
+            values = group[metric].dropna().astype(np.float64)
+            result[f'{metric}_avg'] = values.mean()
+            result[f'{metric}_max'] = values.max()
+            result[f'{metric}_min'] = values.min()
+            result[f'{metric}_std'] = values.std()
+            result[f'{metric}_p50'] = values.median()
+        results.append(result)
+    return pd.DataFrame(results)
+
+def phase_columns(phase_stats):
+    """Wide per-group columns ({metric}_cold_avg, {metric}_warm_avg, Count_cold, Count_warm)."""
+    if phase_stats.empty:
+        return pd.DataFrame(columns=GROUP_COLUMNS)
+    values = [f'{metric}_avg' for metric in METRICS] + ['Count']
+    wide = phase_stats.pivot_table(index=grouping_keys(GROUP_COLUMNS, phase_stats), columns='Phase', values=values,
+                                   observed=True)
+    wide.columns = [f'Count_{phase}' if value == 'Count' else value.replace('_avg', f'_{phase}_avg')
+                    for value, phase in wide.columns]
+    wide = wide.reset_index()
+    for phase in PHASES:
+        if f'Count_{phase}' not in wide.columns:
+            wide[f'Count_{phase}'] = 0
+        wide[f'Count_{phase}'] = wide[f'Count_{phase}'].fillna(0).astype(np.int64)
+    return wide